@@ -0,0 +1,73 @@
+# benchmarks/cyk_vs_earley.py
+"""
+Compara el reconocimiento con Earley y con CYK (máscaras de bits) sobre la
+misma gramática Type 2.
+
+Uso:
+    python -m benchmarks.cyk_vs_earley [gramatica.json] [--count N] [--lengths 5,10,20]
+
+Las cadenas aceptadas se obtienen con grammar.sample(), las rechazadas
+cambiando un carácter de cada una; ambos motores deben coincidir.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from data.serializer import load_grammar
+
+
+def _mutate(strings: List[str], alphabet: List[str], rng: random.Random) -> List[str]:
+    """Cambia un carácter de cada cadena (casi siempre queda rechazada)"""
+    result = []
+    for s in strings:
+        if not s:
+            continue
+        i = rng.randrange(len(s))
+        result.append(s[:i] + rng.choice(alphabet) + s[i + 1:])
+    return result
+
+
+def _time(grammar, strings: List[str], engine: str) -> float:
+    start = time.perf_counter()
+    for s in strings:
+        grammar.accepts(s, engine=engine)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Earley vs CYK")
+    parser.add_argument("grammar", nargs="?", default="data/1.json")
+    parser.add_argument("--count", type=int, default=200, help="Cadenas por longitud")
+    parser.add_argument("--lengths", default="3,5,10,20,40")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grammar = load_grammar(args.grammar)
+    rng = random.Random(args.seed)
+    alphabet = [t for t in grammar.symbols.terminals if len(t) == 1]
+
+    # Las tablas se construyen fuera de la medición
+    grammar.compile("earley")
+    grammar.compile("cyk")
+    cnf = grammar.get_cnf()
+    print(f"{args.grammar}: Type {grammar.type}, CNF con {len(cnf)} no terminales, "
+          f"{cnf.n_binary} reglas binarias")
+    print(f"{'long':>5} {'cadenas':>8} {'earley (s)':>11} {'cyk (s)':>9} {'x':>6}")
+
+    for length in (int(x) for x in args.lengths.split(",")):
+        if grammar.count_strings(length) == 0:
+            continue
+        accepted = grammar.sample(length, k=args.count, seed=rng.randrange(1 << 30))
+        strings = accepted + _mutate(accepted, alphabet, rng)
+        for s in strings:
+            if grammar.accepts(s, engine="earley") != grammar.accepts(s, engine="cyk"):
+                raise SystemExit(f"Los motores no coinciden en {s!r}")
+
+        earley = _time(grammar, strings, "earley")
+        cyk = _time(grammar, strings, "cyk")
+        print(f"{length:>5} {len(strings):>8} {earley:>11.4f} {cyk:>9.4f} {earley / cyk:>6.1f}")
+
+
+if __name__ == "__main__":
+    main()
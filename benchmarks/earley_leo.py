@@ -0,0 +1,74 @@
+# benchmarks/earley_leo.py
+"""
+Tamaño del chart de Earley con y sin la optimización de Leo en gramáticas
+con recursión por la derecha (T → LT | DT en data/1.json).
+
+Uso:
+    python -m benchmarks.earley_leo [gramatica.json] [--lengths 1000,2000,5000,10000]
+                                    [--baseline-max 2000]
+
+Para cada longitud se parsea un identificador aleatorio (letra seguida de
+letras y dígitos) construyendo el bosque, como grammar.parse(). Sin Leo el
+chart crece de forma cuadrática, así que solo se mide hasta --baseline-max.
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from data.serializer import load_grammar
+from models.earley import EarleyParser
+
+
+def _identifier(length: int, letters: List[str], rest: List[str], rng: random.Random) -> str:
+    return rng.choice(letters) + "".join(rng.choice(rest) for _ in range(length - 1))
+
+
+def _measure(compiled, tokens, leo: bool):
+    start = time.perf_counter()
+    parser = EarleyParser(compiled, build_forest=True, leo=leo)
+    accepted, chart = parser.parse(tokens)
+    elapsed = time.perf_counter() - start
+    sizes = [len(column) for column in chart]
+    return accepted, sum(sizes), max(sizes), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chart de Earley con y sin Leo")
+    parser.add_argument("grammar", nargs="?", default="data/1.json")
+    parser.add_argument("--lengths", default="1000,2000,5000,10000")
+    parser.add_argument("--baseline-max", type=int, default=2000,
+                        help="Longitud máxima medida sin Leo")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grammar = load_grammar(args.grammar)
+    compiled = grammar.get_compiled()
+    rng = random.Random(args.seed)
+    # Letras y dígitos del alfabeto de la gramática
+    rest = sorted(t for t in grammar.symbols.terminals if len(t) == 1 and t.isalnum())
+    letters = [t for t in rest if t.isalpha()]
+    print(f"{'long':>6} {'motor':>6} {'items':>10} {'máx/col':>8} {'items/long':>10} {'tiempo (s)':>10}")
+
+    for length in (int(x) for x in args.lengths.split(",")):
+        text = _identifier(length, letters, rest, rng)
+        tokens = compiled.encode(text)
+        for leo in (True, False):
+            if not leo and length > args.baseline_max:
+                continue
+            accepted, total, widest, elapsed = _measure(compiled, tokens, leo)
+            if not accepted:
+                raise SystemExit(f"La gramática no acepta el identificador de longitud {length}")
+            print(f"{length:>6} {'leo' if leo else 'sin':>6} {total:>10} {widest:>8} "
+                  f"{total / length:>10.1f} {elapsed:>10.3f}")
+
+    # El info de grammar.parse() reporta el mismo chart
+    text = _identifier(int(args.lengths.split(",")[-1]), letters, rest, rng)
+    start = time.perf_counter()
+    accepted, info = grammar.parse(text)
+    print(f"grammar.parse({len(text)} caracteres): aceptada={accepted}, "
+          f"items={sum(info['chart_sizes'])}, {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
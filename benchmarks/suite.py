@@ -0,0 +1,358 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks de todos los motores de parseo y de la generación, con
+resultados en JSON para comparar corridas y detectar regresiones.
+
+Uso:
+    python -m benchmarks.suite [--output resultados.json] [--compare base.json]
+                               [--threshold 0.25] [--cases 1,anbncn,...]
+                               [--repeat 5] [--workers 4] [--quick]
+
+Casos: las gramáticas de data/ más familias sintéticas (cadenas largas de
+producciones unitarias, recursión por la derecha y por la izquierda,
+expresiones ambiguas y aⁿbⁿcⁿ sensible al contexto). Para cada caso se mide:
+
+  - parse_latency: parse() y accepts() por motor y longitud de entrada
+    (mediana y mínimo de --repeat corridas)
+  - batch_throughput: cadenas por segundo con parse_many (1 y --workers procesos)
+  - generation_rate: cadenas por segundo de generate_strings()
+  - peak_memory: pico de memoria (tracemalloc) de un parse de la entrada más
+    larga, en una corrida aparte para no distorsionar los tiempos
+
+Con --compare se contrasta cada medición con la de otra corrida (misma
+clave: caso, métrica, motor, operación, longitud...) y el código de salida
+es 1 si alguna empeoró más que --threshold.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from data.serializer import load_grammar
+from models.grammar import Grammar
+from models.search import SententialSearch
+
+# Métricas donde se compara "seconds" (el resto compara "bytes")
+TIMED = ('parse_latency', 'batch_throughput', 'generation_rate')
+
+
+class Case:
+    """Gramática a medir y cómo obtener entradas de cada longitud"""
+
+    def __init__(self, name: str, family: str, grammar: Grammar, lengths: List[int],
+                 make_input: Optional[Callable[[int, random.Random], Optional[str]]] = None):
+        """
+        Args:
+            name: Nombre del caso (clave en los resultados)
+            family: Origen: 'data' o el nombre de la familia sintética
+            grammar: Gramática
+            lengths: Longitudes de entrada a medir
+            make_input: Cadena aceptada de (aproximadamente) esa longitud; por
+                        defecto una muestra uniforme del lenguaje (Type 2/3)
+        """
+        self.name = name
+        self.family = family
+        self.grammar = grammar
+        self.lengths = lengths
+        self.make_input = make_input or self._sample
+
+    def _sample(self, length: int, rng: random.Random) -> Optional[str]:
+        if self.grammar.count_strings(length) == 0:
+            return None
+        return self.grammar.sample(length, seed=rng.randrange(1 << 30))[0]
+
+    def engines(self) -> List[str]:
+        """Motores que aplican al tipo de la gramática"""
+        if self.grammar.type == 3:
+            return ['default', 'nfa', 'earley', 'cyk']
+        if self.grammar.type == 2:
+            return ['default', 'earley-normalized', 'cyk']
+        return ['best-first', 'bfs', 'bidirectional']
+
+
+# ------------------ Familias sintéticas ------------------
+def _unit_chain(depth: int) -> Grammar:
+    """S → A₁ → A₂ → ... → A_depth → aS | a: cada terminal baja por toda la cadena"""
+    chain = [chr(0x100 + i) for i in range(depth)]
+    productions = {'S': [chain[0]]}
+    for current, nxt in zip(chain, chain[1:]):
+        productions[current] = [nxt]
+    productions[chain[-1]] = ['aS', 'a']
+    return Grammar({'S'} | set(chain), {'a'}, productions, 'S')
+
+
+def _cases(quick: bool) -> List[Case]:
+    scale = (lambda xs: xs[:2]) if quick else (lambda xs: xs)
+    cases = []
+    for path in sorted(glob.glob(os.path.join('data', '*.json'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        cases.append(Case(name, 'data', load_grammar(path), scale([10, 50, 200])))
+
+    right = Grammar({'S'}, {'a', 'b'}, {'S': ['aS', 'bS', 'a']}, 'S')
+    left = Grammar({'S'}, {'a', 'b'}, {'S': ['Sa', 'Sb', 'a']}, 'S')
+    # Recursión por la derecha fuera de la forma Type 3 (T → ab), para Earley/CYK
+    right_cf = Grammar({'S', 'T'}, {'a', 'b'}, {'S': ['aT', 'a'], 'T': ['bS', 'ab', 'b']}, 'S')
+    ambiguous = Grammar({'E'}, {'a', '+', '*'}, {'E': ['E+E', 'E*E', 'a']}, 'E')
+    anbncn = Grammar({'S', 'B', 'C'}, {'a', 'b', 'c'},
+                     {'S': ['aSBC', 'aBC'], 'CB': ['BC'], 'aB': ['ab'],
+                      'bB': ['bb'], 'bC': ['bc'], 'cC': ['cc']}, 'S')
+    cases += [
+        Case('unit-chain-25', 'unit-chain', _unit_chain(25), scale([10, 100, 400]),
+             lambda n, rng: 'a' * n),
+        Case('right-recursion', 'right-recursion', right, scale([100, 1000, 5000])),
+        Case('left-recursion', 'left-recursion', left, scale([100, 1000, 5000])),
+        Case('right-recursion-cf', 'right-recursion', right_cf, scale([100, 1000, 5000])),
+        Case('ambiguous-expr', 'ambiguous', ambiguous, scale([5, 11, 21]),
+             lambda n, rng: 'a' + ''.join(rng.choice('+*') + 'a' for _ in range(n // 2))),
+        Case('anbncn', 'context-sensitive', anbncn, scale([3, 6, 9]),
+             lambda n, rng: 'a' * (n // 3) + 'b' * (n // 3) + 'c' * (n // 3)),
+    ]
+    return cases
+
+
+# ------------------ Mediciones ------------------
+def _configure(grammar: Grammar, engine: str) -> Optional[str]:
+    """Prepara la gramática para el motor y devuelve el engine= de parse()"""
+    grammar.normalize(engine == 'earley-normalized')
+    search = engine in SententialSearch.STRATEGIES
+    grammar.configure_search(strategy=engine if search else 'best-first')
+    if search or engine in ('default', 'earley-normalized'):
+        return None
+    return engine
+
+
+def _time_call(call: Callable[[], object], repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _latency(case: Case, inputs: Dict[int, str], repeat: int, cyk_max: int) -> List[dict]:
+    grammar = case.grammar
+    records = []
+    for engine in case.engines():
+        parse_engine = _configure(grammar, engine)
+        grammar.compile(parse_engine)
+        for length, text in inputs.items():
+            if engine == 'cyk' and len(text) > cyk_max:
+                continue
+            accepted = grammar.accepts(text, engine=parse_engine)
+            for op in ('parse', 'accepts'):
+                call = getattr(grammar, op)
+                times = _time_call(lambda: call(text, engine=parse_engine), repeat)
+                records.append({
+                    "metric": "parse_latency", "engine": engine, "op": op,
+                    "length": len(text), "accepted": accepted,
+                    "seconds": statistics.median(times), "seconds_min": min(times),
+                    "repeat": repeat
+                })
+    _configure(grammar, 'default')
+    return records
+
+
+def _throughput(case: Case, rng: random.Random, workers: int, count: int) -> List[dict]:
+    grammar = case.grammar
+    length = case.lengths[0]
+    strings = [s for s in (case.make_input(length, rng) for _ in range(count)) if s is not None]
+    if not strings:
+        return []
+    records = []
+    for n_workers in sorted({1, workers}):
+        start = time.perf_counter()
+        for _ in grammar.parse_many(strings, workers=n_workers, details=False):
+            pass
+        elapsed = time.perf_counter() - start
+        records.append({
+            "metric": "batch_throughput", "engine": "default", "workers": n_workers,
+            "length": length, "strings": len(strings), "seconds": elapsed,
+            "strings_per_second": len(strings) / elapsed if elapsed > 0 else 0.0
+        })
+    return records
+
+
+def _generation(case: Case, n: int) -> List[dict]:
+    grammar = case.grammar
+    start = time.perf_counter()
+    strings = grammar.generate_strings(n)
+    elapsed = time.perf_counter() - start
+    return [{
+        "metric": "generation_rate", "engine": "default", "n": n,
+        "strings": len(strings), "seconds": elapsed,
+        "strings_per_second": len(strings) / elapsed if elapsed > 0 else 0.0
+    }]
+
+
+def _memory(case: Case, text: str, cyk_max: int) -> List[dict]:
+    grammar = case.grammar
+    records = []
+    for engine in case.engines():
+        if engine == 'cyk' and len(text) > cyk_max:
+            continue
+        parse_engine = _configure(grammar, engine)
+        grammar.compile(parse_engine)
+        tracemalloc.start()
+        try:
+            grammar.parse(text, engine=parse_engine)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        records.append({"metric": "peak_memory", "engine": engine, "op": "parse",
+                        "length": len(text), "bytes": peak})
+    _configure(grammar, 'default')
+    return records
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Corre los casos pedidos y devuelve el documento de resultados"""
+    selected = set(args.cases.split(',')) if args.cases else None
+    results = []
+    for case in _cases(args.quick):
+        if selected is not None and case.name not in selected:
+            continue
+        grammar = case.grammar
+        # Un generador por caso: las entradas no dependen de qué casos se corran
+        rng = random.Random(f"{args.seed}:{case.name}")
+        if args.max_steps:
+            grammar.configure_search(max_steps=args.max_steps)
+        inputs = {}
+        for length in case.lengths:
+            text = case.make_input(length, rng)
+            if text is not None:
+                inputs[length] = text
+
+        records = _latency(case, inputs, args.repeat, args.cyk_max)
+        records += _throughput(case, rng, args.workers, args.batch)
+        records += _generation(case, args.generate)
+        if inputs:
+            records += _memory(case, inputs[max(inputs)], args.cyk_max)
+        for record in records:
+            record["case"] = case.name
+            record["family"] = case.family
+            record["grammar_type"] = grammar.type
+        results += records
+        print(f"✓ {case.name} (Type {grammar.type}): {len(records)} mediciones", file=sys.stderr)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "quick": args.quick,
+            "max_search_steps": args.max_steps
+        },
+        "results": results
+    }
+
+
+# ------------------ Comparación ------------------
+def _key(record: dict) -> tuple:
+    return tuple(record.get(field) for field in
+                 ('case', 'metric', 'engine', 'op', 'length', 'workers', 'n'))
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """
+    Mediciones que empeoraron más que threshold (0.25 = 25 %) respecto de
+    baseline. Las latencias se comparan por su mínimo, que es lo menos
+    ruidoso; los tiempos menores a un milisegundo se ignoran.
+    """
+    previous = {_key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for record in current["results"]:
+        old = previous.get(_key(record))
+        if old is None:
+            continue
+        if record["metric"] == "parse_latency":
+            field = "seconds_min"
+        elif record["metric"] in TIMED:
+            field = "seconds"
+        else:
+            field = "bytes"
+        before, after = old.get(field), record.get(field)
+        if not before or after is None:
+            continue
+        if field != "bytes" and max(before, after) < 1e-3:
+            continue
+        change = after / before - 1
+        if change > threshold:
+            regressions.append({"key": _key(record), "field": field,
+                                "before": before, "after": after, "change": change})
+    return regressions
+
+
+def _print_summary(document: dict):
+    print(f"{'caso':<20} {'métrica':<17} {'motor':<18} {'op':<8} {'long':>6} {'valor':>14}")
+    for r in document["results"]:
+        if r["metric"] == "parse_latency":
+            value = f"{r['seconds'] * 1000:.3f} ms"
+        elif r["metric"] == "peak_memory":
+            value = f"{r['bytes'] / 1024:.1f} KiB"
+        else:
+            value = f"{r['strings_per_second']:.0f} /s"
+        label = r.get('op') or (f"w={r['workers']}" if 'workers' in r else f"n={r.get('n')}")
+        print(f"{r['case']:<20} {r['metric']:<17} {r['engine']:<18} {label:<8} "
+              f"{r.get('length', ''):>6} {value:>14}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de parseo y generación")
+    parser.add_argument("--output", "-o", default=None, help="Archivo JSON de resultados")
+    parser.add_argument("--compare", default=None, help="Resultados anteriores (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Empeoramiento tolerado al comparar (0.25 = 25 %%)")
+    parser.add_argument("--cases", default=None, help="Casos a correr, separados por comas")
+    parser.add_argument("--repeat", type=int, default=5, help="Corridas por medición de latencia")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Procesos para la medición de parse_many")
+    parser.add_argument("--batch", type=int, default=500, help="Cadenas por corrida de parse_many")
+    parser.add_argument("--generate", type=int, default=50, help="Cadenas a generar")
+    parser.add_argument("--cyk-max", type=int, default=200,
+                        help="Longitud máxima medida con CYK (cúbico)")
+    parser.add_argument("--max-steps", type=int, default=None,
+                        help="Máximo de formas expandidas en la búsqueda Type 0/1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="Solo las longitudes más cortas")
+    parser.add_argument("--quiet", action="store_true", help="Sin tabla resumen")
+    args = parser.parse_args(argv)
+
+    document = run(args)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=1, ensure_ascii=False)
+    elif args.quiet:
+        json.dump(document, sys.stdout, ensure_ascii=False)
+        print()
+    if not args.quiet:
+        _print_summary(document)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(document, baseline, args.threshold)
+        # El informe va a stderr: stdout puede llevar el JSON (--quiet)
+        for r in regressions:
+            print(f"✗ {' / '.join(str(k) for k in r['key'] if k is not None)}: "
+                  f"{r['field']} {r['before']:.6g} → {r['after']:.6g} (+{r['change']:.0%})",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✓ Sin regresiones respecto de {args.compare}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# cli.py
+"""
+Interfaz de línea de comandos sin interfaz gráfica (nunca importa tkinter).
+
+Uso:
+    python main.py check gramatica.json < entradas.txt
+    python -m cli check gramatica.json entradas1.txt entradas2.txt --jsonl
+"""
+import argparse
+import json
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from data.serializer import load_grammar
+from models.stats import result_outcome
+
+
+def read_lines(paths: List[str], stdin: TextIO) -> Iterator[str]:
+    """
+    Lee las cadenas a evaluar línea por línea, sin cargar los archivos en memoria.
+    Una línea con 'ε' representa la cadena vacía.
+    """
+    sources: Iterable = paths or ['-']
+    for path in sources:
+        stream = stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        try:
+            for line in stream:
+                line = line.rstrip('\r\n')
+                yield '' if line == 'ε' else line
+        finally:
+            if stream is not stdin:
+                stream.close()
+
+
+def check(args: argparse.Namespace, stdin: TextIO, stdout: TextIO) -> int:
+    """Evalúa cada línea de entrada y escribe un resultado por línea"""
+    grammar = load_grammar(args.grammar)
+    if args.normalize:
+        grammar.normalize()
+    grammar.configure_search(strategy=args.search, max_steps=args.max_steps)
+    # Las derivaciones solo se construyen si se van a escribir; en Type 0/1
+    # la información de la búsqueda distingue un corte por max_steps de un rechazo
+    details = (args.jsonl and args.derivations) or grammar.type < 2
+    if args.cache:
+        # Cada trabajador tiene su propia caché
+        grammar.enable_cache(max_entries=args.cache, accept_only=not details)
+    if args.stats:
+        grammar.enable_stats()
+
+    # Las cadenas en vuelo se guardan por índice hasta escribir su resultado,
+    # así la memoria queda acotada por los bloques pendientes de parse_many
+    pending = {}
+    inputs = _remember(read_lines(args.inputs, stdin), pending)
+
+    results = grammar.parse_many(inputs, workers=args.workers,
+                                 chunksize=args.chunksize, details=details,
+                                 engine=args.engine)
+
+    labels = {'accepted': 'ACCEPT', 'rejected': 'REJECT', 'budget_exhausted': 'TIMEOUT'}
+    rejected = 0
+    write = stdout.write
+    for index, accepted, info in results:
+        string = pending.pop(index)
+        outcome = result_outcome(accepted, info)
+        if not accepted:
+            rejected += 1
+        if args.jsonl:
+            record = {"index": index, "input": string, "accepted": accepted,
+                      "outcome": outcome}
+            if args.derivations and info:
+                record["derivations"] = list(info.get("derivations", []))
+            write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            # La cadena vacía se escribe como en la entrada: 'ε'
+            write(f"{labels[outcome]}\t{string or 'ε'}\n")
+
+    stdout.flush()
+    if args.stats:
+        # stderr: la salida estándar queda solo con los resultados
+        print(json.dumps(grammar.parse_stats().as_dict(), ensure_ascii=False),
+              file=sys.stderr)
+    return 1 if args.strict and rejected else 0
+
+
+def _remember(strings: Iterable[str], store: dict) -> Iterator[str]:
+    """Guarda cada cadena por índice mientras está en vuelo"""
+    for index, string in enumerate(strings):
+        store[index] = string
+        yield string
+
+
+class _IntermixedParser(argparse.ArgumentParser):
+    """
+    Subcomando que admite opciones entre los archivos de entrada
+    (check g.json --engine nfa entradas.txt). argparse no permite
+    parse_intermixed_args con subcomandos, así que cada subcomando lo
+    aplica al parsear su parte de la línea.
+    """
+
+    _intermixed = False
+
+    def parse_known_args(self, args=None, namespace=None):
+        # parse_known_intermixed_args vuelve a llamar a parse_known_args
+        if self._intermixed:
+            return super().parse_known_args(args, namespace)
+        self._intermixed = True
+        try:
+            return self.parse_known_intermixed_args(args, namespace)
+        finally:
+            self._intermixed = False
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="grammar-detector",
+        description="Analizador de gramáticas formales (modo sin interfaz gráfica)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True,
+                                     parser_class=_IntermixedParser)
+
+    check_cmd = commands.add_parser("check", help="Evalúa cadenas línea por línea")
+    check_cmd.add_argument("grammar", help="Archivo JSON de la gramática")
+    check_cmd.add_argument("inputs", nargs="*",
+                           help="Archivos de entrada (por defecto stdin, '-' = stdin)")
+    check_cmd.add_argument("--jsonl", action="store_true",
+                           help="Escribe un objeto JSON por línea")
+    check_cmd.add_argument("--derivations", action="store_true",
+                           help="Incluye la derivación en la salida JSONL")
+    check_cmd.add_argument("--workers", type=int, default=None,
+                           help="Procesos trabajadores (por defecto uno solo)")
+    check_cmd.add_argument("--chunksize", type=int, default=256,
+                           help="Cadenas por bloque enviado a cada trabajador")
+    check_cmd.add_argument("--normalize", action="store_true",
+                           help="Normaliza la gramática antes de parsear (Type 2)")
+    check_cmd.add_argument("--engine", choices=("earley", "cyk", "nfa"), default=None,
+                           help="Motor de parseo: earley/cyk (Type 2/3), nfa (Type 3); "
+                                "por defecto según el tipo")
+    check_cmd.add_argument("--search", choices=("best-first", "bfs", "bidirectional"), default=None,
+                           help="Búsqueda de derivaciones para Type 0/1 (por defecto best-first)")
+    check_cmd.add_argument("--max-steps", type=int, default=None,
+                           help="Formas sentenciales expandidas por cadena (Type 0/1)")
+    check_cmd.add_argument("--cache", type=int, default=0, metavar="N",
+                           help="Cachea hasta N resultados (entradas repetidas)")
+    check_cmd.add_argument("--stats", action="store_true",
+                           help="Escribe en stderr las estadísticas de los motores (JSON)")
+    check_cmd.add_argument("--strict", action="store_true",
+                           help="Código de salida 1 si alguna cadena no es aceptada "
+                                "(rechazo o TIMEOUT)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "check":
+            return check(args, sys.stdin, sys.stdout)
+    except BrokenPipeError:
+        # La salida se cerró (por ejemplo `| head`): no es un error
+        return 0
+    except (OSError, ValueError, KeyError) as e:
+        print(f"✗ Error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
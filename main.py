@@ -1,4 +1,10 @@
-from view.gui import run_gui
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Modo sin interfaz gráfica: no se importa tkinter
+        from cli import main
+        sys.exit(main())
+
+    from view.gui import run_gui
     run_gui()
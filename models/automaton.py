@@ -0,0 +1,447 @@
+# models/automaton.py
+from typing import Dict, List, Set, Tuple, Optional, FrozenSet
+
+
+class NFA:
+    """
+    Autómata finito no determinista construido a partir de una gramática regular.
+    Cada transición guarda la producción que la origina para poder reconstruir
+    la derivación de una cadena aceptada.
+    """
+
+    def __init__(self, labels: List[str], start: Set[int], accepting: Set[int],
+                 delta: List[Dict[str, List[Tuple[int, str]]]],
+                 eps_states: Set[int], final: int, reversed_: bool):
+        """
+        Args:
+            labels: Nombre de cada estado (no terminal o estado final)
+            start: Estados iniciales
+            accepting: Estados de aceptación
+            delta: delta[q][a] = [(destino, producción), ...]
+            eps_states: Estados cuyo no terminal tiene producción A → ε
+            final: Estado final artificial (destino de A → a)
+            reversed_: True si el autómata se obtuvo invirtiendo una gramática left-linear
+        """
+        self.labels = labels
+        self.start = start
+        self.accepting = accepting
+        self.delta = delta
+        self.eps_states = eps_states
+        self.final = final
+        self.reversed = reversed_
+
+    @staticmethod
+    def from_grammar(grammar) -> 'NFA':
+        """
+        Construye el NFA de una gramática Type 3.
+
+        Right-linear: A → aB es la transición A -a-> B, A → a va al estado final
+        y A → ε hace de A un estado de aceptación.
+        Left-linear: se construye el autómata del lenguaje inverso con las mismas
+        reglas (A → Ba como A -a-> B) y después se invierten las transiciones,
+        de modo que ambos estilos comparten el mismo motor.
+        """
+        nonterminals = sorted(grammar.symbols.nonterminals)
+        index = {nt: i for i, nt in enumerate(nonterminals)}
+        final = len(nonterminals)
+        labels = nonterminals + ['<final>']
+        edges: List[Tuple[int, str, int, str]] = []
+        eps_states: Set[int] = set()
+        left = grammar.grammar_style == 'left'
+
+        for prod in grammar.productions:
+            q = index[prod.left]
+            for right in prod.rights:
+                label = f"{prod.left} → {right}"
+                if right == 'ε':
+                    eps_states.add(q)
+                elif len(right) == 1:
+                    edges.append((q, right, final, label))
+                elif left:
+                    edges.append((q, right[1], index[right[0]], label))
+                else:
+                    edges.append((q, right[0], index[right[1]], label))
+
+        delta: List[Dict[str, List[Tuple[int, str]]]] = [{} for _ in labels]
+        start_state = index[grammar.S]
+        if left:
+            # Invertir: el lenguaje de la gramática es el inverso del autómata construido
+            for q, a, t, label in edges:
+                delta[t].setdefault(a, []).append((q, label))
+            start = {final} | eps_states
+            accepting = {start_state}
+        else:
+            for q, a, t, label in edges:
+                delta[q].setdefault(a, []).append((t, label))
+            start = {start_state}
+            accepting = {final} | eps_states
+
+        return NFA(labels, start, accepting, delta, eps_states, final, left)
+
+    def trace(self, string: str) -> Optional[List[str]]:
+        """
+        Reconstruye la secuencia de producciones para una cadena aceptada.
+        Recorre los conjuntos de estados por posición guardando un único padre
+        por estado, por lo que el costo es O(n · |N|).
+
+        Returns:
+            Lista de producciones en orden de derivación, o None si no se acepta
+        """
+        layers: List[Dict[int, Optional[Tuple[int, str]]]] = [{q: None for q in self.start}]
+        for ch in string:
+            current = layers[-1]
+            nxt: Dict[int, Optional[Tuple[int, str]]] = {}
+            for q in current:
+                for t, label in self.delta[q].get(ch, ()):
+                    if t not in nxt:
+                        nxt[t] = (q, label)
+            if not nxt:
+                return None
+            layers.append(nxt)
+
+        end = next((q for q in sorted(layers[-1]) if q in self.accepting), None)
+        if end is None:
+            return None
+
+        # Retroceder por los punteros al padre
+        steps: List[str] = []
+        q = end
+        for layer in reversed(layers):
+            parent = layer[q]
+            if parent is None:
+                break
+            q, label = parent
+            steps.append(label)
+
+        # q es ahora el estado inicial del recorrido y end el último
+        if self.reversed:
+            # La derivación left-linear empieza por S (el último estado)
+            if q != self.final:
+                steps.append(f"{self.labels[q]} → ε")
+        else:
+            steps.reverse()
+            if end != self.final:
+                steps.append(f"{self.labels[end]} → ε")
+        return steps
+
+
+class BitNFA:
+    """
+    Simulación bit-paralela de un NFA, sin construcción por subconjuntos.
+
+    El conjunto de estados activos es un entero con un bit por estado. Para cada
+    terminal y cada bloque de 8 estados con transiciones por ese terminal se
+    precalcula una tabla byte → máscara de destinos, así que cada carácter
+    avanza todo el conjunto con una búsqueda y un OR por bloque: O(n · |N| / 8).
+    La memoria es de a lo sumo 256 máscaras por (terminal, bloque) con
+    transiciones, lineal en el tamaño de la gramática.
+
+    Las tablas solo producen estados vivos (desde los que se llega a un estado
+    de aceptación), así que un conjunto vacío indica que ninguna continuación
+    de la entrada puede ser aceptada.
+    """
+
+    BLOCK = 8
+
+    def __init__(self, nfa: NFA):
+        """
+        Args:
+            nfa: Autómata de la gramática regular (ya invertido si es left-linear)
+        """
+        self.labels = nfa.labels
+        self.n_bytes = (len(nfa.labels) + self.BLOCK - 1) // self.BLOCK
+        self.live = self._live_mask(nfa)
+        # None si el lenguaje es vacío, como DFA.start
+        self.start: Optional[int] = self._mask(nfa.start) & self.live or None
+        self.accepting = self._mask(nfa.accepting)
+
+        # targets[a][q] = máscara de destinos vivos de q con el terminal a
+        targets: Dict[str, Dict[int, int]] = {}
+        for q, row in enumerate(nfa.delta):
+            if not self.live >> q & 1:
+                continue
+            for a, moves in row.items():
+                mask = self._mask(t for t, _ in moves) & self.live
+                if mask:
+                    targets.setdefault(a, {})[q] = mask
+
+        # tables[a] = [(bloque, tabla de 256 máscaras), ...]
+        self.tables: Dict[str, List[Tuple[int, List[int]]]] = {}
+        for a, by_state in targets.items():
+            blocks: Dict[int, List[int]] = {}
+            for q, mask in by_state.items():
+                blocks.setdefault(q // self.BLOCK, [0] * self.BLOCK)[q % self.BLOCK] = mask
+            rows = []
+            for b in sorted(blocks):
+                bits = blocks[b]
+                table = [0] * 256
+                for byte in range(1, 256):
+                    low = byte & -byte
+                    table[byte] = table[byte ^ low] | bits[low.bit_length() - 1]
+                rows.append((b, table))
+            self.tables[a] = rows
+
+    @staticmethod
+    def _live_mask(nfa: NFA) -> int:
+        """Estados co-alcanzables: desde ellos se llega a un estado de aceptación"""
+        parents: List[Set[int]] = [set() for _ in nfa.labels]
+        for q, row in enumerate(nfa.delta):
+            for moves in row.values():
+                for t, _ in moves:
+                    parents[t].add(q)
+        live = set(nfa.accepting)
+        stack = list(live)
+        while stack:
+            for q in parents[stack.pop()]:
+                if q not in live:
+                    live.add(q)
+                    stack.append(q)
+        return BitNFA._mask(live)
+
+    @staticmethod
+    def _mask(states) -> int:
+        mask = 0
+        for q in states:
+            mask |= 1 << q
+        return mask
+
+    def accepts(self, string: str) -> bool:
+        """Avanza el conjunto de estados activos carácter por carácter"""
+        active = self.start
+        if not active:
+            return False
+        tables = self.tables
+        n_bytes = self.n_bytes
+        for ch in string:
+            rows = tables.get(ch)
+            if rows is None:
+                return False
+            data = active.to_bytes(n_bytes, 'little')
+            active = 0
+            for b, table in rows:
+                byte = data[b]
+                if byte:
+                    active |= table[byte]
+            if not active:
+                return False
+        return bool(active & self.accepting)
+
+    def step(self, active: int, symbol: str) -> Optional[int]:
+        """Estados activos después de leer symbol (None si no queda ninguno)"""
+        rows = self.tables.get(symbol)
+        if rows is None:
+            return None
+        data = active.to_bytes(self.n_bytes, 'little')
+        result = 0
+        for b, table in rows:
+            byte = data[b]
+            if byte:
+                result |= table[byte]
+        return result or None
+
+    def advance(self, active: int, string: str) -> Tuple[Optional[int], int]:
+        """
+        Avanza con todo string de una vez.
+
+        Returns:
+            (estados activos, caracteres leídos); (None, i) si string[i] no
+            deja ningún estado vivo
+        """
+        tables = self.tables
+        n_bytes = self.n_bytes
+        for i, ch in enumerate(string):
+            rows = tables.get(ch)
+            if rows is None:
+                return None, i
+            data = active.to_bytes(n_bytes, 'little')
+            active = 0
+            for b, table in rows:
+                byte = data[b]
+                if byte:
+                    active |= table[byte]
+            if not active:
+                return None, i
+        return active, len(string)
+
+    def is_final(self, active: int) -> bool:
+        """Verifica si algún estado activo es de aceptación"""
+        return bool(active & self.accepting)
+
+
+class DFA:
+    """
+    Autómata finito determinista con estados numerados desde 0.
+    Las transiciones ausentes llevan al estado muerto implícito.
+    """
+
+    def __init__(self, start: Optional[int], accepting: Set[int],
+                 delta: List[Dict[str, int]], alphabet: Set[str]):
+        """
+        Args:
+            start: Estado inicial (None si el lenguaje es vacío)
+            accepting: Estados de aceptación
+            delta: delta[q] = {símbolo: destino}
+            alphabet: Alfabeto de entrada
+        """
+        self.start = start
+        self.accepting = accepting
+        self.delta = delta
+        self.alphabet = alphabet
+
+    def __len__(self) -> int:
+        return len(self.delta)
+
+    def accepts(self, string: str) -> bool:
+        """Recorre la tabla de transiciones: una búsqueda por símbolo"""
+        state = self.start
+        if state is None:
+            return False
+        delta = self.delta
+        for ch in string:
+            state = delta[state].get(ch)
+            if state is None:
+                return False
+        return state in self.accepting
+
+    def step(self, state: int, symbol: str) -> Optional[int]:
+        """Estado después de leer symbol (None = estado muerto)"""
+        return self.delta[state].get(symbol)
+
+    def advance(self, state: int, string: str) -> Tuple[Optional[int], int]:
+        """
+        Avanza con todo string de una vez.
+
+        Returns:
+            (estado, caracteres leídos); (None, i) si string[i] lleva al estado muerto
+        """
+        delta = self.delta
+        for i, ch in enumerate(string):
+            state = delta[state].get(ch)
+            if state is None:
+                return None, i
+        return state, len(string)
+
+    def is_final(self, state: int) -> bool:
+        """Verifica si el estado es de aceptación"""
+        return state in self.accepting
+
+    @staticmethod
+    def from_nfa(nfa: NFA, alphabet: Set[str], max_states: Optional[int] = None) -> 'DFA':
+        """
+        Construcción por subconjuntos (solo estados alcanzables).
+
+        Raises:
+            ValueError: Si se superan max_states subconjuntos
+        """
+        start = frozenset(nfa.start)
+        ids: Dict[FrozenSet[int], int] = {start: 0}
+        subsets: List[FrozenSet[int]] = [start]
+        delta: List[Dict[str, int]] = []
+        symbols = sorted(alphabet)
+
+        i = 0
+        while i < len(subsets):
+            subset = subsets[i]
+            row: Dict[str, int] = {}
+            for a in symbols:
+                target = set()
+                for q in subset:
+                    for t, _ in nfa.delta[q].get(a, ()):
+                        target.add(t)
+                if not target:
+                    continue
+                key = frozenset(target)
+                if key not in ids:
+                    if max_states is not None and len(subsets) >= max_states:
+                        raise ValueError(f"La construcción por subconjuntos excede {max_states} estados")
+                    ids[key] = len(subsets)
+                    subsets.append(key)
+                row[a] = ids[key]
+            delta.append(row)
+            i += 1
+
+        accepting = {ids[s] for s in subsets if s & nfa.accepting}
+        return DFA(0, accepting, delta, set(alphabet))
+
+    def minimize(self) -> 'DFA':
+        """
+        Minimiza el DFA con el algoritmo de Hopcroft.
+        Se completa con un estado sumidero; el bloque que lo contiene agrupa todos
+        los estados que no pueden llegar a aceptación y se elimina al final.
+        """
+        if self.start is None:
+            return self
+
+        n = len(self.delta)
+        sink = n
+        symbols = sorted(self.alphabet)
+
+        # Transiciones inversas sobre el DFA completo
+        inverse: Dict[str, List[List[int]]] = {a: [[] for _ in range(n + 1)] for a in symbols}
+        for q in range(n + 1):
+            row = self.delta[q] if q < n else {}
+            for a in symbols:
+                inverse[a][row.get(a, sink)].append(q)
+
+        accepting = set(self.accepting)
+        rejecting = set(range(n + 1)) - accepting
+        blocks: List[Set[int]] = [b for b in (accepting, rejecting) if b]
+        block_of = [0] * (n + 1)
+        for b, members in enumerate(blocks):
+            for q in members:
+                block_of[q] = b
+
+        waiting: Set[int] = {min(range(len(blocks)), key=lambda b: len(blocks[b]))}
+
+        while waiting:
+            splitter = list(blocks[waiting.pop()])
+            for a in symbols:
+                inv = inverse[a]
+                # Agrupar por bloque los estados que entran al divisor con 'a'
+                touched: Dict[int, Set[int]] = {}
+                for t in splitter:
+                    for q in inv[t]:
+                        touched.setdefault(block_of[q], set()).add(q)
+
+                for b, inside in touched.items():
+                    members = blocks[b]
+                    if len(inside) == len(members):
+                        continue
+                    outside = members - inside
+                    new_b = len(blocks)
+                    # El bloque original conserva la parte grande
+                    if len(inside) <= len(outside):
+                        blocks[b], moved = outside, inside
+                    else:
+                        blocks[b], moved = inside, outside
+                    blocks.append(moved)
+                    for q in moved:
+                        block_of[q] = new_b
+                    # Si b ya estaba pendiente hay que procesar ambas partes;
+                    # si no, basta con la menor, que es la que se movió
+                    waiting.add(new_b)
+
+        dead = block_of[sink]
+        start_block = block_of[self.start]
+        if start_block == dead:
+            return DFA(None, set(), [], set(self.alphabet))
+
+        # Renumerar en orden BFS desde el estado inicial
+        order = {start_block: 0}
+        queue = [start_block]
+        delta: List[Dict[str, int]] = []
+        for b in queue:
+            rep = next(iter(blocks[b]))
+            row: Dict[str, int] = {}
+            for a, t in self.delta[rep].items():
+                tb = block_of[t]
+                if tb == dead:
+                    continue
+                if tb not in order:
+                    order[tb] = len(queue)
+                    queue.append(tb)
+                row[a] = order[tb]
+            delta.append(row)
+
+        accepting_min = {order[b] for b in order if next(iter(blocks[b])) in accepting}
+        return DFA(0, accepting_min, delta, set(self.alphabet))
@@ -0,0 +1,133 @@
+# models/batch.py
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from models.stats import ParseStats
+
+# Gramática del proceso trabajador (se recibe una sola vez en el initializer)
+_worker_grammar = None
+_worker_details = True
+_worker_engine: Optional[str] = None
+
+Result = Tuple[int, bool, Optional[dict]]
+
+
+def _init_worker(grammar, details: bool, engine: Optional[str]):
+    """Inicializa el proceso trabajador con la gramática ya compilada"""
+    global _worker_grammar, _worker_details, _worker_engine
+    _worker_grammar = grammar
+    _worker_details = details
+    _worker_engine = engine
+
+
+def _parse_chunk(chunk: List[Tuple[int, str]]) -> Tuple[List[Result], Optional[ParseStats]]:
+    """
+    Parsea un bloque de cadenas dentro del proceso trabajador. Si la
+    gramática tiene estadísticas activas, devuelve también las del bloque.
+    """
+    results = _run_chunk(_worker_grammar, chunk, _worker_details, _worker_engine)
+    collector = _worker_grammar._stats
+    if collector is None:
+        return results, None
+    stats = collector.total
+    collector.reset()
+    return results, stats
+
+
+def _run_chunk(grammar, chunk: List[Tuple[int, str]], details: bool,
+               engine: Optional[str] = None) -> List[Result]:
+    """Aplica parse() (o accepts() si no se piden detalles) a cada cadena del bloque"""
+    if details:
+        return [(i,) + grammar.parse(s, engine=engine) for i, s in chunk]
+    return [(i, grammar.accepts(s, engine=engine), None) for i, s in chunk]
+
+
+def _chunks(strings: Iterable[str], chunksize: int) -> Iterator[List[Tuple[int, str]]]:
+    """Divide la entrada en bloques de (índice, cadena) sin materializarla"""
+    it = enumerate(strings)
+    while True:
+        chunk = list(islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_many(grammar, strings: Iterable[str], workers: Optional[int] = None,
+               chunksize: int = 256, ordered: bool = True,
+               details: bool = True, engine: Optional[str] = None) -> Iterator[Result]:
+    """
+    Parsea muchas cadenas con la misma gramática.
+
+    Con workers > 1 se usa un pool de procesos: la gramática compilada se envía
+    una vez a cada trabajador y las cadenas viajan en bloques de `chunksize`.
+    Solo hay un número acotado de bloques en vuelo, así que la entrada puede ser
+    un generador de longitud arbitraria.
+
+    Args:
+        grammar: Gramática a usar
+        strings: Iterable de cadenas
+        workers: Número de procesos (None o 1 = un solo proceso)
+        chunksize: Cadenas por bloque enviado a un trabajador
+        ordered: True para producir los resultados en el orden de entrada,
+                 False para producirlos según terminan
+        details: False para devolver solo el bit de aceptación (info = None)
+        engine: Motor de parseo (ver Grammar.parse); None = el del tipo de gramática
+
+    Yields:
+        (index, accepted, info)
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize debe ser al menos 1")
+
+    # Compilar antes de repartir para que los trabajadores no repitan el trabajo
+    grammar.compile(engine)
+
+    if not workers or workers <= 1:
+        for chunk in _chunks(strings, chunksize):
+            yield from _run_chunk(grammar, chunk, details, engine)
+        return
+
+    # Import diferido: el camino de un solo proceso no paga el costo de multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(grammar, details, engine)) as pool:
+        chunks = _chunks(strings, chunksize)
+        pending = {}
+        # Resultados terminados fuera de orden, por número de bloque
+        done_chunks = {}
+        next_chunk = 0
+        submitted = 0
+
+        def submit_more():
+            nonlocal submitted
+            # En modo ordenado también cuentan los bloques terminados que esperan
+            # a uno anterior, para que la memoria quede acotada
+            while (submitted - next_chunk if ordered else len(pending)) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                pending[pool.submit(_parse_chunk, chunk)] = submitted
+                submitted += 1
+
+        submit_more()
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                number = pending.pop(future)
+                results, stats = future.result()
+                if stats is not None:
+                    # Las llamadas de los trabajadores suman al total (sin el gancho)
+                    grammar._stats.total.merge(stats)
+                if ordered:
+                    done_chunks[number] = results
+                else:
+                    yield from results
+
+            if ordered:
+                while next_chunk in done_chunks:
+                    yield from done_chunks.pop(next_chunk)
+                    next_chunk += 1
+
+            submit_more()
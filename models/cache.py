@@ -0,0 +1,121 @@
+# models/cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ParseCache:
+    """
+    Caché LRU acotada (con vencimiento opcional) de resultados de parseo.
+
+    Cada valor es el bit de aceptación (bool) o el resultado completo de
+    parse() (accepted, info). Las claves incluyen la huella de la gramática (Grammar.fingerprint), así
+    que una misma caché se puede compartir entre gramáticas. Con accept_only
+    solo se guarda el bit de aceptación, que es lo único que necesita
+    accepts() y ocupa mucho menos que el árbol y el chart de parse().
+
+    Al enviarse a otro proceso (parse_many con workers) viaja solo la
+    configuración: cada trabajador empieza con la caché vacía.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = None,
+                 accept_only: bool = False):
+        """
+        Args:
+            max_entries: Cantidad máxima de entradas (se descarta la menos usada)
+            ttl: Segundos de validez de cada entrada (None = sin vencimiento)
+            accept_only: True para guardar solo el bit de aceptación
+        """
+        if max_entries < 1:
+            raise ValueError("La caché debe admitir al menos una entrada")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("El tiempo de vida de la caché debe ser positivo")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.accept_only = accept_only
+        # clave -> (valor, vencimiento o None)
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        return {"max_entries": self.max_entries, "ttl": self.ttl,
+                "accept_only": self.accept_only}
+
+    def __setstate__(self, state: dict):
+        self.__init__(**state)
+
+    def get(self, key: Hashable, full: bool = False) -> Optional[Any]:
+        """
+        Valor guardado para key.
+        
+        Args:
+            key: Clave de la consulta
+            full: True si solo sirve el resultado completo de parse() (una
+                  entrada con solo el bit de aceptación cuenta como fallo)
+        
+        Returns:
+            El valor, o None si no está, ya venció o no alcanza
+        """
+        entry = self._entries.get(key)
+        if entry is None or (full and not isinstance(entry[0], tuple)):
+            self.misses += 1
+            return None
+        value, expires = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Guarda value como el más reciente, descartando el menos usado si no hay lugar"""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        entries = self._entries
+        entries[key] = (value, expires)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)"""
+        self._entries.clear()
+
+    def discard(self, fingerprint: str) -> int:
+        """
+        Descarta las entradas de una gramática: las claves cuyo primer
+        elemento es su huella. Las de otras gramáticas que comparten la caché
+        se conservan.
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        stale = [key for key in self._entries
+                 if isinstance(key, tuple) and key and key[0] == fingerprint]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de uso"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "accept_only": self.accept_only,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -0,0 +1,158 @@
+# models/cnf.py
+from typing import Dict, List, Set, Tuple
+
+from models.compiled_grammar import CompiledGrammar
+
+
+class CNFGrammar:
+    """
+    Forma normal de Chomsky de una gramática libre de contexto, preparada para
+    CYK con máscaras de bits (un bit por no terminal de la CNF).
+
+    Conversión a partir de la gramática compilada:
+      1. TERM: los terminales de reglas largas se envuelven en T_a → a.
+      2. BIN: A → X0 X1 ... Xk-1 se parte en A → X0 N1, N1 → X1 N2, ...,
+         N(k-2) → X(k-2) X(k-1). Cada N(r, d) representa las posiciones d..k-1
+         de la regla r, lo que permite reconstruir árboles originales.
+      3. DEL: con reglas binarias, quitar los anulables da a lo sumo una regla
+         unitaria extra por lado (sin explosión exponencial).
+      4. UNIT: las reglas unitarias no se copian; su clausura se pliega en las
+         tablas: term_mask[a] y pair[B][C] ya incluyen todo A con A ⇒* lhs.
+
+    La cadena vacía no se representa: se acepta si S es anulable.
+    """
+
+    # Pares de máscaras memoizados por combine() antes de vaciar el memo
+    COMBINE_MEMO_LIMIT = 1 << 16
+
+    def __init__(self, compiled: CompiledGrammar):
+        """
+        Args:
+            compiled: Gramática precompilada (Type 2/3)
+        """
+        self.compiled = compiled
+        n_nt = compiled.n_nonterminals
+        # Ids de la CNF: [0, n_nt) son los no terminales originales
+        self.names: List[str] = list(compiled.symbols[:n_nt])
+        self.start = compiled.start
+        self.wrappers: Dict[int, int] = {}                  # terminal -> T_a
+        self.segments: Dict[Tuple[int, int], int] = {}      # (regla, d) -> N(r, d)
+
+        binary: List[Tuple[int, int, int]] = []
+        units: List[Tuple[int, int]] = []
+        terminal: List[Tuple[int, int]] = []
+
+        for r, (lhs, rhs) in enumerate(compiled.rules):
+            k = len(rhs)
+            if k == 0:
+                continue
+            if k == 1:
+                if rhs[0] >= n_nt:
+                    terminal.append((lhs, rhs[0]))
+                else:
+                    units.append((lhs, rhs[0]))
+                continue
+            syms = [self._wrap(sym, terminal) for sym in rhs]
+            prev = lhs
+            for d in range(1, k - 1):
+                seg = self._new_symbol(f"<{compiled.rule_labels[r]} #{d}>")
+                self.segments[(r, d)] = seg
+                binary.append((prev, syms[d - 1], seg))
+                prev = seg
+            binary.append((prev, syms[k - 2], syms[k - 1]))
+
+        # Anulables de la CNF: originales y segmentos cuyas posiciones lo son
+        self.nullable: Set[int] = set(compiled.nullable)
+        for (r, d), seg in self.segments.items():
+            if all(sym in compiled.nullable for sym in compiled.rules[r][1][d:]):
+                self.nullable.add(seg)
+
+        # DEL sobre reglas binarias
+        for lhs, left, right in binary:
+            if right in self.nullable:
+                units.append((lhs, left))
+            if left in self.nullable:
+                units.append((lhs, right))
+
+        # UNIT: up[X] = máscara de todos los A con A ⇒* X por reglas unitarias
+        n = len(self.names)
+        parents: List[List[int]] = [[] for _ in range(n)]
+        for lhs, target in units:
+            parents[target].append(lhs)
+        self.up: List[int] = []
+        for x in range(n):
+            mask = 1 << x
+            stack = [x]
+            while stack:
+                for a in parents[stack.pop()]:
+                    if not mask >> a & 1:
+                        mask |= 1 << a
+                        stack.append(a)
+            self.up.append(mask)
+
+        # Tablas de CYK con la clausura unitaria ya aplicada
+        self.term_mask: Dict[int, int] = {}
+        for lhs, t in terminal:
+            self.term_mask[t] = self.term_mask.get(t, 0) | self.up[lhs]
+        self.pair: List[Dict[int, int]] = [{} for _ in range(n)]
+        self.right_any: List[int] = [0] * n
+        for lhs, left, right in binary:
+            row = self.pair[left]
+            row[right] = row.get(right, 0) | self.up[lhs]
+            self.right_any[left] |= 1 << right
+
+        self.n_binary = len(binary)
+        self.n_terminal = len(terminal)
+        # Memo de combine(), compartido por todas las cadenas que se parsean
+        # (acotado por COMBINE_MEMO_LIMIT: la CNF vive tanto como la gramática)
+        self._combined: Dict[Tuple[int, int], int] = {}
+
+    def _new_symbol(self, name: str) -> int:
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def _wrap(self, sym: int, terminal: List[Tuple[int, int]]) -> int:
+        """No terminal de la CNF para un símbolo del lado derecho"""
+        if sym < self.compiled.n_nonterminals:
+            return sym
+        wrapper = self.wrappers.get(sym)
+        if wrapper is None:
+            wrapper = self._new_symbol(f"<{self.compiled.symbols[sym]}>")
+            self.wrappers[sym] = wrapper
+            terminal.append((wrapper, sym))
+        return wrapper
+
+    def __len__(self) -> int:
+        """Cantidad de no terminales de la CNF"""
+        return len(self.names)
+
+    def combine(self, left: int, right: int) -> int:
+        """Máscara de los A con A → BC, B ∈ left, C ∈ right (clausura incluida)"""
+        key = (left, right)
+        combined = self._combined
+        result = combined.get(key)
+        if result is None:
+            result = self._combine(left, right)
+            if len(combined) >= self.COMBINE_MEMO_LIMIT:
+                # Vaciarlo es más barato que un LRU en el ciclo interno de CYK
+                # y los pares frecuentes vuelven a entrar enseguida
+                combined.clear()
+            combined[key] = result
+        return result
+
+    def _combine(self, left: int, right: int) -> int:
+        result = 0
+        pair = self.pair
+        right_any = self.right_any
+        while left:
+            low = left & -left
+            b = low.bit_length() - 1
+            left ^= low
+            matches = right & right_any[b]
+            if matches:
+                row = pair[b]
+                while matches:
+                    low_c = matches & -matches
+                    matches ^= low_c
+                    result |= row[low_c.bit_length() - 1]
+        return result
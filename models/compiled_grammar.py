@@ -0,0 +1,166 @@
+# models/compiled_grammar.py
+from typing import Dict, List, Set, Tuple
+
+
+class CompiledGrammar:
+    """
+    Representación precompilada de una gramática para los parsers.
+
+    Se construye una sola vez por gramática: asigna a cada símbolo un entero
+    (primero los no terminales, luego los terminales), guarda los lados derechos
+    como tuplas de enteros y precalcula las alternativas de cada no terminal,
+    el conjunto de anulables, los conjuntos FIRST y las máscaras de bits de
+    terminales/no terminales.
+    """
+
+    def __init__(self, grammar):
+        """
+        Args:
+            grammar: Instancia de Grammar a compilar
+        """
+        nonterminals = sorted(grammar.symbols.nonterminals)
+        terminals = sorted(grammar.symbols.terminals)
+
+        # Tabla de símbolos: ids [0, n_nonterminals) son no terminales
+        self.symbols: List[str] = nonterminals + terminals
+        self.ids: Dict[str, int] = {sym: i for i, sym in enumerate(self.symbols)}
+        self.n_nonterminals = len(nonterminals)
+        self.nonterminal_mask = (1 << len(nonterminals)) - 1
+        self.terminal_mask = ((1 << len(self.symbols)) - 1) ^ self.nonterminal_mask
+        self.start = self.ids[grammar.S]
+
+        # Reglas libres de contexto: rule_id -> (lhs, rhs)
+        self.rules: List[Tuple[int, Tuple[int, ...]]] = []
+        self.rule_labels: List[str] = []
+        self.alternatives: List[List[int]] = [[] for _ in nonterminals]
+
+        # Reglas de reescritura (Type 0/1): (left, [(reemplazo sin ε, right original)])
+        self.rewrites: List[Tuple[str, List[Tuple[str, str]]]] = [
+            (prod.left, [('' if right == 'ε' else right, right) for right in prod.rights])
+            for prod in grammar.productions
+        ]
+
+        if grammar.type >= 2:
+            for prod in grammar.productions:
+                lhs = self.ids[prod.left]
+                for right in prod.rights:
+                    rhs = tuple() if right == 'ε' else tuple(self.ids[c] for c in right)
+                    self.alternatives[lhs].append(len(self.rules))
+                    self.rules.append((lhs, rhs))
+                    self.rule_labels.append(f"{prod.left} → {right}")
+
+        # nullable_rule[A] = regla con la que A deriva ε sin ciclos (árbol ε canónico)
+        self.nullable_rule: Dict[int, int] = {}
+        self.nullable: Set[int] = self._compute_nullable()
+        self.nullable_mask = 0
+        for sym in self.nullable:
+            self.nullable_mask |= 1 << sym
+        self._compute_first()
+
+    def _compute_nullable(self) -> Set[int]:
+        """Punto fijo: A es anulable si alguna alternativa consta solo de anulables"""
+        nullable: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for rule, (lhs, rhs) in enumerate(self.rules):
+                if lhs not in nullable and all(sym in nullable for sym in rhs):
+                    nullable.add(lhs)
+                    # Los símbolos de rhs ya eran anulables: el árbol ε no tiene ciclos
+                    self.nullable_rule[lhs] = rule
+                    changed = True
+        return nullable
+
+    def _compute_first(self):
+        """
+        FIRST como máscaras de bits de ids de terminales.
+
+        first[A]: terminales con que empieza alguna cadena no vacía derivada de A.
+        item_first[r][d]: FIRST de rhs[d:], con el bit end_bit si rhs[d:] es
+        anulable (el item puede completarse sin leer más). Earley lo usa para
+        descartar items que no pueden avanzar con el siguiente token.
+        """
+        self.end_bit = 1 << len(self.symbols)
+        n_nt = self.n_nonterminals
+        first = [0] * n_nt
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.rules:
+                mask = first[lhs] | self._sequence_first(rhs, first)
+                if mask != first[lhs]:
+                    first[lhs] = mask
+                    changed = True
+        self.first: List[int] = first
+
+        self.item_first: List[List[int]] = []
+        for _, rhs in self.rules:
+            masks = [self.end_bit]
+            for sym in reversed(rhs):
+                if sym >= n_nt:
+                    masks.append(1 << sym)
+                elif sym in self.nullable:
+                    masks.append(first[sym] | masks[-1])
+                else:
+                    masks.append(first[sym])
+            masks.reverse()
+            self.item_first.append(masks)
+
+    def _sequence_first(self, rhs: Tuple[int, ...], first: List[int]) -> int:
+        """FIRST de una secuencia de símbolos (sin el bit de anulable)"""
+        mask = 0
+        for sym in rhs:
+            if sym >= self.n_nonterminals:
+                return mask | 1 << sym
+            mask |= first[sym]
+            if sym not in self.nullable:
+                break
+        return mask
+
+    def compute_follow(self) -> List[int]:
+        """
+        FOLLOW de cada no terminal como máscara de ids de terminales; end_bit
+        representa el fin de la entrada ($).
+        """
+        n_nt = self.n_nonterminals
+        end_bit = self.end_bit
+        follow = [0] * n_nt
+        follow[self.start] = end_bit
+        changed = True
+        while changed:
+            changed = False
+            for rule, (lhs, rhs) in enumerate(self.rules):
+                for d, sym in enumerate(rhs):
+                    if sym >= n_nt:
+                        continue
+                    rest = self.item_first[rule][d + 1]
+                    mask = follow[sym] | (rest & ~end_bit)
+                    if rest & end_bit:
+                        mask |= follow[lhs]
+                    if mask != follow[sym]:
+                        follow[sym] = mask
+                        changed = True
+        return follow
+
+    def is_nonterminal(self, sym: int) -> bool:
+        """Verifica si un id corresponde a un no terminal"""
+        return sym < self.n_nonterminals
+
+    def encode(self, string: str) -> List[int]:
+        """
+        Convierte una cadena de entrada a ids de terminales.
+        Los caracteres que no son terminales se codifican como -1 y nunca
+        coinciden con ninguna regla.
+        """
+        ids = self.ids
+        n_nt = self.n_nonterminals
+        result = []
+        for ch in string:
+            sym = ids.get(ch, -1)
+            result.append(sym if sym >= n_nt else -1)
+        return result
+
+    def rhs_string(self, rule: int) -> str:
+        """Lado derecho legible de una regla (ε si es vacío)"""
+        rhs = self.rules[rule][1]
+        return "".join(self.symbols[s] for s in rhs) if rhs else "ε"
@@ -0,0 +1,214 @@
+# models/cyk.py
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.cnf import CNFGrammar
+from models.forest import ParseTree
+
+# Elección para un no terminal sobre un tramo: (regla original, fronteras de sus hijos)
+Choice = Tuple[int, List[int]]
+
+
+class CYKParser:
+    """
+    Reconocedor CYK sobre una CNFGrammar con un entero por celda: el bit X de
+    cells[i][j] indica que el no terminal X de la CNF deriva tokens[i:j].
+
+    La combinación de dos celdas se memoiza por par de máscaras (en la CNF, así
+    que el memo sirve para todas las cadenas, con tamaño acotado), y solo se prueban los puntos de
+    corte k con ambas mitades no vacías (ends[i] & starts[j]), así que las
+    tablas dispersas cuestan poco.
+
+    tree() reconstruye un árbol sobre las producciones originales usando la
+    tabla como oráculo; los segmentos N(r, d) de la CNF dicen qué sufijos de
+    cada regla derivan qué tramos.
+    """
+
+    def __init__(self, cnf: CNFGrammar):
+        """
+        Args:
+            cnf: Gramática en forma normal de Chomsky
+        """
+        self.cnf = cnf
+        self.compiled = cnf.compiled
+        self.cells: List[List[int]] = []
+        self.tokens: List[int] = []
+        self._choices: Dict[Tuple[int, int], Dict[int, Choice]] = {}
+
+    def parse(self, tokens: List[int]) -> bool:
+        """Llena la tabla y verifica si S deriva la entrada completa"""
+        self.tokens = tokens
+        self._choices = {}
+        n = len(tokens)
+        cnf = self.cnf
+        if n == 0:
+            self.cells = []
+            return cnf.start in cnf.nullable
+
+        cells = [[0] * (n + 1) for _ in range(n + 1)]
+        self.cells = cells
+        ends = [0] * (n + 1)      # ends[i]: bits j con cells[i][j] no vacía
+        starts = [0] * (n + 1)    # starts[j]: bits i con cells[i][j] no vacía
+        term_mask = cnf.term_mask
+        for i, t in enumerate(tokens):
+            mask = term_mask.get(t, 0)
+            if not mask:
+                # Ningún no terminal produce este carácter: rechazo temprano
+                return False
+            cells[i][i + 1] = mask
+            ends[i] |= 1 << (i + 1)
+            starts[i + 1] |= 1 << i
+
+        combine = cnf.combine
+        for length in range(2, n + 1):
+            for i in range(n - length + 1):
+                j = i + length
+                row = cells[i]
+                cuts = ends[i] & starts[j]
+                mask = 0
+                while cuts:
+                    low = cuts & -cuts
+                    cuts ^= low
+                    k = low.bit_length() - 1
+                    mask |= combine(row[k], cells[k][j])
+                if mask:
+                    row[j] = mask
+                    ends[i] |= 1 << j
+                    starts[j] |= 1 << i
+
+        return bool(cells[0][n] >> cnf.start & 1)
+
+    def filled_cells(self) -> int:
+        """Cantidad de celdas no vacías de la última tabla"""
+        return sum(1 for row in self.cells for mask in row if mask)
+
+    # ------------------ Árbol sobre la gramática original ------------------
+    def tree(self) -> Optional[ParseTree]:
+        """Árbol de derivación de la última entrada aceptada (None si no hay)"""
+        compiled = self.compiled
+        n = len(self.tokens)
+        start = compiled.start
+        tree = ParseTree()
+        if n == 0:
+            if start not in compiled.nullable:
+                return None
+            self._add_epsilon(tree, start, 0)
+            return tree
+        if not self.cells or not self.cells[0][n] >> start & 1:
+            return None
+
+        names = compiled.symbols
+        labels = compiled.rule_labels
+        rules = compiled.rules
+        n_nt = compiled.n_nonterminals
+        rule, bounds = self._choose(start, 0, n)
+        root = tree.add_node(names[start], labels[rule], 0, n)
+        stack = [(root, rule, bounds)]
+        while stack:
+            node, rule, bounds = stack.pop()
+            kids = []
+            for d, sym in enumerate(rules[rule][1]):
+                s, e = bounds[d], bounds[d + 1]
+                if sym >= n_nt:
+                    kids.append(tree.add_node(names[sym], None, s, e))
+                elif s == e:
+                    kids.append(self._add_epsilon(tree, sym, s))
+                else:
+                    sub_rule, sub_bounds = self._choose(sym, s, e)
+                    child = tree.add_node(names[sym], labels[sub_rule], s, e)
+                    stack.append((child, sub_rule, sub_bounds))
+                    kids.append(child)
+            tree.children[node] = kids
+        return tree
+
+    def _derives(self, sym: int, i: int, j: int) -> bool:
+        """Verifica si el símbolo original sym deriva tokens[i:j]"""
+        compiled = self.compiled
+        if sym >= compiled.n_nonterminals:
+            return j == i + 1 and self.tokens[i] == sym
+        if i == j:
+            return sym in compiled.nullable
+        return bool(self.cells[i][j] >> sym & 1)
+
+    def _rest(self, rule: int, d: int, i: int, j: int) -> bool:
+        """Verifica si las posiciones d.. de la regla derivan tokens[i:j]"""
+        rhs = self.compiled.rules[rule][1]
+        k = len(rhs)
+        if d == k:
+            return i == j
+        if d == k - 1:
+            return self._derives(rhs[d], i, j)
+        if i == j:
+            return all(sym in self.compiled.nullable for sym in rhs[d:])
+        return bool(self.cells[i][j] >> self.cnf.segments[(rule, d)] & 1)
+
+    def _splits(self, rule: int, i: int, j: int) -> Iterator[List[int]]:
+        """Fronteras [i, ..., j] de los hijos, solo por caminos que llegan a j"""
+        rhs = self.compiled.rules[rule][1]
+
+        def walk(d: int, m: int, bounds: List[int]) -> Iterator[List[int]]:
+            if d == len(rhs):
+                if m == j:
+                    yield bounds + [j]
+                return
+            for m2 in range(m, j + 1):
+                if self._derives(rhs[d], m, m2) and self._rest(rule, d + 1, m2, j):
+                    yield from walk(d + 1, m2, bounds + [m])
+
+        return walk(0, i, [])
+
+    def _choose(self, symbol: int, i: int, j: int) -> Choice:
+        """
+        Regla y cortes para symbol sobre [i, j). Se calculan juntos para todos
+        los no terminales del tramo: primero los que tienen una regla "propia"
+        (ningún hijo cubre todo el tramo) y luego, por niveles, los que llegan a
+        ellos por reglas unitarias; así el árbol nunca entra en un ciclo.
+        """
+        key = (i, j)
+        choices = self._choices.get(key)
+        if choices is None:
+            choices = self._span_choices(i, j)
+            self._choices[key] = choices
+        return choices[symbol]
+
+    def _span_choices(self, i: int, j: int) -> Dict[int, Choice]:
+        compiled = self.compiled
+        n_nt = compiled.n_nonterminals
+        mask = self.cells[i][j]
+        pending = [a for a in range(n_nt) if mask >> a & 1]
+        choices: Dict[int, Choice] = {}
+        # unit[A] = (regla, cortes, hijo que cubre todo el tramo)
+        unit: Dict[int, List[Tuple[int, List[int], int]]] = {}
+
+        for a in pending:
+            for rule in compiled.alternatives[a]:
+                rhs = compiled.rules[rule][1]
+                for bounds in self._splits(rule, i, j):
+                    full = [d for d in range(len(rhs)) if bounds[d] == i and bounds[d + 1] == j]
+                    if full and rhs[full[0]] < n_nt:
+                        unit.setdefault(a, []).append((rule, bounds, rhs[full[0]]))
+                        continue
+                    choices[a] = (rule, bounds)
+                    break
+                if a in choices:
+                    break
+
+        changed = True
+        while changed:
+            changed = False
+            for a in pending:
+                if a in choices:
+                    continue
+                for rule, bounds, child in unit.get(a, ()):
+                    if child in choices:
+                        choices[a] = (rule, bounds)
+                        changed = True
+                        break
+        return choices
+
+    def _add_epsilon(self, tree: ParseTree, symbol: int, pos: int) -> int:
+        """Agrega el árbol ε canónico de un no terminal anulable"""
+        compiled = self.compiled
+        rule = compiled.nullable_rule[symbol]
+        node = tree.add_node(compiled.symbols[symbol], compiled.rule_labels[rule], pos, pos)
+        tree.children[node] = [self._add_epsilon(tree, sym, pos) for sym in compiled.rules[rule][1]]
+        return node
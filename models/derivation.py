@@ -0,0 +1,85 @@
+# models/derivation.py
+from collections.abc import Sequence
+from typing import List, Optional, Tuple
+
+
+class Derivation(Sequence):
+    """
+    Historial de derivación con formato perezoso.
+
+    Los parsers guardan solo los datos crudos de cada paso; el texto legible
+    ("A → aB", "AB → BA ⇒ BA", ...) se genera cuando alguien lo recorre, por
+    ejemplo visualize_tree o la ventana de resultados. Se comporta como una
+    lista de cadenas de solo lectura.
+    """
+
+    # Tipos de paso soportados
+    PRODUCTION = 'production'   # paso = etiqueta ya formateada "A → α"
+    REWRITE = 'rewrite'         # paso = (left, right, forma_resultante)
+    LEFTMOST = 'leftmost'       # paso = etiqueta "A → α", numerada como "Paso k: A → α"
+
+    __slots__ = ('start_symbol', 'steps', 'kind', 'result', '_lines')
+
+    def __init__(self, start_symbol: str, steps: List, kind: str = PRODUCTION,
+                 result: Optional[str] = None):
+        """
+        Args:
+            start_symbol: Símbolo inicial (primer paso "Inicio: S")
+            steps: Datos crudos de cada paso en orden de derivación
+            kind: Formato de los pasos (PRODUCTION, REWRITE o LEFTMOST)
+            result: Cadena derivada; si se indica se agrega "Resultado final: ..."
+        """
+        self.start_symbol = start_symbol
+        self.steps = steps
+        self.kind = kind
+        self.result = result
+        self._lines: Optional[List[str]] = None
+
+    def _format(self, index: int) -> str:
+        """Formatea la línea `index` (0 = Inicio)"""
+        if index == 0:
+            return f"Inicio: {self.start_symbol}"
+        if index > len(self.steps):
+            return f"Resultado final: {self.result if self.result else 'ε'}"
+        step = self.steps[index - 1]
+        if self.kind == Derivation.REWRITE:
+            left, right, form = step
+            return f"{left} → {right} ⇒ {form}"
+        if self.kind == Derivation.LEFTMOST:
+            return f"Paso {index}: {step}"
+        return step
+
+    def lines(self) -> List[str]:
+        """Formatea (una sola vez) todos los pasos"""
+        if self._lines is None:
+            self._lines = [self._format(i) for i in range(len(self))]
+        return self._lines
+
+    def __len__(self) -> int:
+        return len(self.steps) + (1 if self.result is None else 2)
+
+    def __getitem__(self, index):
+        if self._lines is not None or isinstance(index, slice):
+            return self.lines()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de derivación fuera de rango")
+        return self._format(index)
+
+    def __iter__(self):
+        return iter(self.lines())
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"Derivation({len(self)} pasos)"
+
+    def __getstate__(self) -> Tuple:
+        # Se serializan solo los datos crudos (parse_many entre procesos)
+        return self.start_symbol, self.steps, self.kind, self.result
+
+    def __setstate__(self, state: Tuple):
+        self.start_symbol, self.steps, self.kind, self.result = state
+        self._lines = None
@@ -0,0 +1,418 @@
+# models/earley.py
+from typing import Dict, List, Optional, Set, Tuple
+
+from models.compiled_grammar import CompiledGrammar
+from models.progress import Progress
+
+# Estado Earley: (rule_id, dot, start_pos) sobre una CompiledGrammar
+Item = Tuple[int, int, int]
+
+# Hijo de un back-pointer: id de la regla completada, o uno de estos marcadores
+SCANNED = -1    # el símbolo antes del punto es un terminal leído
+NULLED = -2     # el no terminal antes del punto se saltó por ser anulable
+
+# links[i][item] = [(j, hijo), ...]: el item de la columna i proviene del item
+# (rule, dot - 1, start) de la columna j más el hijo que cubre [j, i)
+Links = List[Dict[Item, List[Tuple[int, int]]]]
+
+# Item de Leo para (columna j, no terminal A), cuando en j un único item espera
+# a A y A es su último símbolo: (item avanzado Y, siguiente clave (k, lhs de Y)
+# de la cadena o None, item tope de la cadena, back-pointer del tope o None si
+# el tope es Y)
+LeoEntry = Tuple[Item, Optional[Tuple[int, int]], Item, Optional[Tuple[int, int]]]
+
+
+class EarleyParser:
+    """
+    Motor Earley con agenda (worklist) por columna.
+
+    Cada columna indexa sus estados por el símbolo que sigue al punto, de modo que
+    COMPLETE es una búsqueda en diccionario y SCAN solo visita los estados que
+    esperan el token actual. PREDICT se ejecuta una sola vez por no terminal y
+    columna, y los no terminales anulables se saltan al predecir
+    (Aycock-Horspool).
+
+    Con lookahead=True, PREDICT y COMPLETE solo agregan items que pueden avanzar
+    con el token de la columna o completarse sin leer más (item_first de la
+    gramática compilada): en alfabetos grandes, de las 48 alternativas de
+    L → a | b | ... solo entra la que empieza con el carácter leído.
+
+    Optimización de Leo: cuando A se completa desde j y en la columna j un único
+    item espera a A como último símbolo, la cadena de reducciones deterministas
+    que sigue se memoiza por (j, A) y solo su item tope entra en la columna. Así
+    la recursión por la derecha (T → LT) deja de crear una cadena de items
+    completos por columna y el chart queda lineal en la entrada.
+
+    Con build_forest=True se registran back-pointers mientras se parsea; a partir
+    de ellos ParseForest (models/forest.py) arma el bosque compartido (SPPF). Los
+    items intermedios que Leo omitió se reconstruyen por columna, solo cuando el
+    bosque los pide (leo_items).
+
+    El estado del parse queda en el objeto: reparse() reutiliza las columnas
+    anteriores a una edición (ver models/session.py).
+    """
+
+    def __init__(self, compiled: CompiledGrammar, build_forest: bool = False,
+                 leo: bool = True, lookahead: bool = True,
+                 progress: Optional[Progress] = None):
+        """
+        Args:
+            compiled: Gramática precompilada (reglas como tuplas de ids)
+            build_forest: Registrar back-pointers para construir el bosque
+            leo: Aplicar la optimización de Leo para la recursión por la derecha
+            lookahead: Filtrar PREDICT/COMPLETE con los conjuntos FIRST
+            progress: Canal donde reportar la columna actual (y cancelar)
+        """
+        self.compiled = compiled
+        self.build_forest = build_forest
+        self.leo = leo
+        self.lookahead = lookahead
+        self.progress = progress
+        self.lhs_of = [lhs for lhs, _ in compiled.rules]
+        self.rhs_of = [rhs for _, rhs in compiled.rules]
+        self.tokens: List[int] = []
+        self.chart: List[Set[Item]] = []
+        # closed = cantidad de columnas ya cerradas (0..closed-1)
+        self.closed = 0
+        self.links: Optional[Links] = None
+        # waiting[i][X] = estados de la columna i cuyo siguiente símbolo es X
+        self.waiting: List[Dict[int, List[Item]]] = []
+        # leo_memo[j][A] = LeoEntry o None (no determinista)
+        self.leo_memo: List[Dict[int, Optional[LeoEntry]]] = []
+        # leo_fired[i][(j, A)] = (cantidad de back-pointers de la columna i al
+        # disparar por primera vez, reglas de A completadas desde j cuya cadena se omitió)
+        self.leo_fired: List[Dict[Tuple[int, int], Tuple[int, List[int]]]] = []
+        self._leo_items: Dict[int, List[Item]] = {}
+
+    def parse(self, tokens: List[int]) -> Tuple[bool, List[Set[Item]]]:
+        """
+        Ejecuta el reconocedor sobre la lista de ids de tokens.
+
+        Returns:
+            (accepted, chart) donde chart[i] es el conjunto de estados de la columna i
+        """
+        self.tokens = list(tokens)
+        self.chart = []
+        self.waiting = []
+        self.links = [] if self.build_forest else None
+        self.leo_memo = []
+        self.leo_fired = []
+        self._leo_items = {}
+        self.closed = 0
+        self._add_columns(len(tokens) + 1)
+        return self._run(0)
+
+    def reparse(self, tokens: List[int], start: int) -> Tuple[bool, List[Set[Item]]]:
+        """
+        Vuelve a parsear después de una edición que conserva tokens[:start].
+
+        Las columnas 0..start-1 se cerraron con los mismos tokens y el mismo
+        lookahead, así que se conservan con sus back-pointers y el memo de Leo;
+        la columna start se vuelve a llenar con el SCAN de la anterior y el
+        resto se recalcula. Agregar un carácter al final cuesta dos columnas.
+        """
+        keep = min(start, self.closed)
+        if keep == 0:
+            return self.parse(tokens)
+        self.tokens = list(tokens)
+        return self._resume(keep)
+
+    def extend(self, tokens: List[int]) -> Tuple[bool, List[Set[Item]]]:
+        """
+        Agrega tokens al final de la entrada actual; equivale a
+        reparse(self.tokens + tokens, len(self.tokens)) sin copiar la entrada.
+        """
+        keep = min(len(self.tokens), self.closed)
+        self.tokens.extend(tokens)
+        if keep == 0:
+            return self.parse(self.tokens)
+        return self._resume(keep)
+
+    def _resume(self, keep: int) -> Tuple[bool, List[Set[Item]]]:
+        """Descarta las columnas desde keep y las recalcula con self.tokens"""
+        tokens = self.tokens
+        columns = [self.chart, self.waiting, self.leo_memo, self.leo_fired]
+        if self.links is not None:
+            columns.append(self.links)
+        for column in columns:
+            del column[keep:]
+        self._leo_items = {i: items for i, items in self._leo_items.items() if i < keep}
+        self.closed = keep
+        self._add_columns(len(tokens) + 1 - keep)
+
+        if not self._scan(keep - 1):
+            return False, self.chart[:keep + 1]
+        return self._run(keep)
+
+    def _add_columns(self, count: int):
+        for _ in range(count):
+            self.chart.append(set())
+            self.waiting.append({})
+            self.leo_memo.append({})
+            self.leo_fired.append({})
+            if self.links is not None:
+                self.links.append({})
+
+    def _scan(self, i: int) -> bool:
+        """SCAN de la columna i a la i + 1; False si ningún estado puede continuar"""
+        nxt = self.chart[i + 1]
+        links = self.links
+        # Solo los estados que esperan exactamente este token
+        for rule, dot, start_pos in self.waiting[i].get(self.tokens[i], ()):
+            new = (rule, dot + 1, start_pos)
+            nxt.add(new)
+            if links is not None:
+                links[i + 1][new] = [(i, SCANNED)]
+        return bool(nxt)
+
+    def _run(self, first: int) -> Tuple[bool, List[Set[Item]]]:
+        """Cierra las columnas desde first (su SCAN ya está hecho) hasta el final"""
+        tokens = self.tokens
+        n = len(tokens)
+        chart = self.chart
+        waiting = self.waiting
+        links = self.links
+        item_first = self.compiled.item_first
+        end_bit = self.compiled.end_bit
+        progress = self.progress
+        for i in range(first, n + 1):
+            # Items viables en la columna i: los que pueden leer tokens[i]
+            # o completarse aquí (end_bit); None = sin filtro
+            if not self.lookahead:
+                viable = None
+            elif i < n and tokens[i] >= 0:
+                viable = 1 << tokens[i] | end_bit
+            else:
+                viable = end_bit
+
+            if i == 0:
+                for rule in self.compiled.alternatives[self.compiled.start]:
+                    if viable is None or item_first[rule][0] & viable:
+                        chart[0].add((rule, 0, 0))
+
+            self._close_column(i, chart, waiting, links, viable)
+            self.closed = i + 1
+            if progress is not None and not i & 63:
+                progress.report(phase="earley", column=i, columns=n + 1, items=len(chart[i]))
+
+            if i < n and not self._scan(i):
+                # Ningún estado puede continuar: rechazo temprano
+                return False, chart[:i + 2]
+
+        return self.is_accepting(chart[n]), chart
+
+    def is_accepting(self, column: Set[Item]) -> bool:
+        """Verifica si la columna contiene S → γ• iniciado en 0"""
+        start = self.compiled.start
+        lhs_of = self.lhs_of
+        rhs_of = self.rhs_of
+        return any(
+            start_pos == 0 and lhs_of[rule] == start and dot == len(rhs_of[rule])
+            for rule, dot, start_pos in column
+        )
+
+    def item_counts(self) -> Dict[str, int]:
+        """
+        Items del chart según cómo entraron: predichos (punto al inicio),
+        leídos (el punto pasó un terminal) y completados (pasó un no
+        terminal, completado o anulable). Se cuentan sobre el chart ya
+        armado, así que el parse no paga nada si nadie los pide.
+        """
+        rhs_of = self.rhs_of
+        n_nt = self.compiled.n_nonterminals
+        predicted = scanned = completed = largest = 0
+        for column in self.chart:
+            largest = max(largest, len(column))
+            for rule, dot, _ in column:
+                if dot == 0:
+                    predicted += 1
+                elif rhs_of[rule][dot - 1] < n_nt:
+                    completed += 1
+                else:
+                    scanned += 1
+        return {"predicted": predicted, "scanned": scanned, "completed": completed,
+                "items": predicted + scanned + completed, "largest_column": largest}
+
+    def _close_column(self, i: int, chart: List[Set[Item]],
+                      waiting: List[Dict[int, List[Item]]], links: Optional[Links],
+                      viable: Optional[int] = None):
+        """
+        Aplica PREDICT y COMPLETE hasta agotar la agenda de la columna i.
+        Si viable no es None, solo se agregan los items cuyo item_first lo intersecta.
+        """
+        column = chart[i]
+        index = waiting[i]
+        agenda = list(column)
+        predicted: Set[int] = set()
+        lhs_of = self.lhs_of
+        rhs_of = self.rhs_of
+        alternatives = self.compiled.alternatives
+        nullable = self.compiled.nullable
+        n_nt = self.compiled.n_nonterminals
+        column_links = links[i] if links is not None else None
+        leo = self.leo
+        fired = self.leo_fired[i]
+        item_first = self.compiled.item_first
+
+        while agenda:
+            state = agenda.pop()
+            rule, dot, start_pos = state
+            rhs = rhs_of[rule]
+
+            if dot < len(rhs):
+                next_sym = rhs[dot]
+                index.setdefault(next_sym, []).append(state)
+
+                if next_sym < n_nt:
+                    # PREDICT (una vez por no terminal)
+                    if next_sym not in predicted:
+                        predicted.add(next_sym)
+                        for alt in alternatives[next_sym]:
+                            if viable is not None and not item_first[alt][0] & viable:
+                                continue
+                            new = (alt, 0, i)
+                            if new not in column:
+                                column.add(new)
+                                agenda.append(new)
+                    # Un no terminal anulable puede saltarse directamente
+                    if next_sym in nullable and \
+                            (viable is None or item_first[rule][dot + 1] & viable):
+                        new = (rule, dot + 1, start_pos)
+                        if new not in column:
+                            column.add(new)
+                            agenda.append(new)
+                            if column_links is not None:
+                                column_links[new] = [(i, NULLED)]
+                        elif column_links is not None:
+                            column_links[new].append((i, NULLED))
+            else:
+                lhs = lhs_of[rule]
+                # Leo: solo desde columnas ya cerradas (start_pos < i)
+                entry = self._leo_entry(start_pos, lhs) if leo and start_pos < i else None
+                if entry is not None:
+                    fired_at = len(column_links) if column_links is not None else 0
+                    top = entry[2]
+                    if top not in column:
+                        column.add(top)
+                        agenda.append(top)
+                        if column_links is not None:
+                            column_links[top] = []
+                    if column_links is not None:
+                        link = entry[3] or (start_pos, rule)
+                        if link not in column_links[top]:
+                            column_links[top].append(link)
+                        if entry[1] is not None:
+                            fired.setdefault((start_pos, lhs), (fired_at, []))[1].append(rule)
+                    continue
+
+                # COMPLETE: búsqueda directa de los estados que esperan lhs
+                for rule2, dot2, start2 in waiting[start_pos].get(lhs, ()):
+                    if viable is not None and not item_first[rule2][dot2 + 1] & viable:
+                        continue
+                    new = (rule2, dot2 + 1, start2)
+                    if new not in column:
+                        column.add(new)
+                        agenda.append(new)
+                        if column_links is not None:
+                            column_links[new] = [(start_pos, rule)]
+                    elif column_links is not None:
+                        column_links[new].append((start_pos, rule))
+
+    def _leo_entry(self, j: int, symbol: int) -> Optional[LeoEntry]:
+        """
+        Item de Leo de (j, symbol), memoizado. Recorre la cadena de reducciones
+        deterministas sin recursión (puede medir tanto como la entrada) y la
+        corta si vuelve a una clave del mismo recorrido (ciclos unitarios).
+        (0, S) nunca se extiende, para que S completado desde 0 siempre quede en
+        el chart.
+        """
+        memo = self.leo_memo
+        if symbol in memo[j]:
+            return memo[j][symbol]
+
+        waiting = self.waiting
+        lhs_of = self.lhs_of
+        rhs_of = self.rhs_of
+        start = self.compiled.start
+        path: List[Tuple[Tuple[int, int], Item]] = []
+        on_path: Set[Tuple[int, int]] = set()
+        key = (j, symbol)
+        result: Optional[LeoEntry] = None
+        while True:
+            column, sym = key
+            if sym in memo[column]:
+                result = memo[column][sym]
+                break
+            if key in on_path:
+                break
+            items = waiting[column].get(sym)
+            if (column == 0 and sym == start) or items is None or len(items) != 1 or \
+                    items[0][1] != len(rhs_of[items[0][0]]) - 1:
+                memo[column][sym] = None
+                break
+            rule, dot, origin = items[0]
+            path.append((key, (rule, dot + 1, origin)))
+            on_path.add(key)
+            key = (origin, lhs_of[rule])
+
+        # Llenar el memo desde el final de la cadena hacia (j, symbol)
+        next_key = key if result is not None else None
+        for key, advanced in reversed(path):
+            if result is None:
+                result = (advanced, None, advanced, None)
+            else:
+                result = (advanced, next_key, result[2], result[3] or (advanced[2], advanced[0]))
+            memo[key[0]][key[1]] = result
+            next_key = key
+        return memo[j][symbol]
+
+    def leo_items(self, i: int) -> List[Item]:
+        """
+        Items completos de la columna i que Leo omitió, con sus back-pointers
+        agregados a links[i]. Se calculan una vez por columna y solo si se
+        construyó el bosque.
+
+        Un item de la cadena también puede entrar al chart por otro camino (un
+        anulable saltado, por ejemplo) después de que Leo lo derivó. Entonces
+        el back-pointer de Leo pasa a ser el primero: el primer back-pointer
+        de cada item debe apuntar a lo derivado antes, o ParseForest.tree()
+        podría seguir un ciclo.
+        """
+        items = self._leo_items.get(i)
+        if items is not None:
+            return items
+        items = []
+        self._leo_items[i] = items
+        if self.links is None:
+            return items
+
+        memo = self.leo_memo
+        column_links = self.links[i]
+        # Momento en que cada item quedó derivado: su posición en links[i]
+        # (orden de creación) o el primer disparo de Leo que lo incluye
+        derived = {item: k for k, item in enumerate(column_links)}
+        walked: Set[Item] = set()
+        # Los disparos están en orden: cada clave se registró en el primero
+        for (j, symbol), (fired_at, rules) in self.leo_fired[i].items():
+            entry = memo[j][symbol]
+            split, children = j, rules
+            # El tope ya está en el chart: se recorren solo los intermedios
+            while entry[1] is not None:
+                item = entry[0]
+                if item not in column_links:
+                    column_links[item] = []
+                    items.append(item)
+                pointers = column_links[item]
+                new = [(split, child) for child in children if (split, child) not in pointers]
+                if derived.get(item, fired_at) >= fired_at:
+                    pointers[:0] = new
+                else:
+                    pointers.extend(new)
+                derived[item] = min(derived.get(item, fired_at), fired_at)
+                if item in walked:
+                    # El resto de la cadena ya se recorrió desde un disparo anterior
+                    break
+                walked.add(item)
+                split, children = item[2], [item[0]]
+                entry = memo[entry[1][0]][entry[1][1]]
+        return items
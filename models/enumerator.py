@@ -0,0 +1,516 @@
+# models/enumerator.py
+import heapq
+import random
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+# Regla: (lhs, rhs) con ids; los ids < n_nonterminals son no terminales
+Rule = Tuple[int, Tuple[int, ...]]
+
+T = TypeVar('T')
+
+
+class _LazyStream:
+    """
+    Secuencia perezosa que se puede recorrer varias veces: guarda lo que ya
+    produjo el generador y solo le pide más elementos cuando hace falta.
+
+    El generador se crea con factory(). Si falla (cualquier excepción que no
+    sea StopIteration) queda descartado y el próximo pedido lo vuelve a crear
+    saltando lo ya guardado: un error no deja la secuencia truncada en caché.
+    """
+
+    __slots__ = ('_factory', '_source', '_items')
+
+    def __init__(self, factory: Callable[[], Iterator[str]]):
+        self._factory: Optional[Callable[[], Iterator[str]]] = factory
+        self._source: Optional[Iterator[str]] = None
+        self._items: List[str] = []
+
+    def __iter__(self) -> Iterator[str]:
+        i = 0
+        items = self._items
+        while True:
+            if i < len(items):
+                yield items[i]
+                i += 1
+            elif self._factory is None:
+                return
+            else:
+                if self._source is None:
+                    self._source = islice(self._factory(), len(items), None)
+                try:
+                    items.append(next(self._source))
+                except StopIteration:
+                    self._factory = self._source = None
+                except BaseException:
+                    self._source = None
+                    raise
+
+
+def _unique(stream: Iterable[str]) -> Iterator[str]:
+    """Elimina repetidos consecutivos de un flujo ordenado"""
+    last = None
+    for s in stream:
+        if s != last:
+            last = s
+            yield s
+
+
+def _choose(rng: random.Random, total: int, weighted: Iterable[Tuple[int, T]]) -> T:
+    """Elige un elemento con probabilidad peso / total (pesos enteros grandes)"""
+    x = rng.randrange(total)
+    for weight, item in weighted:
+        if x < weight:
+            return item
+        x -= weight
+    raise ValueError("los pesos no suman el total indicado")
+
+
+def _product(parts: List[Iterable[str]], i: int = 0) -> Iterator[str]:
+    """Concatenaciones en orden lexicográfico (cada parte tiene longitud fija)"""
+    if i == len(parts):
+        yield ''
+        return
+    for head in parts[i]:
+        for tail in _product(parts, i + 1):
+            yield head + tail
+
+
+class LanguageEnumerator:
+    """
+    Enumerador de cadenas de una gramática libre de contexto por longitud.
+
+    Precalcula, por no terminal y longitud, cuántas cadenas terminales deriva
+    (programación dinámica memoizada, enteros de precisión arbitraria) y con esas
+    tablas produce las cadenas en orden shortlex estricto (por longitud y luego
+    lexicográfico) como un generador perezoso, podando toda rama vacía.
+
+    Las cadenas de longitud L se descomponen así: A ⇒* B por cadenas unitarias
+    (A → αBβ con α, β anulables) y B aplica una regla "propia" cuyos trozos no
+    vacíos son terminales o no terminales de longitud < L. Así las tablas de L
+    solo dependen de longitudes menores, aun con reglas ε y ciclos unitarios.
+
+    Las mismas tablas permiten muestrear cadenas de una longitud dada de forma
+    uniforme: cada elección (alternativa, reparto de la longitud) se pondera
+    con los conteos, sin reconstruir nada entre muestras.
+
+    Los conteos son exactos para gramáticas no ambiguas (en particular para las
+    que se construyen desde un DFA); en gramáticas ambiguas cuentan
+    derivaciones y son una cota superior del número de cadenas. La enumeración
+    siempre elimina repetidos; el muestreo es uniforme sobre las derivaciones,
+    es decir, sobre las cadenas cuando la gramática no es ambigua.
+    """
+
+    def __init__(self, names: List[str], n_nonterminals: int, rules: List[Rule], start: int):
+        """
+        Args:
+            names: Nombre de cada símbolo (terminales: el carácter que producen)
+            n_nonterminals: Cantidad de no terminales (ids [0, n))
+            rules: Reglas (lhs, rhs)
+            start: Id del símbolo inicial
+        """
+        self.names = names
+        self.n_nonterminals = n_nonterminals
+        self.rules = rules
+        self.start = start
+        self.by_lhs: List[List[int]] = [[] for _ in range(n_nonterminals)]
+        for r, (lhs, _) in enumerate(rules):
+            self.by_lhs[lhs].append(r)
+
+        self.nullable = self._compute_nullable()
+        self.unit_closure = self._compute_unit_closure()
+        self.reachable = self._compute_reachable()
+        # _fixed_tail[r]: desde esa posición el resto de la regla son solo terminales
+        self._fixed_tail: List[int] = []
+        for _, rhs in rules:
+            pos = len(rhs) - 1
+            while pos >= 0 and rhs[pos] >= n_nonterminals:
+                pos -= 1
+            self._fixed_tail.append(pos)
+        # Cota de trozos por regla, usada para detectar lenguajes finitos
+        self.max_parts = max([2] + [len(rhs) for _, rhs in rules])
+
+        # Tablas por longitud L
+        self._count: List[List[int]] = []             # count[L][A]
+        self._proper: List[List[int]] = []            # proper[L][B]
+        # suffix[r][pos][m]: formas en que rhs[pos:] deriva m caracteres
+        self._suffix: List[List[List[int]]] = [[[] for _ in range(len(rhs) + 1)]
+                                               for _, rhs in rules]
+        # capped[L][r][pos]: igual con m = L, pero con cada no terminal < L
+        # (solo esa entrada cambia al excluir las cadenas unitarias)
+        self._capped: List[List[List[int]]] = []
+        self._last_nonzero = 0
+
+        self._streams: Dict[Tuple[int, int], _LazyStream] = {}
+        self._proper_streams: Dict[Tuple[int, int], _LazyStream] = {}
+        # Pesos acumulados para el muestreo: (símbolo, longitud) -> (opciones, acumulados)
+        self._unit_choices: Dict[Tuple[int, int], Tuple[List[int], List[int]]] = {}
+        self._rule_choices: Dict[Tuple[int, int], Tuple[List[int], List[int]]] = {}
+
+    # ------------------ Construcción ------------------
+    @staticmethod
+    def from_compiled(compiled) -> 'LanguageEnumerator':
+        """Enumerador sobre las reglas de una CompiledGrammar (Type 2/3)"""
+        return LanguageEnumerator(compiled.symbols, compiled.n_nonterminals,
+                                  compiled.rules, compiled.start)
+
+    @staticmethod
+    def from_dfa(dfa) -> 'LanguageEnumerator':
+        """
+        Enumerador sobre un DFA, visto como gramática right-linear no ambigua
+        (q → a q' por transición, q → ε si q acepta): los conteos son exactos.
+        """
+        n = max(len(dfa.delta), 1)
+        alphabet = sorted(dfa.alphabet)
+        names = [f"q{q}" for q in range(n)] + alphabet
+        ids = {a: n + i for i, a in enumerate(alphabet)}
+        rules: List[Rule] = []
+        for q, row in enumerate(dfa.delta):
+            for a in sorted(row):
+                rules.append((q, (ids[a], row[a])))
+            if q in dfa.accepting:
+                rules.append((q, ()))
+        return LanguageEnumerator(names, n, rules, dfa.start if dfa.start is not None else 0)
+
+    def _compute_nullable(self) -> Set[int]:
+        nullable: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.rules:
+                if lhs not in nullable and all(s in nullable for s in rhs):
+                    nullable.add(lhs)
+                    changed = True
+        return nullable
+
+    def _compute_reachable(self) -> List[int]:
+        """
+        No terminales útiles: alcanzables desde el símbolo inicial usando solo
+        reglas cuyos no terminales derivan alguna cadena terminal.
+        """
+        n_nt = self.n_nonterminals
+        productive: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.rules:
+                if lhs not in productive and all(s >= n_nt or s in productive for s in rhs):
+                    productive.add(lhs)
+                    changed = True
+        if self.start not in productive:
+            return []
+
+        seen = {self.start}
+        stack = [self.start]
+        while stack:
+            for r in self.by_lhs[stack.pop()]:
+                rhs = self.rules[r][1]
+                if all(s >= n_nt or s in productive for s in rhs):
+                    for sym in rhs:
+                        if sym < n_nt and sym not in seen:
+                            seen.add(sym)
+                            stack.append(sym)
+        return sorted(seen)
+
+    def _compute_unit_closure(self) -> List[List[int]]:
+        """U(A) = {B | A ⇒* B usando solo reglas A → αBβ con α, β anulables}"""
+        n_nt = self.n_nonterminals
+        direct: List[Set[int]] = [set() for _ in range(n_nt)]
+        for lhs, rhs in self.rules:
+            for i, sym in enumerate(rhs):
+                if sym < n_nt and all(o in self.nullable for j, o in enumerate(rhs) if j != i):
+                    direct[lhs].add(sym)
+
+        closure = []
+        for a in range(n_nt):
+            seen = {a}
+            stack = [a]
+            while stack:
+                for b in direct[stack.pop()]:
+                    if b not in seen:
+                        seen.add(b)
+                        stack.append(b)
+            closure.append(sorted(seen))
+        return closure
+
+    def _extend(self, length: int):
+        """Calcula las tablas hasta la longitud indicada (inclusive)"""
+        n_nt = self.n_nonterminals
+        count = self._count
+        while len(count) <= length:
+            L = len(count)
+            if L == 0:
+                count.append([1 if a in self.nullable else 0 for a in range(n_nt)])
+                self._proper.append([0] * n_nt)
+                self._capped.append([])
+                for (_, rhs), suffix in zip(self.rules, self._suffix):
+                    suffix[len(rhs)].append(1)
+                    for pos in range(len(rhs) - 1, -1, -1):
+                        sym = rhs[pos]
+                        ok = sym < n_nt and count[0][sym]
+                        suffix[pos].append(suffix[pos + 1][0] if ok else 0)
+                continue
+
+            # Reglas propias: cada no terminal toma entre 0 y L - 1 caracteres
+            proper = [0] * n_nt
+            capped_L = []
+            for r, (lhs, rhs) in enumerate(self.rules):
+                suffix = self._suffix[r]
+                k = len(rhs)
+                cap = [0] * (k + 1)
+                for pos in range(k - 1, -1, -1):
+                    sym = rhs[pos]
+                    nxt = suffix[pos + 1]
+                    if sym >= n_nt:
+                        # Terminal: ocupa exactamente un carácter
+                        cap[pos] = nxt[L - 1]
+                    else:
+                        total = cap[pos + 1] if count[0][sym] else 0
+                        for part in self._parts(r, pos, L, L - 1):
+                            if not part:
+                                continue
+                            c = count[part][sym]
+                            if c:
+                                rest = nxt[L - part]
+                                if rest:
+                                    total += c * rest
+                        cap[pos] = total
+                capped_L.append(cap)
+                proper[lhs] += cap[0]
+
+            totals = [sum(proper[b] for b in self.unit_closure[a]) for a in range(n_nt)]
+            if any(totals[a] for a in self.reachable):
+                self._last_nonzero = L
+            count.append(totals)
+            self._proper.append(proper)
+            self._capped.append(capped_L)
+
+            # Sufijos sin restricción para m = L (ya se conocen los conteos de L)
+            for r, (_, rhs) in enumerate(self.rules):
+                suffix = self._suffix[r]
+                k = len(rhs)
+                suffix[k].append(0)
+                for pos in range(k - 1, -1, -1):
+                    sym = rhs[pos]
+                    nxt = suffix[pos + 1]
+                    if sym >= n_nt:
+                        suffix[pos].append(nxt[L - 1])
+                    else:
+                        total = 0
+                        for part in self._parts(r, pos, L, L):
+                            c = count[part][sym]
+                            if c:
+                                rest = nxt[L - part]
+                                if rest:
+                                    total += c * rest
+                        suffix[pos].append(total)
+
+    def _parts(self, rule: int, pos: int, rem: int, upper: int) -> range:
+        """
+        Longitudes posibles para el no terminal rhs[pos] cuando rhs[pos:] debe
+        derivar rem caracteres (como máximo upper). Si después solo quedan
+        terminales la longitud está determinada: las reglas lineales (y las
+        que salen de un DFA) cuestan O(1) por longitud en vez de O(L).
+        """
+        if pos == self._fixed_tail[rule]:
+            part = rem - (len(self.rules[rule][1]) - pos - 1)
+            return range(part, part + 1) if 0 <= part <= upper else range(0)
+        return range(min(rem, upper) + 1)
+
+    def _rest(self, rule: int, pos: int, rem: int, length: int) -> int:
+        """Formas en que rhs[pos:] deriva rem caracteres dentro de una regla propia de longitud length"""
+        if rem == length:
+            return self._capped[length][rule][pos]
+        return self._suffix[rule][pos][rem]
+
+    def _exhausted(self, length: int) -> bool:
+        """
+        True si ningún no terminal útil deriva cadenas de esta longitud o mayores.
+        Si todos los conteos son 0 en (M, M·k] (M ≥ 1, con k trozos por regla
+        como máximo), el trozo más largo de una cadena más larga es un no
+        terminal que cae en ese rango: el lenguaje es finito.
+        """
+        return length > max(self._last_nonzero, 1) * self.max_parts
+
+    # ------------------ Conteo ------------------
+    def count(self, length: int, symbol: Optional[int] = None) -> int:
+        """Número de cadenas de la longitud dada derivables desde symbol (o S)"""
+        if length < 0:
+            return 0
+        self._extend(length)
+        return self._count[length][self.start if symbol is None else symbol]
+
+    # ------------------ Enumeración ------------------
+    def strings_of_length(self, length: int, symbol: Optional[int] = None) -> Iterator[str]:
+        """Cadenas de exactamente esa longitud, en orden lexicográfico y sin repetidos"""
+        if length < 0:
+            return iter(())
+        self._extend(length)
+        return iter(self._symbol_stream(self.start if symbol is None else symbol, length))
+
+    def iter_strings(self, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Todas las cadenas del lenguaje en orden shortlex, perezosamente.
+        Termina al llegar a max_length o cuando el lenguaje (finito) se agota.
+        """
+        length = 0
+        while max_length is None or length <= max_length:
+            self._extend(length)
+            if self._exhausted(length):
+                return
+            if self._count[length][self.start]:
+                yield from self._symbol_stream(self.start, length)
+            length += 1
+
+    def _symbol_stream(self, symbol: int, length: int) -> _LazyStream:
+        key = (symbol, length)
+        stream = self._streams.get(key)
+        if stream is None:
+            if length == 0:
+                empty = [''] if symbol in self.nullable else []
+                stream = _LazyStream(lambda: iter(empty))
+            else:
+                stream = _LazyStream(lambda: self._merge_units(symbol, length))
+            self._streams[key] = stream
+        return stream
+
+    def _merge_units(self, symbol: int, length: int) -> Iterator[str]:
+        """Une las cadenas propias de cada B con A ⇒* B por cadenas unitarias"""
+        proper = self._proper[length]
+        sources = [self._proper_stream(b, length)
+                   for b in self.unit_closure[symbol] if proper[b]]
+        return _unique(heapq.merge(*sources))
+
+    def _proper_stream(self, symbol: int, length: int) -> _LazyStream:
+        """Cadenas de B por reglas propias (sin pasar por cadenas unitarias)"""
+        key = (symbol, length)
+        stream = self._proper_streams.get(key)
+        if stream is None:
+            stream = _LazyStream(lambda: self._merge_rules(symbol, length))
+            self._proper_streams[key] = stream
+        return stream
+
+    def _merge_rules(self, symbol: int, length: int) -> Iterator[str]:
+        """Une los productos de cada regla de B y cada reparto de la longitud"""
+        capped = self._capped[length]
+        sources = []
+        for r in self.by_lhs[symbol]:
+            if capped[r][0]:
+                for parts in self._compositions(r, length):
+                    sources.append(_product(parts))
+        return _unique(heapq.merge(*sources))
+
+    def _compositions(self, rule: int, length: int) -> Iterator[List[Iterable[str]]]:
+        """Repartos de la longitud entre los símbolos de la regla (solo los no vacíos)"""
+        rhs = self.rules[rule][1]
+        rest = self._rest
+        count = self._count
+        n_nt = self.n_nonterminals
+        names = self.names
+
+        def walk(pos: int, rem: int, parts: List[Iterable[str]]):
+            if pos == len(rhs):
+                yield list(parts)
+                return
+            sym = rhs[pos]
+            if sym >= n_nt:
+                if rem >= 1 and rest(rule, pos + 1, rem - 1, length):
+                    parts.append((names[sym],))
+                    yield from walk(pos + 1, rem - 1, parts)
+                    parts.pop()
+                return
+            for part in self._parts(rule, pos, rem, length - 1):
+                if count[part][sym] and rest(rule, pos + 1, rem - part, length):
+                    parts.append(self._symbol_stream(sym, part))
+                    yield from walk(pos + 1, rem - part, parts)
+                    parts.pop()
+
+        return walk(0, length, [])
+
+    # ------------------ Muestreo ------------------
+    def sample(self, length: int, rng: random.Random, symbol: Optional[int] = None) -> str:
+        """Una cadena de la longitud dada elegida al azar de forma uniforme"""
+        symbol = self.start if symbol is None else symbol
+        if not self.count(length, symbol):
+            raise ValueError(f"El lenguaje no tiene cadenas de longitud {length}")
+
+        count = self._count
+        n_nt = self.n_nonterminals
+        names = self.names
+        out: List[str] = []
+        # Pila de trozos pendientes: terminales (str) o (no terminal, longitud)
+        stack: List = [(symbol, length)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+            sym, L = item
+            if L == 0:
+                continue
+
+            target = self._pick(rng, self._unit_choices, sym, L)
+            rule = self._pick(rng, self._rule_choices, target, L)
+
+            rhs = self.rules[rule][1]
+            rest = self._rest
+            parts: List = []
+            rem = L
+            for pos, part_sym in enumerate(rhs):
+                if part_sym >= n_nt:
+                    parts.append(names[part_sym])
+                    rem -= 1
+                    continue
+                candidates = self._parts(rule, pos, rem, L - 1)
+                if len(candidates) == 1:
+                    part = candidates[0]
+                else:
+                    part = _choose(rng, rest(rule, pos, rem, L),
+                                   ((count[p][part_sym] * rest(rule, pos + 1, rem - p, L), p)
+                                    for p in candidates))
+                parts.append((part_sym, part))
+                rem -= part
+            stack.extend(reversed(parts))
+
+        return ''.join(out)
+
+    def _pick(self, rng: random.Random, cache: Dict, symbol: int, length: int) -> int:
+        """
+        Elige un destino unitario (cache = _unit_choices) o una regla propia
+        (cache = _rule_choices) con pesos acumulados cacheados: O(log n) por
+        elección en lugar de recorrer todas las alternativas.
+        """
+        key = (symbol, length)
+        entry = cache.get(key)
+        if entry is None:
+            if cache is self._unit_choices:
+                weights = self._proper[length]
+                options = [b for b in self.unit_closure[symbol] if weights[b]]
+                cumulative = list(accumulate(weights[b] for b in options))
+            else:
+                capped = self._capped[length]
+                options = [r for r in self.by_lhs[symbol] if capped[r][0]]
+                cumulative = list(accumulate(capped[r][0] for r in options))
+            entry = options, cumulative
+            cache[key] = entry
+        options, cumulative = entry
+        if len(options) == 1:
+            return options[0]
+        return options[bisect_right(cumulative, rng.randrange(cumulative[-1]))]
+
+    def samples(self, length: int, seed: Optional[int] = None) -> Iterator[str]:
+        """
+        Flujo infinito de muestras uniformes de la longitud dada. Las tablas se
+        construyen una sola vez, así que sirve para generar millones de cadenas.
+        """
+        if not self.count(length):
+            raise ValueError(f"El lenguaje no tiene cadenas de longitud {length}")
+        rng = random.Random(seed)
+
+        def stream() -> Iterator[str]:
+            while True:
+                yield self.sample(length, rng)
+
+        return stream()
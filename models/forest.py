@@ -0,0 +1,303 @@
+# models/forest.py
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from models.compiled_grammar import CompiledGrammar
+from models.earley import Item, Links, SCANNED, NULLED
+
+
+class ParseTree:
+    """
+    Árbol de derivación en representación plana.
+
+    Los nodos se guardan en listas paralelas (sin diccionarios anidados), así que
+    árboles de miles de niveles se recorren sin recursión y se serializan sin
+    problemas entre procesos. El nodo 0 es la raíz.
+    """
+
+    __slots__ = ('symbols', 'productions', 'spans', 'children')
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        # Etiqueta "A → α" de los no terminales; None en las hojas (terminales)
+        self.productions: List[Optional[str]] = []
+        self.spans: List[Tuple[int, int]] = []
+        self.children: List[List[int]] = []
+
+    def add_node(self, symbol: str, production: Optional[str], start: int, end: int) -> int:
+        """Agrega un nodo y devuelve su índice"""
+        self.symbols.append(symbol)
+        self.productions.append(production)
+        self.spans.append((start, end))
+        self.children.append([])
+        return len(self.symbols) - 1
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def preorder(self) -> Iterator[int]:
+        """Recorre los nodos en preorden (sin recursión)"""
+        if not self.symbols:
+            return
+        stack = [0]
+        children = self.children
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(children[node]))
+
+    def derivation_steps(self) -> List[str]:
+        """Producciones en el orden de la derivación más a la izquierda"""
+        productions = self.productions
+        return [productions[k] for k in self.preorder() if productions[k] is not None]
+
+    def __repr__(self) -> str:
+        return f"ParseTree({len(self)} nodos)"
+
+
+class ParseForest:
+    """
+    Bosque compartido de derivaciones (SPPF) construido a partir de los
+    back-pointers que registra el parser Earley.
+
+    Nodos de símbolo (A, i, j): todas las formas en que A deriva tokens[i:j];
+    sus familias son las reglas A → γ completadas en la columna j desde i.
+    Nodos de item (regla, punto, i, j): sus divisiones son los puntos k de los
+    back-pointers. Los nodos se comparten: el bosque nunca se expande a árboles
+    salvo que se pidan.
+
+    Los items que la optimización de Leo no guardó en el chart se piden por
+    columna a leo_items (EarleyParser.leo_items) la primera vez que hacen falta;
+    por eso los back-pointers se leen con column_links() o first_link().
+    """
+
+    def __init__(self, compiled: CompiledGrammar, chart: List[Set[Item]], links: Links,
+                 tokens: List[int], leo_items: Optional[Callable[[int], List[Item]]] = None):
+        """
+        Args:
+            compiled: Gramática precompilada usada en el parse
+            chart: Columnas del parser Earley
+            links: Back-pointers registrados por el parser
+            tokens: Entrada como ids de terminales
+            leo_items: Items omitidos por Leo en una columna (los agrega a links)
+        """
+        self.compiled = compiled
+        self.chart = chart
+        self.links = links
+        self.leo_items = leo_items
+        self.n = len(tokens)
+        self.lhs_of = [lhs for lhs, _ in compiled.rules]
+        self.rhs_of = [rhs for _, rhs in compiled.rules]
+        # Índice perezoso: columna -> (lhs, inicio) -> reglas completadas
+        self._completed: Dict[int, Dict[Tuple[int, int], List[int]]] = {}
+
+    def root(self) -> Tuple[int, int, int]:
+        """Nodo de símbolo raíz (S, 0, n)"""
+        return self.compiled.start, 0, self.n
+
+    def column_links(self, end: int) -> Dict[Item, List[Tuple[int, int]]]:
+        """Back-pointers de la columna end, incluidos los de los items de Leo"""
+        if self.leo_items is not None:
+            self.leo_items(end)
+        return self.links[end]
+
+    def first_link(self, end: int, item: Item) -> Tuple[int, int]:
+        """
+        Primer back-pointer de un item. Los items de Leo de la columna se
+        reconstruyen antes aunque el item ya esté en el chart: si Leo lo
+        derivó primero, su back-pointer pasa adelante (ver leo_items).
+        """
+        return self.column_links(end)[item][0]
+
+    def families(self, symbol: int, start: int, end: int) -> List[int]:
+        """Reglas con lado izquierdo `symbol` completadas sobre [start, end)"""
+        index = self._completed.get(end)
+        if index is None:
+            index = {}
+            rhs_of = self.rhs_of
+            lhs_of = self.lhs_of
+            items = list(self.chart[end])
+            if self.leo_items is not None:
+                items.extend(self.leo_items(end))
+            for rule, dot, st in items:
+                if dot == len(rhs_of[rule]):
+                    index.setdefault((lhs_of[rule], st), []).append(rule)
+            for rules in index.values():
+                rules.sort()
+            self._completed[end] = index
+        return index.get((symbol, start), [])
+
+    def splits(self, rule: int, dot: int, start: int, end: int) -> List[int]:
+        """Puntos k en que el item (regla, punto) sobre [start, end) se divide"""
+        return sorted({k for k, _ in self.column_links(end)[(rule, dot, start)]})
+
+    # ------------------ Un árbol ------------------
+    def tree(self) -> Optional[ParseTree]:
+        """
+        Extrae un árbol en tiempo lineal en su tamaño.
+
+        Sigue el primer back-pointer de cada item: corresponde a la primera vez
+        que el item se derivó (en el chart o en una cadena de Leo), así que
+        apunta a items derivados antes y nunca forma ciclos. Los
+        subárboles ε saltados al predecir se completan con el árbol ε canónico.
+        """
+        symbol, start, end = self.root()
+        families = self.families(symbol, start, end)
+        if not families:
+            return None
+
+        compiled = self.compiled
+        names = compiled.symbols
+        labels = compiled.rule_labels
+        rhs_of = self.rhs_of
+        first_link = self.first_link
+
+        tree = ParseTree()
+        root = tree.add_node(names[symbol], labels[families[0]], start, end)
+        stack = [(root, families[0], start, end)]
+
+        while stack:
+            node, rule, s, e = stack.pop()
+            rhs = rhs_of[rule]
+            kids = [0] * len(rhs)
+            dot, pos = len(rhs), e
+            while dot > 0:
+                k, child = first_link(pos, (rule, dot, s))
+                sym = rhs[dot - 1]
+                if child == SCANNED:
+                    kids[dot - 1] = tree.add_node(names[sym], None, k, pos)
+                elif child == NULLED:
+                    kids[dot - 1] = self._add_epsilon(tree, sym, pos)
+                else:
+                    sub = tree.add_node(names[sym], labels[child], k, pos)
+                    stack.append((sub, child, k, pos))
+                    kids[dot - 1] = sub
+                dot -= 1
+                pos = k
+            tree.children[node] = kids
+
+        return tree
+
+    def _add_epsilon(self, tree: ParseTree, symbol: int, pos: int) -> int:
+        """Agrega el árbol ε canónico de un no terminal anulable"""
+        rule = self.compiled.nullable_rule[symbol]
+        node = tree.add_node(self.compiled.symbols[symbol], self.compiled.rule_labels[rule], pos, pos)
+        tree.children[node] = [self._add_epsilon(tree, sym, pos) for sym in self.rhs_of[rule]]
+        return node
+
+    # ------------------ Conteo ------------------
+    def count(self) -> Union[int, float]:
+        """
+        Cuenta los árboles de derivación de la entrada (programación dinámica
+        sobre el bosque, sin recursión). Devuelve math.inf si la gramática
+        tiene ciclos que dan infinitos árboles para esta entrada.
+        """
+        symbol, start, end = self.root()
+        if not self.families(symbol, start, end):
+            return 0
+
+        n_nt = self.compiled.n_nonterminals
+        rhs_of = self.rhs_of
+        memo: Dict[tuple, Union[int, float]] = {}
+        in_progress: Set[tuple] = set()
+
+        def dependencies(key: tuple) -> List[tuple]:
+            if len(key) == 3:
+                sym, s, e = key
+                return [(rule, len(rhs_of[rule]), s, e) for rule in self.families(sym, s, e)]
+            rule, dot, s, e = key
+            if dot == 0:
+                return []
+            sym = rhs_of[rule][dot - 1]
+            deps = []
+            for k in self.splits(rule, dot, s, e):
+                deps.append((rule, dot - 1, s, k))
+                if sym < n_nt:
+                    deps.append((sym, k, e))
+            return deps
+
+        def evaluate(key: tuple) -> Union[int, float]:
+            # Un nodo todavía en curso es un ancestro: hay un ciclo
+            if len(key) == 3:
+                return sum(memo.get(d, math.inf) for d in dependencies(key))
+            rule, dot, s, e = key
+            if dot == 0:
+                return 1 if s == e else 0
+            sym = rhs_of[rule][dot - 1]
+            total: Union[int, float] = 0
+            for k in self.splits(rule, dot, s, e):
+                left = memo.get((rule, dot - 1, s, k), math.inf)
+                right = memo.get((sym, k, e), math.inf) if sym < n_nt else 1
+                total += left * right
+            return total
+
+        root = (symbol, start, end)
+        stack = [root]
+        while stack:
+            key = stack[-1]
+            if key in memo:
+                stack.pop()
+            elif key in in_progress:
+                memo[key] = evaluate(key)
+                stack.pop()
+            else:
+                in_progress.add(key)
+                for dep in dependencies(key):
+                    if dep not in memo and dep not in in_progress:
+                        stack.append(dep)
+        return memo[root]
+
+    # ------------------ Enumeración ------------------
+    def trees(self) -> Iterator[ParseTree]:
+        """
+        Enumera perezosamente todos los árboles sin ciclos (un símbolo (A, i, j)
+        no se repite dentro de su propia rama). Pensado para reportes de
+        ambigüedad sobre entradas cortas.
+        """
+        symbol, start, end = self.root()
+        for shape in self._symbol_trees(symbol, start, end, frozenset()):
+            yield self._to_tree(shape)
+
+    def _symbol_trees(self, symbol: int, start: int, end: int, path: frozenset):
+        key = (symbol, start, end)
+        if key in path:
+            return
+        path = path | {key}
+        for rule in self.families(symbol, start, end):
+            for kids in self._sequence_trees(rule, len(self.rhs_of[rule]), start, end, path):
+                yield rule, start, end, kids
+
+    def _sequence_trees(self, rule: int, dot: int, start: int, end: int, path: frozenset):
+        if dot == 0:
+            if start == end:
+                yield ()
+            return
+        sym = self.rhs_of[rule][dot - 1]
+        for k in self.splits(rule, dot, start, end):
+            for left in self._sequence_trees(rule, dot - 1, start, k, path):
+                if not self.compiled.is_nonterminal(sym):
+                    yield left + ((sym, k),)
+                    continue
+                for child in self._symbol_trees(sym, k, end, path):
+                    yield left + (child,)
+
+    def _to_tree(self, shape: tuple) -> ParseTree:
+        """Convierte la forma anidada (regla, i, j, hijos) / (terminal, i) en ParseTree"""
+        names = self.compiled.symbols
+        labels = self.compiled.rule_labels
+        tree = ParseTree()
+        rule, start, end, kids = shape
+        root = tree.add_node(names[self.lhs_of[rule]], labels[rule], start, end)
+        stack = [(root, kids)]
+        while stack:
+            node, kids = stack.pop()
+            for kid in kids:
+                if len(kid) == 2:
+                    sym, pos = kid
+                    tree.children[node].append(tree.add_node(names[sym], None, pos, pos + 1))
+                else:
+                    rule, s, e, sub = kid
+                    child = tree.add_node(names[self.lhs_of[rule]], labels[rule], s, e)
+                    tree.children[node].append(child)
+                    stack.append((child, sub))
+        return tree
@@ -1,14 +1,42 @@
+import hashlib
+import heapq
 import json
-from collections import deque
-from typing import Dict, List, Set, Tuple, Optional, Any
+import threading
+import time
+from itertools import islice
+from typing import IO, Callable, Dict, List, Set, Tuple, Optional, Any, Iterable, Iterator, Sequence, Union
 
 from models.symbols import SymbolSets
 from models.production import Production
+from models.automaton import NFA, DFA, BitNFA
+from models.earley import EarleyParser, Item
+from models.compiled_grammar import CompiledGrammar
+from models.batch import parse_many
+from models.cache import ParseCache
+from models.derivation import Derivation
+from models.forest import ParseForest
+from models.enumerator import LanguageEnumerator
+from models.normalize import NormalizedGrammar
+from models.progress import Progress
+from models.cnf import CNFGrammar
+from models.cyk import CYKParser
+from models.recognizer import PrefixRecognizer
+from models.render import TreeRenderer
+from models.rewriting import RewriteMatcher
+from models.search import SententialSearch
+from models.session import ParseSession
+from models.stats import ParseStats, StatsCollector, result_outcome
 
 # Comentarios en español, código en inglés
 
 class Grammar:
     
+    # Motores seleccionables en parse(..., engine=...)
+    ENGINES = ('earley', 'cyk', 'nfa')
+    
+    # Subconjuntos máximos del DFA antes de pasar al NFA bit-paralelo (Type 3)
+    DFA_STATE_LIMIT = 10000
+    
     def __init__(self, nonterminals: Set[str], terminals: Set[str],
                  productions: Dict[str, List[str]], start_symbol: str,
                  max_derivation_length: int = 100):
@@ -44,6 +72,53 @@ class Grammar:
         # Clasificar tipo de gramática
         self.type = self._classify_grammar()
         self.grammar_style = self._detect_grammar_style()
+        
+        # Representación precompilada (se construye al primer parse)
+        self._compiled: Optional[CompiledGrammar] = None
+        
+        # Forma normalizada para Earley (opcional, ver normalize())
+        self._normalized: Optional[NormalizedGrammar] = None
+        self.use_normalized = False
+        
+        # Forma normal de Chomsky para el motor CYK (se construye al primer uso)
+        self._cnf: Optional[CNFGrammar] = None
+        
+        # Autómatas compilados (se construyen al primer parse de Type 3)
+        self._nfa: Optional[NFA] = None
+        self._dfa: Optional[DFA] = None
+        self._bit_nfa: Optional[BitNFA] = None
+        self._dfa_too_large = False
+        
+        # Tablas de conteo por longitud (se construyen al primer uso)
+        self._enumerator: Optional[LanguageEnumerator] = None
+        
+        # Aho–Corasick sobre los lados izquierdos (Type 0/1, al primer uso)
+        self._matcher: Optional[RewriteMatcher] = None
+        
+        # Búsqueda sobre formas sentenciales (Type 0/1, ver configure_search())
+        self.search_strategy = 'best-first'
+        self.max_search_steps = 10000
+        
+        # Caché de resultados (opcional, ver enable_cache()) y huella de la gramática
+        self._cache: Optional[ParseCache] = None
+        self._fingerprint: Optional[str] = None
+        
+        # Estadísticas de cada llamada (opcional, ver enable_stats())
+        self._stats: Optional[StatsCollector] = None
+        
+        # Las tablas y autómatas de arriba se construyen perezosamente y no son
+        # seguros entre hilos: quien use la gramática desde otro hilo toma este lock
+        self.lock = threading.RLock()
+    
+    def __getstate__(self) -> dict:
+        # El lock no se puede copiar a otro proceso (parse_many con workers)
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+    
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
     
     def _load_productions(self, productions: Dict[str, List[str]]):
         """Carga y valida las producciones"""
@@ -59,8 +134,30 @@ class Grammar:
             if error:
                 raise ValueError(error)
             
+            prod.on_change(self._production_changed)
             self.productions.append(prod)
     
+    def _production_changed(self, production: Production):
+        """
+        Una producción cambió (add_right/remove_right): se reclasifica la
+        gramática y se descarta todo lo precompilado, junto con las entradas
+        de la caché guardadas bajo la huella anterior.
+        """
+        if self._cache is not None and self._fingerprint is not None:
+            self._cache.discard(self._fingerprint)
+        self.type = self._classify_grammar()
+        self.grammar_style = self._detect_grammar_style()
+        self._compiled = None
+        self._normalized = None
+        self._cnf = None
+        self._nfa = None
+        self._dfa = None
+        self._bit_nfa = None
+        self._dfa_too_large = False
+        self._enumerator = None
+        self._matcher = None
+        self._fingerprint = None
+    
     def _detect_grammar_style(self) -> Optional[str]:
         """Detecta si es gramática regular right-linear o left-linear"""
         if self.type != 3:
@@ -152,164 +249,413 @@ class Grammar:
             name += f" - {self.grammar_style}-linear"
         return name
     
-    def parse(self, string: str) -> Tuple[bool, Optional[dict]]:
+    def parse(self, string: str, engine: Optional[str] = None,
+              progress: Optional[Progress] = None,
+              stats: Optional[ParseStats] = None) -> Tuple[bool, Optional[dict]]:
         """
         Intenta parsear una cadena según el tipo de gramática.
         
+        Args:
+            string: Cadena a parsear
+            engine: None (según el tipo), 'earley' o 'cyk' (Type 2/3), 'nfa' (Type 3)
+            progress: Canal para seguir el avance desde otro hilo y cancelar
+                      (Earley y la búsqueda de Type 0/1; ver models/progress.py)
+            stats: ParseStats donde sumar los contadores de esta llamada
+                   (ver models/stats.py)
+        
         Returns:
             (accepted, derivation_tree_or_info)
+        
+        Raises:
+            ParseCancelled: Si se canceló a través de progress
         """
+        if stats is None and self._stats is None:
+            return self._cached_parse(string, engine, progress, None)
+        call = ParseStats()
+        began = time.perf_counter()
+        result = self._cached_parse(string, engine, progress, call)
+        self._record_stats(call, result[0], began, stats)
+        return result
+    
+    def _cached_parse(self, string: str, engine: Optional[str], progress: Optional[Progress],
+                      stats: Optional[ParseStats]) -> Tuple[bool, Optional[dict]]:
+        cache = self._cache
+        if cache is None:
+            return self._parse(string, engine, progress, stats)
+        key = self._cache_key(string, engine)
+        result = cache.get(key, full=True)
+        if result is None:
+            result = self._parse(string, engine, progress, stats)
+            # Un corte por max_steps se guarda completo: el bit solo no lo
+            # distingue de un rechazo
+            if cache.accept_only and result_outcome(*result) != 'budget_exhausted':
+                cache.put(key, result[0])
+            else:
+                cache.put(key, result)
+        elif stats is not None:
+            self._cache_hit_stats(stats, result)
+        return result
+    
+    def _parse(self, string: str, engine: Optional[str],
+               progress: Optional[Progress] = None,
+               stats: Optional[ParseStats] = None) -> Tuple[bool, Optional[dict]]:
+        if engine is not None:
+            self._check_engine(engine)
+            if engine == 'cyk':
+                return self._parse_cyk(string, stats)
+            if engine == 'nfa':
+                return self._parse_type3(string, self.get_bit_nfa(), stats)
+            return self._parse_type2(string, progress, stats)
         if self.type == 3:
-            return self._parse_type3(string)
+            return self._parse_type3(string, stats=stats)
         elif self.type == 2:
             # Usar Earley para CFGs (Type 2)
-            return self._parse_type2(string)
+            return self._parse_type2(string, progress, stats)
         else:
-            return self._parse_general(string)
+            return self._parse_general(string, progress=progress, stats=stats)
+    
+    def _check_engine(self, engine: str):
+        """Valida que el motor exista y sirva para el tipo de gramática"""
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor desconocido '{engine}' (opciones: {', '.join(self.ENGINES)})")
+        if engine == 'nfa' and self.type != 3:
+            raise ValueError("El motor 'nfa' requiere una gramática Type 3")
+        if self.type < 2:
+            raise ValueError(f"El motor '{engine}' requiere una gramática Type 2 o Type 3")
+    
+    def get_compiled(self) -> CompiledGrammar:
+        """Obtiene (y cachea) la representación precompilada de la gramática"""
+        if self._compiled is None:
+            self._compiled = CompiledGrammar(self)
+        return self._compiled
+    
+    def compile(self, engine: Optional[str] = None) -> 'Grammar':
+        """Construye por adelantado todas las estructuras que usan los parsers"""
+        self.get_compiled()
+        if engine is not None:
+            self._check_engine(engine)
+            if engine == 'cyk':
+                self.get_cnf()
+            elif engine == 'nfa':
+                self.get_bit_nfa()
+            elif self.use_normalized:
+                self.get_normalized()
+        elif self.type == 3:
+            self._type3_automaton()
+        elif self.type == 2 and self.use_normalized:
+            self.get_normalized()
+        elif self.type < 2:
+            self.get_matcher()
+        return self
+    
+    def get_matcher(self) -> RewriteMatcher:
+        """Obtiene (y cachea) el núcleo de reescritura de formas sentenciales"""
+        if self._matcher is None:
+            self._matcher = RewriteMatcher(self.get_compiled().rewrites)
+        return self._matcher
+    
+    def get_normalized(self) -> NormalizedGrammar:
+        """Obtiene (y cachea) la forma normalizada de una gramática Type 2/3"""
+        if self._normalized is None:
+            if self.type < 2:
+                raise ValueError("Solo las gramáticas Type 2 y 3 se pueden normalizar")
+            self._normalized = NormalizedGrammar(self.get_compiled())
+        return self._normalized
+    
+    def normalize(self, enabled: bool = True) -> 'Grammar':
+        """
+        Activa (o desactiva) la normalización antes de parsear: sin símbolos
+        que solo derivan ε, sin cadenas unitarias puente y sin símbolos inútiles.
+        El parser Earley trabaja sobre la forma normalizada, pero los árboles y
+        derivaciones se siguen expresando con las producciones originales.
+        parse_forest() siempre usa la gramática original.
+        """
+        if enabled and self.type >= 2:
+            self.get_normalized()
+        self.use_normalized = enabled
+        return self
+    
+    def accepts(self, string: str, engine: Optional[str] = None,
+                stats: Optional[ParseStats] = None) -> bool:
+        """Reconoce la cadena sin construir la derivación"""
+        if stats is None and self._stats is None:
+            return self._cached_accepts(string, engine, None)
+        call = ParseStats()
+        began = time.perf_counter()
+        accepted = self._cached_accepts(string, engine, call)
+        self._record_stats(call, accepted, began, stats)
+        return accepted
+    
+    def _cached_accepts(self, string: str, engine: Optional[str],
+                        stats: Optional[ParseStats]) -> bool:
+        cache = self._cache
+        if cache is None:
+            return self._accepts(string, engine, stats)
+        key = self._cache_key(string, engine)
+        value = cache.get(key)
+        if value is None:
+            if engine is None and self.type < 2:
+                # Type 0/1: un corte por max_steps se guarda con su info
+                # (ver _cached_parse)
+                result = self._parse_general(string, stats=stats)
+                value = result if result_outcome(*result) == 'budget_exhausted' else result[0]
+            else:
+                value = self._accepts(string, engine, stats)
+            cache.put(key, value)
+        elif stats is not None:
+            self._cache_hit_stats(stats, value)
+        return value if isinstance(value, bool) else value[0]
+    
+    @staticmethod
+    def _cache_hit_stats(stats: ParseStats, value: Union[bool, tuple]):
+        """Cuenta una respuesta de la caché, conservando un corte por max_steps"""
+        stats.cache_hits += 1
+        if isinstance(value, tuple) and result_outcome(*value) == 'budget_exhausted':
+            stats.budget_exhausted += 1
+    
+    def _accepts(self, string: str, engine: Optional[str],
+                 stats: Optional[ParseStats] = None) -> bool:
+        if engine is not None:
+            self._check_engine(engine)
+            if engine == 'cyk':
+                return self._cyk_parse(string, stats)[0]
+            if engine == 'nfa':
+                return self._type3_accepts(string, self.get_bit_nfa(), stats)
+            return self._earley_parse(string, stats=stats)[0]
+        if self.type == 3:
+            return self._type3_accepts(string, self._type3_automaton(), stats)
+        elif self.type == 2:
+            return self._earley_parse(string, stats=stats)[0]
+        else:
+            return self._parse_general(string, stats=stats)[0]
+    
+    # ------------------ Result cache ------------------
+    def fingerprint(self) -> str:
+        """
+        Huella estable de la gramática: SHA-256 de los conjuntos de símbolos
+        (ordenados), el símbolo inicial y las producciones. Las producciones
+        conservan su orden porque decide qué derivación se informa cuando la
+        cadena es ambigua.
+        """
+        if self._fingerprint is None:
+            canonical = json.dumps([
+                sorted(self.symbols.nonterminals),
+                sorted(self.symbols.terminals),
+                self.S,
+                [[p.left, p.rights] for p in self.productions]
+            ], ensure_ascii=False, separators=(',', ':'))
+            self._fingerprint = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        return self._fingerprint
+    
+    def enable_cache(self, max_entries: int = 10000, ttl: Optional[float] = None,
+                     accept_only: bool = False, cache: Optional[ParseCache] = None
+                     ) -> 'Grammar':
+        """
+        Activa la caché de resultados de parse() y accepts(), con clave
+        (huella de la gramática, configuración, cadena). Útil cuando las mismas
+        entradas se repiten; los resultados cacheados se comparten, no se
+        deben modificar.
+        
+        Args:
+            max_entries: Cantidad máxima de entradas (LRU)
+            ttl: Segundos de validez de cada entrada (None = sin vencimiento)
+            accept_only: Guardar solo el bit de aceptación (parse() sigue
+                         calculando el árbol, accepts() usa la caché)
+            cache: ParseCache existente para compartir entre gramáticas
+                   (los demás argumentos se ignoran)
+        """
+        self._cache = cache if cache is not None else ParseCache(max_entries, ttl, accept_only)
+        return self
+    
+    def disable_cache(self) -> 'Grammar':
+        """Desactiva la caché de resultados"""
+        self._cache = None
+        return self
+    
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Contadores de la caché (aciertos, fallos, descartes), o None si no está activa"""
+        return self._cache.stats() if self._cache is not None else None
+    
+    # ------------------ Instrumentation ------------------
+    def enable_stats(self, hook: Optional[Callable[[ParseStats], None]] = None,
+                     collector: Optional[StatsCollector] = None) -> 'Grammar':
+        """
+        Activa las estadísticas de parse() y accepts(): cada llamada arma su
+        ParseStats, que se suma al total (parse_stats()) y se pasa a hook.
+        Desactivadas, los motores no cuentan nada; una sola llamada también
+        se puede medir con parse(..., stats=ParseStats()).
+        
+        Args:
+            hook: Función llamada con el ParseStats de cada llamada
+            collector: StatsCollector existente para compartir entre gramáticas
+                       (hook se ignora)
+        """
+        self._stats = collector if collector is not None else StatsCollector(hook)
+        return self
+    
+    def disable_stats(self) -> 'Grammar':
+        """Desactiva las estadísticas"""
+        self._stats = None
+        return self
+    
+    def parse_stats(self) -> Optional[ParseStats]:
+        """Total de las llamadas desde enable_stats(), o None si no están activas"""
+        return self._stats.total if self._stats is not None else None
+    
+    def _record_stats(self, call: ParseStats, accepted: bool, began: float,
+                      stats: Optional[ParseStats]):
+        """Cierra las estadísticas de una llamada y las entrega"""
+        call.seconds = time.perf_counter() - began
+        call.calls = 1
+        if accepted:
+            call.accepted = 1
+        elif not call.budget_exhausted:
+            call.rejected = 1
+        if stats is not None:
+            stats.merge(call)
+        if self._stats is not None:
+            self._stats.record(call)
+    
+    @staticmethod
+    def _timed(stats: Optional[ParseStats], phase: str, function: Callable, *args, **kwargs):
+        """Llama a function y, si hay estadísticas, suma su duración a phase"""
+        if stats is None:
+            return function(*args, **kwargs)
+        began = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.add_phase(phase, time.perf_counter() - began)
+    
+    def _cache_key(self, string: str, engine: Optional[str]) -> tuple:
+        # La configuración cambia el árbol o la información que se devuelve
+        return (self.fingerprint(), engine, self.use_normalized,
+                self.search_strategy, self.max_search_steps, string)
+    
+    def parse_many(self, strings: Iterable[str], workers: Optional[int] = None,
+                   chunksize: int = 256, ordered: bool = True,
+                   details: bool = True, engine: Optional[str] = None
+                   ) -> Iterator[Tuple[int, bool, Optional[dict]]]:
+        """
+        Parsea muchas cadenas, opcionalmente repartidas en un pool de procesos.
+        Ver models/batch.py para el detalle de los parámetros.
+        
+        Yields:
+            (index, accepted, info)
+        """
+        return parse_many(self, strings, workers=workers, chunksize=chunksize,
+                          ordered=ordered, details=details, engine=engine)
+    
+    def session(self, text: str = '') -> ParseSession:
+        """
+        Sesión de parseo incremental (Type 2/3) para un texto que se edita:
+        cada edición solo recalcula desde la posición modificada.
+        Ver models/session.py.
+        """
+        return ParseSession(self, text)
     
-    # ------------------ Type 3 parser (BFS con autómata) ------------------
-    def _parse_type3(self, string: str) -> Tuple[bool, Optional[dict]]:
-        """Parser optimizado para gramáticas regulares"""
+    def recognizer(self) -> PrefixRecognizer:
+        """
+        Reconocedor por empuje (Type 2/3): recibe la entrada en trozos y
+        detecta en cuanto ninguna continuación puede ser aceptada.
+        Ver models/recognizer.py.
+        """
+        return PrefixRecognizer(self)
+    
+    # ------------------ Type 3 parser (DFA minimizado) ------------------
+    def get_nfa(self) -> NFA:
+        """Obtiene (y cachea) el NFA de una gramática regular"""
+        if self._nfa is None:
+            if self.type != 3:
+                raise ValueError("Solo las gramáticas Type 3 se compilan a autómata")
+            self._nfa = NFA.from_grammar(self)
+        return self._nfa
+    
+    def get_dfa(self) -> DFA:
+        """
+        Obtiene (y cachea) el DFA mínimo de una gramática regular.
+        Gramática → NFA → DFA (subconjuntos) → DFA mínimo (Hopcroft).
+        
+        Raises:
+            ValueError: Si la construcción por subconjuntos excede DFA_STATE_LIMIT
+        """
+        if self._dfa is None:
+            nfa = self.get_nfa()
+            self._dfa = DFA.from_nfa(nfa, self.symbols.terminals,
+                                     max_states=self.DFA_STATE_LIMIT).minimize()
+        return self._dfa
+    
+    def get_bit_nfa(self) -> BitNFA:
+        """Obtiene (y cachea) la simulación bit-paralela del NFA (sin subconjuntos)"""
+        if self._bit_nfa is None:
+            self._bit_nfa = BitNFA(self.get_nfa())
+        return self._bit_nfa
+    
+    def _type3_automaton(self) -> Union[DFA, BitNFA]:
+        """DFA mínimo, o el NFA bit-paralelo si el DFA excede DFA_STATE_LIMIT"""
+        if self._dfa is None and not self._dfa_too_large:
+            try:
+                self.get_dfa()
+            except ValueError:
+                self._dfa_too_large = True
+        if self._dfa is not None:
+            return self._dfa
+        return self.get_bit_nfa()
+    
+    def _parse_type3(self, string: str, automaton: Union[DFA, BitNFA, None] = None,
+                     stats: Optional[ParseStats] = None) -> Tuple[bool, Optional[dict]]:
+        """Parser para gramáticas regulares: un recorrido del autómata"""
         target = string if string else ''
+        if automaton is None:
+            automaton = self._type3_automaton()
         
-        # FIX: Para left-linear, procesar de derecha a izquierda
-        if self.grammar_style == 'left':
-            return self._parse_type3_left(target)
-        else:
-            return self._parse_type3_right(target)
-    
-    def _parse_type3_right(self, target: str) -> Tuple[bool, Optional[dict]]:
-        """Parser para gramáticas right-linear"""
-        # BFS: (estado_actual, posición_en_target, historial_derivaciones)
-        queue = deque([(self.S, 0, [f"Inicio: {self.S}"])])
-        visited = set()
-        max_steps = 50000
-        steps = 0
-        
-        while queue and steps < max_steps:
-            steps += 1
-            state, pos, history = queue.popleft()
-            
-            # Evitar ciclos
-            key = (state, pos)
-            if key in visited:
-                continue
-            visited.add(key)
-            
-            # ¿Estado no tiene producciones?
-            if state not in self.P:
-                continue
-            
-            # ¿Llegamos al final del input?
-            if pos == len(target):
-                # Necesitamos producción a epsilon
-                if 'ε' in self.P[state]:
-                    final_history = history + [f"{state} → ε"]
-                    tree = self._build_linear_tree(final_history)
-                    return True, tree
-                continue
-            
-            current_symbol = target[pos]
-            
-            for prod_right in self.P[state]:
-                if prod_right == 'ε':
-                    # Epsilon solo válido al final
-                    continue
-                
-                # FIX: A → a (terminal único) - puede estar en cualquier posición
-                if len(prod_right) == 1 and self.symbols.is_terminal(prod_right):
-                    if prod_right == current_symbol:
-                        # Si consumimos el símbolo y estamos al final, aceptamos
-                        if pos == len(target) - 1:
-                            final_history = history + [f"{state} → {prod_right}"]
-                            tree = self._build_linear_tree(final_history)
-                            return True, tree
-                
-                # Right-linear: A → aB
-                elif (len(prod_right) == 2 and 
-                      self.symbols.is_terminal(prod_right[0]) and
-                      self.symbols.is_nonterminal(prod_right[1])):
-                    
-                    if prod_right[0] == current_symbol:
-                        new_state = prod_right[1]
-                        new_history = history + [f"{state} → {prod_right}"]
-                        queue.append((new_state, pos + 1, new_history))
-        
-        return False, None
-    
-    def _parse_type3_left(self, target: str) -> Tuple[bool, Optional[dict]]:
-        """Parser para gramáticas left-linear (procesa de derecha a izquierda)"""
-        # BFS: (estado_actual, posición_desde_final, historial_derivaciones)
-        queue = deque([(self.S, len(target), [f"Inicio: {self.S}"])])
-        visited = set()
-        max_steps = 50000
-        steps = 0
-        
-        while queue and steps < max_steps:
-            steps += 1
-            state, pos, history = queue.popleft()
-            
-            # Evitar ciclos
-            key = (state, pos)
-            if key in visited:
-                continue
-            visited.add(key)
-            
-            if state not in self.P:
-                continue
-            
-            # ¿Llegamos al principio del input?
-            if pos == 0:
-                if 'ε' in self.P[state]:
-                    final_history = history + [f"{state} → ε"]
-                    tree = self._build_linear_tree(final_history)
-                    return True, tree
-                continue
-            
-            current_symbol = target[pos - 1]
-            
-            for prod_right in self.P[state]:
-                if prod_right == 'ε':
-                    continue
-                
-                # A → a (terminal único)
-                if len(prod_right) == 1 and self.symbols.is_terminal(prod_right):
-                    if prod_right == current_symbol and pos == 1:
-                        final_history = history + [f"{state} → {prod_right}"]
-                        tree = self._build_linear_tree(final_history)
-                        return True, tree
-                
-                # Left-linear: A → Ba
-                elif (len(prod_right) == 2 and 
-                      self.symbols.is_nonterminal(prod_right[0]) and
-                      self.symbols.is_terminal(prod_right[1])):
-                    
-                    if prod_right[1] == current_symbol:
-                        new_state = prod_right[0]
-                        new_history = history + [f"{state} → {prod_right}"]
-                        queue.append((new_state, pos - 1, new_history))
-        
-        return False, None
+        if not self._type3_accepts(target, automaton, stats):
+            return False, None
+        return True, self._timed(stats, 'tree', self._type3_tree, target)
+    
+    def _type3_accepts(self, string: str, automaton: Union[DFA, BitNFA],
+                       stats: Optional[ParseStats] = None) -> bool:
+        if stats is None:
+            return automaton.accepts(string)
+        stats.use('dfa' if isinstance(automaton, DFA) else 'nfa')
+        stats.transitions += len(string)
+        return self._timed(stats, 'automaton', automaton.accepts, string)
+    
+    def _type3_tree(self, string: str) -> dict:
+        """Solo para cadenas aceptadas se reconstruye la derivación sobre el NFA"""
+        steps = self.get_nfa().trace(string)
+        return self._build_linear_tree(Derivation(self.S, steps or []))
     
     # ------------------ Type 2 parser (Earley) ------------------
-    def _parse_type2(self, string: str) -> Tuple[bool, Optional[dict]]:
+    def _parse_type2(self, string: str, progress: Optional[Progress] = None,
+                     stats: Optional[ParseStats] = None) -> Tuple[bool, Optional[dict]]:
         """Parser para gramáticas libres de contexto usando algoritmo Earley"""
-        accepted, chart = self._earley_parse(string)
+        accepted, chart, forest = self._earley_parse(string, build_forest=True,
+                                                     progress=progress, stats=stats)
+        return self._timed(stats, 'tree', self._earley_info, string, accepted, chart, forest)
+    
+    def _earley_info(self, string: str, accepted: bool, chart: List[Set[Item]],
+                     forest: ParseForest) -> Tuple[bool, dict]:
+        """Arma el resultado de un parse Earley (árbol, derivación y chart)"""
+        compiled = forest.compiled
         
-        # FIX: Generar derivaciones para visualización
-        derivations = []
+        # Árbol exacto extraído del bosque (SPPF) y derivación más a la izquierda
+        tree = None
         if accepted:
-            derivations = self._build_earley_derivations(string, chart)
+            tree = compiled.tree(forest) if compiled is self._normalized else forest.tree()
+        derivations = []
+        if tree is not None:
+            derivations = Derivation(self.S, tree.derivation_steps(), Derivation.LEFTMOST, string)
         
         # Recolectar estados completados
         completed_states = []
         if len(chart) > len(string):
-            for st in chart[len(string)]:
-                lhs, rhs, dot, start_pos = st
+            for rule, dot, start_pos in chart[len(string)]:
+                lhs, rhs = compiled.rules[rule]
                 if dot == len(rhs):
                     completed_states.append({
-                        "lhs": lhs,
-                        "rhs": "".join(rhs) if rhs else "ε",
+                        "lhs": compiled.symbols[lhs],
+                        "rhs": compiled.rhs_string(rule),
                         "start": start_pos,
                         "end": len(string)
                     })
@@ -320,185 +666,209 @@ class Grammar:
             "accepted": accepted,
             "chart_sizes": [len(s) for s in chart],
             "completed": completed_states[:30],
-            "derivations": derivations  # FIX: Agregar derivaciones
+            "derivations": derivations,  # FIX: Agregar derivaciones
+            "tree": tree
         }
         return accepted, info
     
-    def _build_earley_derivations(self, string: str, chart: List[Set[Tuple[str, Tuple[str, ...], int, int]]]) -> List[str]:
-        """Construye una lista de derivaciones a partir del chart de Earley"""
-        derivations = [f"Inicio: {self.S}"]
-        
-        # Buscar un estado completado de S que cubra toda la entrada
-        final_states = []
-        n = len(string)
-        
-        for st in chart[n]:
-            lhs, rhs, dot, start_pos = st
-            if lhs == self.S and dot == len(rhs) and start_pos == 0:
-                final_states.append(st)
-        
-        if not final_states:
-            return derivations
-        
-        # Tomar el primer estado final
-        final_state = final_states[0]
-        
-        # Reconstruir derivación de forma simplificada
-        # Mostrar las producciones principales aplicadas
-        production_sequence = self._trace_earley_derivation(final_state, chart, string)
-        
-        for i, prod in enumerate(production_sequence, 1):
-            derivations.append(f"Paso {i}: {prod}")
-        
-        derivations.append(f"Resultado final: {string if string else 'ε'}")
-        
-        return derivations
-    
-    def _trace_earley_derivation(self, state: Tuple[str, Tuple[str, ...], int, int], 
-                                  chart: List[Set[Tuple[str, Tuple[str, ...], int, int]]], 
-                                  string: str) -> List[str]:
-        """Traza las producciones aplicadas (versión simplificada)"""
-        lhs, rhs, dot, start_pos = state
-        productions = []
-        
-        # Mostrar la producción principal
-        rhs_str = "".join(rhs) if rhs else "ε"
-        productions.append(f"{lhs} → {rhs_str}")
-        
-        # Buscar producciones de los no terminales en rhs
-        pos = start_pos
-        for symbol in rhs:
-            if self.symbols.is_nonterminal(symbol):
-                # Buscar estados completados de este símbolo
-                for end_pos in range(pos + 1, len(string) + 1):
-                    if end_pos < len(chart):
-                        for st in chart[end_pos]:
-                            st_lhs, st_rhs, st_dot, st_start = st
-                            if (st_lhs == symbol and st_dot == len(st_rhs) and 
-                                st_start == pos):
-                                st_rhs_str = "".join(st_rhs) if st_rhs else "ε"
-                                productions.append(f"{st_lhs} → {st_rhs_str}")
-                                pos = end_pos
-                                break
-            elif self.symbols.is_terminal(symbol):
-                pos += 1
-        
-        return productions
-    
-    def _earley_parse(self, input_string: str) -> Tuple[bool, List[Set[Tuple[str, Tuple[str, ...], int, int]]]]:
-        """
-        FIX: Simplificación del algoritmo Earley
-        Estado representado como tupla: (lhs, rhs_tuple, dot, start_pos)
-        """
-        # Preparar producciones
-        grammar_productions: Dict[str, List[Tuple[str, ...]]] = {}
-        for prod in self.productions:
-            rhs_list = []
-            for r in prod.rights:
-                if r == 'ε':
-                    rhs_list.append(tuple())
-                else:
-                    rhs_list.append(tuple(r))
-            grammar_productions.setdefault(prod.left, []).extend(rhs_list)
-        
-        tokens = list(input_string) if input_string else []
-        n = len(tokens)
-        chart: List[Set[Tuple[str, Tuple[str, ...], int, int]]] = [set() for _ in range(n + 1)]
-        
-        def add_state(i: int, state: Tuple[str, Tuple[str, ...], int, int]) -> bool:
-            if state not in chart[i]:
-                chart[i].add(state)
-                return True
-            return False
-        
-        # Inicializar con producciones de S
-        for rhs in grammar_productions.get(self.S, []):
-            add_state(0, (self.S, rhs, 0, 0))
-        
-        # Main loop
-        for i in range(n + 1):
-            changed = True
-            while changed:
-                changed = False
-                states = list(chart[i])
-                
-                for state in states:
-                    lhs, rhs, dot, start_pos = state
-                    
-                    if dot < len(rhs):
-                        next_sym = rhs[dot]
-                        
-                        # PREDICT
-                        if self.symbols.is_nonterminal(next_sym):
-                            for prod_rhs in grammar_productions.get(next_sym, []):
-                                if add_state(i, (next_sym, prod_rhs, 0, i)):
-                                    changed = True
-                        
-                        # SCAN
-                        elif i < n and self.symbols.is_terminal(next_sym) and tokens[i] == next_sym:
-                            add_state(i + 1, (lhs, rhs, dot + 1, start_pos))
-                    
-                    else:
-                        # COMPLETE
-                        for st2 in list(chart[start_pos]):
-                            lhs2, rhs2, dot2, start2 = st2
-                            if dot2 < len(rhs2) and rhs2[dot2] == lhs:
-                                if add_state(i, (lhs2, rhs2, dot2 + 1, start2)):
-                                    changed = True
-        
-        # Verificar aceptación
-        accepted = any(
-            st[0] == self.S and st[2] == len(st[1]) and st[3] == 0
-            for st in chart[n]
-        )
+    def parse_forest(self, string: str) -> Optional[ParseForest]:
+        """
+        Obtiene el bosque compartido de derivaciones (SPPF) de una cadena.
+        Permite contar los árboles (forest.count()) y enumerarlos
+        (forest.trees()) en gramáticas ambiguas.
         
-        return accepted, chart
+        Returns:
+            ParseForest si la cadena es aceptada, None si no
+        """
+        if self.type < 2:
+            raise ValueError("El bosque de derivaciones solo existe para gramáticas Type 2 y 3")
+        accepted, _, forest = self._earley_parse(string, build_forest=True, original=True)
+        return forest if accepted else None
     
-    # ------------------ General parser for type 0/1 ------------------
-    def _parse_general(self, string: str, max_steps: int = 10000) -> Tuple[bool, Optional[dict]]:
-        """FIX: Parser general mejorado para Type 0 y Type 1"""
-        target = string if string else ''
+    def _earley_parse(self, input_string: str, build_forest: bool = False,
+                      original: bool = False, progress: Optional[Progress] = None,
+                      stats: Optional[ParseStats] = None
+                      ) -> Tuple[bool, List[Set[Item]], Optional[ParseForest]]:
+        """
+        Algoritmo Earley con agenda por columna (ver models/earley.py)
+        Estado representado como tupla: (rule_id, dot, start_pos)
         
-        queue = deque([(self.S, [f"Inicio: {self.S}"])])
-        visited = {self.S}
-        steps = 0
+        Args:
+            original: Parsear con la gramática original aunque la normalización esté activa
         
-        # FIX: Poda menos agresiva
-        max_form_length = max(len(target) * 3 + 50, 100)
+        Returns:
+            (accepted, chart, forest) con forest = None si build_forest es False
+        """
+        compiled = self._earley_grammar(original)
+        tokens = compiled.encode(input_string) if input_string else []
+        parser = EarleyParser(compiled, build_forest=build_forest, progress=progress)
+        accepted, chart = self._timed(stats, 'earley', parser.parse, tokens)
+        if stats is not None:
+            stats.use('earley-normalized' if compiled is self._normalized else 'earley')
+            counts = parser.item_counts()
+            stats.predicted += counts["predicted"]
+            stats.scanned += counts["scanned"]
+            stats.completed += counts["completed"]
+            stats.items += counts["items"]
+            stats.frontier_peak = max(stats.frontier_peak, counts["largest_column"])
+        forest = None
+        if build_forest:
+            forest = ParseForest(compiled, chart, parser.links, tokens, parser.leo_items)
+        return accepted, chart, forest
+    
+    def _earley_grammar(self, original: bool = False) -> CompiledGrammar:
+        """Gramática compilada sobre la que corre Earley (normalizada si está activa)"""
+        if self.use_normalized and not original:
+            return self.get_normalized()
+        return self.get_compiled()
+    
+    # ------------------ Conjuntos FIRST / FOLLOW (Type 2/3) ------------------
+    def first_sets(self) -> Dict[str, Set[str]]:
+        """
+        FIRST de cada no terminal: terminales con que empiezan sus cadenas;
+        incluye 'ε' si el no terminal es anulable.
+        """
+        compiled = self._sets_grammar()
+        result = {}
+        for a in range(compiled.n_nonterminals):
+            first = self._mask_names(compiled, compiled.first[a])
+            if a in compiled.nullable:
+                first.add('ε')
+            result[compiled.symbols[a]] = first
+        return result
+    
+    def follow_sets(self) -> Dict[str, Set[str]]:
+        """FOLLOW de cada no terminal; '$' representa el fin de la entrada"""
+        compiled = self._sets_grammar()
+        follow = compiled.compute_follow()
+        return {compiled.symbols[a]: self._mask_names(compiled, mask)
+                for a, mask in enumerate(follow)}
+    
+    def _sets_grammar(self) -> CompiledGrammar:
+        if self.type < 2:
+            raise ValueError("Los conjuntos FIRST/FOLLOW requieren una gramática Type 2 o Type 3")
+        return self.get_compiled()
+    
+    @staticmethod
+    def _mask_names(compiled: CompiledGrammar, mask: int) -> Set[str]:
+        """Nombres de los terminales de una máscara (end_bit como '$')"""
+        names = set()
+        if mask & compiled.end_bit:
+            names.add('$')
+            mask ^= compiled.end_bit
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            names.add(compiled.symbols[low.bit_length() - 1])
+        return names
+    
+    # ------------------ Motor CYK (Type 2/3) ------------------
+    def get_cnf(self) -> CNFGrammar:
+        """Obtiene (y cachea) la forma normal de Chomsky para el motor CYK"""
+        if self._cnf is None:
+            if self.type < 2:
+                raise ValueError("Solo las gramáticas Type 2 y 3 tienen forma normal de Chomsky")
+            self._cnf = CNFGrammar(self.get_compiled())
+        return self._cnf
+    
+    def _cyk_parse(self, input_string: str, stats: Optional[ParseStats] = None
+                   ) -> Tuple[bool, CYKParser]:
+        """CYK con máscaras de bits sobre la CNF cacheada (ver models/cyk.py)"""
+        parser = CYKParser(self.get_cnf())
+        tokens = self.get_compiled().encode(input_string) if input_string else []
+        accepted = self._timed(stats, 'cyk', parser.parse, tokens)
+        if stats is not None:
+            stats.use('cyk')
+            stats.cells += parser.filled_cells()
+        return accepted, parser
+    
+    def _parse_cyk(self, string: str, stats: Optional[ParseStats] = None
+                   ) -> Tuple[bool, Optional[dict]]:
+        """Parser CYK: la derivación se reconstruye sobre las producciones originales"""
+        accepted, parser = self._cyk_parse(string, stats)
+        tree = self._timed(stats, 'tree', parser.tree) if accepted else None
+        derivations = []
+        if tree is not None:
+            derivations = Derivation(self.S, tree.derivation_steps(), Derivation.LEFTMOST, string)
         
-        while queue and steps < max_steps:
-            steps += 1
-            form, derivation = queue.popleft()
-            
-            if form == target:
-                tree = self._build_linear_tree(derivation)
-                return True, tree
-            
-            # Aplicar todas las producciones posibles
-            for prod in self.productions:
-                left = prod.left
-                pos = 0
-                
-                while pos <= len(form) - len(left):
-                    if form[pos:pos + len(left)] == left:
-                        for right in prod.rights:
-                            if right == 'ε':
-                                new_form = form[:pos] + form[pos + len(left):]
-                            else:
-                                new_form = form[:pos] + right + form[pos + len(left):]
-                            
-                            # Poda mejorada
-                            if len(new_form) <= max_form_length:
-                                if new_form not in visited:
-                                    visited.add(new_form)
-                                    new_deriv = derivation + [f"{left} → {right} ⇒ {new_form}"]
-                                    queue.append((new_form, new_deriv))
-                    pos += 1
-        
-        return False, None
+        info = {
+            "type": "cyk",
+            "input": string,
+            "accepted": accepted,
+            "cnf_nonterminals": len(parser.cnf),
+            "filled_cells": parser.filled_cells(),
+            "derivations": derivations,
+            "tree": tree
+        }
+        return accepted, info
+    
+    # ------------------ General parser for type 0/1 ------------------
+    def configure_search(self, strategy: Optional[str] = None,
+                         max_steps: Optional[int] = None) -> 'Grammar':
+        """
+        Configura la búsqueda de derivaciones de Type 0/1.
+        
+        Args:
+            strategy: 'best-first' (por defecto), 'bfs' o 'bidirectional'
+            max_steps: Máximo de formas sentenciales expandidas por cadena
+        """
+        if strategy is not None:
+            if strategy not in SententialSearch.STRATEGIES:
+                raise ValueError(f"Estrategia de búsqueda desconocida '{strategy}' "
+                                 f"(opciones: {', '.join(SententialSearch.STRATEGIES)})")
+            self.search_strategy = strategy
+        if max_steps is not None:
+            if max_steps < 1:
+                raise ValueError("El máximo de pasos de búsqueda debe ser positivo")
+            self.max_search_steps = max_steps
+        return self
+    
+    def _parse_general(self, string: str, max_steps: Optional[int] = None,
+                       progress: Optional[Progress] = None,
+                       stats: Optional[ParseStats] = None) -> Tuple[bool, dict]:
+        """
+        Parser general para Type 0 y Type 1: búsqueda sobre formas
+        sentenciales (ver models/search.py). El resultado incluye las
+        estadísticas de la búsqueda, también cuando la cadena se rechaza.
+        """
+        target = string if string else ''
+        search = SententialSearch(self.S, self.get_matcher(),
+                                  self.symbols.terminals, self.type == 1,
+                                  strategy=self.search_strategy,
+                                  max_steps=max_steps or self.max_search_steps,
+                                  progress=progress)
+        node = search.run(target)
+        if stats is not None:
+            stats.use(search.strategy)
+            stats.add_phase('search', search.elapsed)
+            stats.expanded += search.expanded + search.expanded_backward
+            stats.visited += search.visited
+            stats.frontier_peak = max(stats.frontier_peak, search.frontier_peak)
+            if search.budget_exhausted:
+                stats.budget_exhausted += 1
+        
+        if node is None:
+            info = self._build_linear_tree([])
+        else:
+            info = self._build_linear_tree(self._timed(
+                stats, 'tree', self._rebuild_derivation,
+                node, search.forms, search.parents, search.rules))
+        info["search"] = search.stats()
+        return node is not None, info
+    
+    def _rebuild_derivation(self, node: int, forms: List[str], parents: List[int],
+                            rules: List[Optional[Tuple[str, str]]]) -> Derivation:
+        """Reconstruye la derivación del nodo aceptado siguiendo los padres"""
+        steps = []
+        while parents[node] != -1:
+            left, right = rules[node]
+            steps.append((left, right, forms[node]))
+            node = parents[node]
+        steps.reverse()
+        return Derivation(self.S, steps, Derivation.REWRITE)
     
     # ------------------ Helpers ------------------
-    def _build_linear_tree(self, derivation: List[str]) -> dict:
+    def _build_linear_tree(self, derivation: Sequence[str]) -> dict:
         """Construye representación simple de derivación lineal"""
         return {
             "symbol": self.S,
@@ -506,72 +876,136 @@ class Grammar:
             "type": "linear"
         }
     
-    def generate_strings(self, n: int = 10, max_length: int = 30) -> List[str]:
+    def get_enumerator(self) -> LanguageEnumerator:
+        """
+        Obtiene (y cachea) el enumerador por longitud de una gramática Type 2/3.
+        Las regulares usan su DFA mínimo, así que sus conteos son exactos
+        (salvo que el DFA exceda DFA_STATE_LIMIT).
+        """
+        if self._enumerator is None:
+            if self.type == 3 and not isinstance(self._type3_automaton(), BitNFA):
+                self._enumerator = LanguageEnumerator.from_dfa(self.get_dfa())
+            elif self.type >= 2:
+                # Sin DFA (demasiados estados) se cuenta sobre la gramática:
+                # los conteos son de derivaciones, como en Type 2
+                self._enumerator = LanguageEnumerator.from_compiled(self.get_compiled())
+            else:
+                raise ValueError("La enumeración por longitud requiere una gramática Type 2 o Type 3")
+        return self._enumerator
+    
+    def iter_strings(self, max_length: Optional[int] = None) -> Iterator[str]:
+        """
+        Genera perezosamente las cadenas del lenguaje en orden shortlex
+        (por longitud y luego alfabético), sin repetidos. La cadena vacía es ''.
+        """
+        return self.get_enumerator().iter_strings(max_length)
+    
+    def count_strings(self, length: int) -> int:
+        """
+        Cantidad de cadenas de exactamente esa longitud. Exacta para Type 3 y
+        para gramáticas no ambiguas; en gramáticas ambiguas cuenta derivaciones
+        (cota superior).
+        """
+        return self.get_enumerator().count(length)
+    
+    def sample(self, length: int, k: int = 1, seed: Optional[int] = None) -> List[str]:
+        """
+        Devuelve k cadenas de exactamente esa longitud, elegidas al azar de
+        forma uniforme (con reemplazo). Uniforme sobre las cadenas en Type 3 y
+        en gramáticas no ambiguas; en las ambiguas, sobre las derivaciones.
+        
+        Raises:
+            ValueError: Si el lenguaje no tiene cadenas de esa longitud
+        """
+        return list(islice(self.iter_samples(length, seed), k))
+    
+    def iter_samples(self, length: int, seed: Optional[int] = None) -> Iterator[str]:
+        """Flujo infinito de muestras (modo por lotes, reutiliza las tablas)"""
+        return self.get_enumerator().samples(length, seed)
+    
+    def generate_strings(self, n: int = 10, max_length: int = 30,
+                         progress: Optional[Progress] = None) -> List[str]:
         """
-        FIX: Generación mejorada de cadenas válidas
+        Genera las n cadenas válidas más cortas (orden shortlex).
+        Type 2/3 usan el enumerador por longitud; Type 0/1 una búsqueda sobre
+        formas sentenciales, de la más corta a la más larga.
         """
+        strings = self.iter_generated(n, max_length, progress)
+        if self.type >= 2:
+            return list(strings)
+        return sorted(strings, key=lambda x: (len(x), x))
+    
+    def iter_generated(self, n: int = 10, max_length: int = 30,
+                       progress: Optional[Progress] = None) -> Iterator[str]:
+        """
+        Las cadenas de generate_strings() a medida que se encuentran ('ε' para
+        la vacía). Salen en orden shortlex salvo en Type 0, donde una regla
+        que contrae puede producir después una cadena más corta.
+        
+        Raises:
+            ParseCancelled: Si se canceló a través de progress
+        """
+        if self.type >= 2:
+            for count, s in enumerate(islice(self.iter_strings(max_length), n), 1):
+                if progress is not None:
+                    progress.report(phase="generate", generated=count)
+                yield s if s else 'ε'
+            return
+        
+        # Las formas más cortas primero: en Type 1 (no contraen) las cadenas
+        # aparecen por longitud creciente
         strings: Set[str] = set()
-        queue = deque([self.S])
+        heap = [(len(self.S), self.S)]
         visited = {self.S}
         max_iter = 50000
         it = 0
+        successors = self.get_matcher().successors
         
-        while len(strings) < n and queue and it < max_iter:
+        while len(strings) < n and heap and it < max_iter:
             it += 1
-            current = queue.popleft()
+            if progress is not None and not it & 255:
+                progress.report(phase="generate", generated=len(strings), expanded=it,
+                                frontier=len(heap))
+            _, current = heapq.heappop(heap)
             
             # Si es terminal o epsilon, agregar
-            if self.symbols.all_terminals(current) or current == 'ε':
-                cleaned = current.replace('ε', '')
-                if not cleaned:
-                    cleaned = 'ε'
-                strings.add(cleaned)
-                if len(strings) >= n:
-                    break
+            if self.symbols.all_terminals(current):
+                s = current if current else 'ε'
+                if s not in strings:
+                    strings.add(s)
+                    yield s
                 continue
             
-            # Aplicar producciones
-            for prod in self.productions:
-                left = prod.left
-                pos = 0
-                
-                while pos <= len(current) - len(left):
-                    if current[pos:pos + len(left)] == left:
-                        for right in prod.rights:
-                            if right == 'ε':
-                                new_form = current[:pos] + current[pos + len(left):]
-                            else:
-                                new_form = current[:pos] + right + current[pos + len(left):]
-                            
-                            # FIX: Evitar duplicados y controlar longitud
-                            if new_form not in visited and len(new_form) <= max_length:
-                                visited.add(new_form)
-                                queue.append(new_form)
-                                break  # Solo una sustitución por iteración
-                    pos += 1
-                    break  # Solo primera ocurrencia
-        
-        # Convertir a lista ordenada
-        result = sorted(list(strings), key=lambda x: (len(x), x))
-        return result[:n]
+            # Aplicar todas las producciones en todos sus sitios
+            for new_form, _, _ in successors(current):
+                if new_form not in visited and len(new_form) <= max_length:
+                    visited.add(new_form)
+                    heapq.heappush(heap, (len(new_form), new_form))
     
     def visualize_tree(self, tree: Optional[dict], level: int = 0) -> str:
         """Genera una representación textual del árbol de derivación"""
         if not tree:
             return "No hay árbol de derivación"
+        return ''.join(line + "\n" for line in self.render_tree(tree))
+    
+    def render_tree(self, info: Optional[dict]) -> Iterator[str]:
+        """
+        Las líneas de visualize_tree() a medida que se piden (sin salto
+        final), para mostrar derivaciones largas por páginas.
+        """
+        return TreeRenderer(self).lines(info)
+    
+    def export_tree(self, info: Optional[dict], target: Union[str, IO[str]],
+                    fmt: str = 'sexpr') -> int:
+        """
+        Escribe el árbol de derivación de un resultado de parse() en un
+        archivo: 'sexpr' (S-expresión), 'tsv' (un nodo por línea) o 'steps'
+        (pasos de la derivación). Ver models/render.py.
         
-        result = f"Tipo de gramática: {self.get_type_name()}\n\n"
-        result += "Derivación:\n"
-        result += "=" * 50 + "\n"
-        
-        derivations = tree.get('derivations', [])
-        if derivations:
-            for i, step in enumerate(derivations, 1):
-                result += f"{i}. {step}\n"
-        else:
-            result += "(No se pudo generar el historial de derivación)\n"
-        
-        return result
+        Returns:
+            Cantidad de caracteres escritos
+        """
+        return TreeRenderer(self).export(info, target, fmt)
     
     # ------------------ Persistence ------------------
     def save(self, filename: str):
@@ -0,0 +1,248 @@
+# models/normalize.py
+from typing import Dict, List, Optional, Set, Tuple
+
+from models.compiled_grammar import CompiledGrammar
+from models.earley import SCANNED, NULLED
+from models.forest import ParseForest, ParseTree
+
+# Paso original: (regla de la gramática original, posiciones de su rhs conservadas)
+Step = Tuple[int, Tuple[int, ...]]
+
+
+class NormalizedGrammar(CompiledGrammar):
+    """
+    Forma normalizada y equivalente de una gramática libre de contexto.
+
+    A partir de la gramática compilada original:
+      1. Quita de los lados derechos los no terminales que solo derivan ε
+         (los demás anulables los salta el parser Earley al predecir).
+      2. Colapsa las cadenas unitarias A → B → ... → C a través de los no
+         terminales que solo sirven de puente.
+      3. Poda los símbolos inútiles (no productivos o no alcanzables).
+
+    Comparte la tabla de símbolos con la original, así que encode() y los ids
+    de terminales no cambian. Cada regla nueva recuerda los pasos originales
+    que resume (origins), y tree() reconstruye a partir del bosque normalizado
+    el árbol sobre las producciones originales.
+    """
+
+    def __init__(self, base: CompiledGrammar):
+        """
+        Args:
+            base: Gramática precompilada original (Type 2/3)
+        """
+        # No se llama a CompiledGrammar.__init__: los símbolos se comparten
+        self.base = base
+        self.symbols = base.symbols
+        self.ids = base.ids
+        self.n_nonterminals = base.n_nonterminals
+        self.nonterminal_mask = base.nonterminal_mask
+        self.terminal_mask = base.terminal_mask
+        self.start = base.start
+        self.rewrites = base.rewrites
+
+        self.rules: List[Tuple[int, Tuple[int, ...]]] = []
+        self.rule_labels: List[str] = []
+        self.alternatives: List[List[int]] = [[] for _ in range(self.n_nonterminals)]
+        # origins[r] = pasos originales que resume la regla r (en orden)
+        self.origins: List[Tuple[Step, ...]] = []
+        self.productive: Set[int] = set()
+        self.reachable: Set[int] = set()
+        self._build()
+
+        self.nullable_rule: Dict[int, int] = {}
+        self.nullable: Set[int] = self._compute_nullable()
+        self.nullable_mask = 0
+        for sym in self.nullable:
+            self.nullable_mask |= 1 << sym
+        self._compute_first()
+
+    def _build(self):
+        base = self.base
+        n_nt = self.n_nonterminals
+
+        # 1. Los símbolos que solo derivan ε desaparecen de los lados derechos.
+        # Los anulables que también derivan cadenas no vacías se conservan: el
+        # parser ya los salta al predecir, y expandir sus 2^k variantes
+        # multiplicaría los items de cada columna.
+        empty_only = self._empty_only()
+        variants: List[List[Tuple[Tuple[int, ...], Step]]] = [[] for _ in range(n_nt)]
+        for r, (lhs, rhs) in enumerate(base.rules):
+            kept = tuple(p for p, sym in enumerate(rhs) if sym not in empty_only)
+            variants[lhs].append((tuple(rhs[p] for p in kept), (r, kept)))
+
+        # 2. Cadenas unitarias. Un símbolo "privado" (solo aparece como destino
+        # unitario de un único no terminal) se disuelve en su padre; los demás
+        # se conservan como A → B: copiar sus alternativas haría que Earley
+        # predijera ambas copias en la misma columna.
+        unit_parents: Dict[int, Set[int]] = {}
+        shared: Set[int] = {self.start}
+        for a in range(n_nt):
+            for rhs, _ in variants[a]:
+                if len(rhs) == 1:
+                    if rhs[0] < n_nt:
+                        unit_parents.setdefault(rhs[0], set()).add(a)
+                else:
+                    shared.update(sym for sym in rhs if sym < n_nt)
+        private = {b for b, parents in unit_parents.items()
+                   if b not in shared and len(parents) == 1}
+
+        candidates: List[Tuple[int, Tuple[int, ...], Tuple[Step, ...]]] = []
+        seen: Set[Tuple[int, Tuple[int, ...]]] = set()
+        for a in range(n_nt):
+            chains: Dict[int, Tuple[Step, ...]] = {a: ()}
+            order = [a]
+            for b in order:
+                for rhs, step in variants[b]:
+                    chain = chains[b] + (step,)
+                    if len(rhs) == 1 and rhs[0] < n_nt:
+                        target = rhs[0]
+                        if target in chains:
+                            continue
+                        if target in private:
+                            chains[target] = chain
+                            order.append(target)
+                            continue
+                    if (a, rhs) not in seen:
+                        seen.add((a, rhs))
+                        candidates.append((a, rhs, chain))
+
+        # 3. Poda de símbolos no productivos y no alcanzables
+        productive: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs, _ in candidates:
+                if lhs not in productive and all(s >= n_nt or s in productive for s in rhs):
+                    productive.add(lhs)
+                    changed = True
+        by_lhs: List[List[int]] = [[] for _ in range(n_nt)]
+        for i, (lhs, rhs, _) in enumerate(candidates):
+            if all(s >= n_nt or s in productive for s in rhs):
+                by_lhs[lhs].append(i)
+
+        reachable: Set[int] = set()
+        if self.start in productive:
+            reachable.add(self.start)
+            stack = [self.start]
+            while stack:
+                for i in by_lhs[stack.pop()]:
+                    for sym in candidates[i][1]:
+                        if sym < n_nt and sym not in reachable:
+                            reachable.add(sym)
+                            stack.append(sym)
+        self.productive = productive
+        self.reachable = reachable
+
+        for a in sorted(reachable):
+            for i in by_lhs[a]:
+                lhs, rhs, origin = candidates[i]
+                right = "".join(self.symbols[s] for s in rhs) if rhs else "ε"
+                self.alternatives[lhs].append(len(self.rules))
+                self.rules.append((lhs, rhs))
+                self.rule_labels.append(f"{self.symbols[lhs]} → {right}")
+                self.origins.append(origin)
+
+    def _empty_only(self) -> Set[int]:
+        """No terminales anulables que no derivan ninguna cadena no vacía"""
+        base = self.base
+        n_nt = self.n_nonterminals
+        # Punto fijo: A deriva algo no vacío si una regla tiene un terminal o
+        # un no terminal que a su vez deriva algo no vacío
+        nonempty: Set[int] = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in base.rules:
+                if lhs in nonempty:
+                    continue
+                if any(sym >= n_nt or sym in nonempty for sym in rhs) and \
+                        all(sym >= n_nt or sym in base.nullable or sym in nonempty for sym in rhs):
+                    nonempty.add(lhs)
+                    changed = True
+        return base.nullable - nonempty
+
+    # ------------------ Árboles sobre la gramática original ------------------
+    def tree(self, forest: ParseForest) -> Optional[ParseTree]:
+        """
+        Extrae un árbol del bosque normalizado (primer back-pointer, como
+        ParseForest.tree) y lo expresa con las producciones originales:
+        reinserta los pasos unitarios y los subárboles ε eliminados.
+        """
+        symbol, start, end = forest.root()
+        families = forest.families(symbol, start, end)
+        if not families:
+            return None
+
+        names = self.symbols
+        first_link = forest.first_link
+        tree = ParseTree()
+        root = tree.add_node(names[symbol], self._top_label(families[0]), start, end)
+        stack = [(root, families[0], start, end)]
+
+        while stack:
+            node, rule, s, e = stack.pop()
+            rhs = self.rules[rule][1]
+            kids = [0] * len(rhs)
+            dot, pos = len(rhs), e
+            while dot > 0:
+                k, child = first_link(pos, (rule, dot, s))
+                sym = rhs[dot - 1]
+                if child == SCANNED:
+                    kids[dot - 1] = tree.add_node(names[sym], None, k, pos)
+                elif child == NULLED:
+                    kids[dot - 1] = self._add_epsilon(tree, sym, pos)
+                else:
+                    sub = tree.add_node(names[sym], self._top_label(child), k, pos)
+                    stack.append((sub, child, k, pos))
+                    kids[dot - 1] = sub
+                dot -= 1
+                pos = k
+            self._expand(tree, node, rule, s, e, kids)
+
+        return tree
+
+    def _top_label(self, rule: int) -> str:
+        """Producción original con la que empieza la regla normalizada"""
+        return self.base.rule_labels[self.origins[rule][0][0]]
+
+    def _expand(self, tree: ParseTree, node: int, rule: int, start: int, end: int,
+                kids: List[int]):
+        """Cuelga de node los pasos originales de la regla normalizada"""
+        base = self.base
+        names = self.symbols
+        origin = self.origins[rule]
+        current = node
+        for i, (orig, kept) in enumerate(origin):
+            rhs = base.rules[orig][1]
+            children = []
+            if i + 1 < len(origin):
+                # Paso unitario: el símbolo conservado cubre todo [start, end)
+                (keep,) = kept
+                nxt = tree.add_node(names[rhs[keep]], base.rule_labels[origin[i + 1][0]], start, end)
+                for p, sym in enumerate(rhs):
+                    if p == keep:
+                        children.append(nxt)
+                    else:
+                        children.append(self._add_epsilon(tree, sym, start if p < keep else end))
+                tree.children[current] = children
+                current = nxt
+            else:
+                cursor = start
+                j = 0
+                for p, sym in enumerate(rhs):
+                    if j < len(kept) and kept[j] == p:
+                        children.append(kids[j])
+                        cursor = tree.spans[kids[j]][1]
+                        j += 1
+                    else:
+                        children.append(self._add_epsilon(tree, sym, cursor))
+                tree.children[current] = children
+
+    def _add_epsilon(self, tree: ParseTree, symbol: int, pos: int) -> int:
+        """Agrega el árbol ε canónico (gramática original) de un no terminal anulable"""
+        base = self.base
+        rule = base.nullable_rule[symbol]
+        node = tree.add_node(self.symbols[symbol], base.rule_labels[rule], pos, pos)
+        tree.children[node] = [self._add_epsilon(tree, sym, pos) for sym in base.rules[rule][1]]
+        return node
@@ -1,5 +1,5 @@
 # models/production.py
-from typing import List, Set, Optional
+from typing import Callable, List, Set, Optional
 
 class Production:
     """
@@ -20,16 +20,33 @@ class Production:
         
         self.left = left
         self.rights = list(rights) if rights else []
+        
+        # Funciones a llamar cuando cambian los lados derechos (ver on_change)
+        self._listeners: List[Callable[['Production'], None]] = []
+    
+    def on_change(self, listener: Callable[['Production'], None]):
+        """
+        Registra una función que se llama con la producción cada vez que
+        add_right/remove_right la modifican (la gramática la usa para
+        descartar lo que precompiló).
+        """
+        self._listeners.append(listener)
+    
+    def _changed(self):
+        for listener in self._listeners:
+            listener(self)
     
     def add_right(self, right: str):
         """Añade una alternativa al lado derecho de la producción"""
         if right and right not in self.rights:
             self.rights.append(right)
+            self._changed()
     
     def remove_right(self, right: str):
         """Elimina una alternativa del lado derecho"""
         if right in self.rights:
             self.rights.remove(right)
+            self._changed()
     
     def has_epsilon(self) -> bool:
         """Verifica si la producción genera epsilon (ε)"""
@@ -0,0 +1,42 @@
+# models/progress.py
+from typing import Any, Dict
+
+
+class ParseCancelled(Exception):
+    """La operación se detuvo porque se pidió Progress.cancel()"""
+
+
+class Progress:
+    """
+    Canal entre una operación larga (parse, generación) y quien la observa
+    desde otro hilo, típicamente la interfaz.
+
+    La operación llama a report() cada tanto con sus contadores (formas
+    expandidas, tamaño de la frontera, columna del chart...); ahí mismo se
+    revisa si se pidió cancelar. El observador lee snapshot() y llama a
+    cancel() cuando quiere. Los contadores se reemplazan por un diccionario
+    nuevo en cada reporte, así que leerlos desde otro hilo no requiere locks.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.counters: Dict[str, Any] = {}
+
+    def cancel(self):
+        """Pide detener la operación en su próximo reporte"""
+        self.cancelled = True
+
+    def report(self, **counters: Any):
+        """
+        Publica el estado actual de la operación.
+
+        Raises:
+            ParseCancelled: Si se pidió cancelar
+        """
+        self.counters = counters
+        if self.cancelled:
+            raise ParseCancelled()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Último estado publicado"""
+        return self.counters
@@ -0,0 +1,98 @@
+# models/recognizer.py
+from typing import Optional
+
+from models.earley import EarleyParser
+
+
+class PrefixRecognizer:
+    """
+    Reconocedor por empuje: la entrada llega en trozos (feed) y después de
+    cada uno se sabe si lo leído todavía puede completarse a una cadena del
+    lenguaje, sin esperar al final.
+
+    Type 3: solo guarda el estado actual del autómata (DFA mínimo o NFA
+    bit-paralelo), así que la memoria no depende del largo de la entrada.
+    Ambos autómatas descartan los estados desde los que no se llega a
+    aceptación, de modo que el estado muerto aparece en cuanto el prefijo
+    deja de ser viable.
+
+    Type 2: agrega columnas al chart de Earley (EarleyParser.extend) sobre la
+    gramática normalizada. Sin símbolos inútiles, cada estado del chart puede
+    completarse, así que el prefijo es viable mientras el SCAN no deje una
+    columna vacía.
+    """
+
+    def __init__(self, grammar):
+        """
+        Args:
+            grammar: Gramática Type 2 o Type 3
+        """
+        if grammar.type < 2:
+            raise ValueError("El reconocimiento por prefijos requiere una gramática Type 2 o Type 3")
+        self.grammar = grammar
+        self._parser: Optional[EarleyParser] = None
+        if grammar.type == 3:
+            self._automaton = grammar._type3_automaton()
+        else:
+            self._compiled = grammar.get_normalized()
+            self._parser = EarleyParser(self._compiled)
+        self.reset()
+
+    def reset(self):
+        """Vuelve al inicio para reconocer otra entrada"""
+        # Caracteres leídos y posición del primero que hizo inviable el prefijo
+        # (0 si el lenguaje es vacío y ni siquiera ε es viable)
+        self.consumed = 0
+        self.rejected_at: Optional[int] = None
+        if self._parser is None:
+            self._state = self._automaton.start
+            viable = self._state is not None
+        else:
+            compiled = self._compiled
+            self._accepted, _ = self._parser.parse([])
+            # La forma normalizada solo conserva S si genera alguna cadena
+            viable = bool(compiled.alternatives[compiled.start])
+        if not viable:
+            self.rejected_at = 0
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Lee el siguiente trozo de la entrada. Una vez que el prefijo dejó de
+        ser viable el resto se ignora.
+
+        Returns:
+            True si lo leído hasta ahora sigue siendo un prefijo viable
+        """
+        if self.rejected_at is not None:
+            self.consumed += len(chunk)
+            return False
+        if not chunk:
+            return True
+
+        if self._parser is None:
+            self._state, read = self._automaton.advance(self._state, chunk)
+            if self._state is None:
+                self.rejected_at = self.consumed + read
+        else:
+            parser = self._parser
+            self._accepted, chart = parser.extend(self._compiled.encode(chunk))
+            if not chart[-1]:
+                # Rechazo temprano: el SCAN de tokens[len(chart) - 2] dejó la
+                # última columna vacía (un token por carácter)
+                self._accepted = False
+                self.rejected_at = len(chart) - 2
+
+        self.consumed += len(chunk)
+        return self.rejected_at is None
+
+    def is_viable_prefix(self) -> bool:
+        """Verifica si alguna continuación de lo leído pertenece al lenguaje"""
+        return self.rejected_at is None
+
+    def accepts(self) -> bool:
+        """Verifica si lo leído hasta ahora pertenece al lenguaje"""
+        if self.rejected_at is not None:
+            return False
+        if self._parser is None:
+            return self._automaton.is_final(self._state)
+        return self._accepted
@@ -0,0 +1,210 @@
+# models/render.py
+from itertools import chain
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from models.derivation import Derivation
+from models.forest import ParseTree
+
+
+class TreeRenderer:
+    """
+    Renderizado por partes del resultado de un parse.
+
+    lines() produce el texto de visualize_tree línea por línea, así que una
+    derivación de miles de pasos se puede mostrar por páginas sin armar la
+    cadena completa. export() escribe el árbol de derivación real a un
+    archivo, por bloques y sin recursión:
+
+      - 'sexpr': una S-expresión en una línea, (S (L a) (T (L b))); los
+        no terminales que derivan ε quedan como (A). Los caracteres ( ) \\
+        y los espacios se escapan con \\.
+      - 'tsv': un nodo por línea en preorden: profundidad, símbolo, inicio,
+        fin y producción.
+      - 'steps': los pasos de la derivación, uno por línea (el único formato
+        para Type 0/1, donde no hay árbol).
+    """
+
+    FORMATS = ('sexpr', 'tsv', 'steps')
+
+    # Tamaño aproximado de cada escritura al exportar
+    CHUNK = 1 << 16
+
+    def __init__(self, grammar):
+        """
+        Args:
+            grammar: Gramática que produjo los resultados
+        """
+        self.grammar = grammar
+
+    def lines(self, info: Optional[dict]) -> Iterator[str]:
+        """Líneas (sin salto final) de visualize_tree"""
+        if not info:
+            yield "No hay árbol de derivación"
+            return
+        yield f"Tipo de gramática: {self.grammar.get_type_name()}"
+        yield ""
+        yield "Derivación:"
+        yield "=" * 50
+
+        derivations = info.get('derivations', [])
+        if derivations:
+            for i, step in enumerate(derivations, 1):
+                yield f"{i}. {step}"
+        else:
+            yield "(No se pudo generar el historial de derivación)"
+
+        search = info.get('search')
+        if search:
+            yield ""
+            yield (f"Búsqueda {search['strategy']}: {search['expanded']} formas expandidas "
+                   f"en {search['seconds']:.3f} s ({search['nodes_per_second']:.0f} nodos/s)")
+
+    def parse_tree(self, info: Optional[dict]) -> Optional[ParseTree]:
+        """
+        Árbol de derivación del resultado: el de Earley/CYK, o reconstruido a
+        partir de la derivación lineal de Type 3. None en Type 0/1.
+        """
+        if not info:
+            return None
+        tree = info.get('tree')
+        if isinstance(tree, ParseTree):
+            return tree
+        derivations = info.get('derivations')
+        if (self.grammar.type == 3 and isinstance(derivations, Derivation)
+                and derivations.kind == Derivation.PRODUCTION and derivations.steps):
+            return self._tree_from_steps(derivations.steps)
+        return None
+
+    def _tree_from_steps(self, steps: Iterable[str]) -> ParseTree:
+        """
+        Arma el árbol de una derivación más a la izquierda dada por etiquetas
+        "A → α": cada paso expande el primer no terminal pendiente.
+        """
+        nonterminals = self.grammar.symbols.nonterminals
+        tree = ParseTree()
+        tree.add_node(self.grammar.S, None, 0, 0)
+        pending = [0]
+        for label in steps:
+            node = pending.pop()
+            left, right = label.split(' → ', 1)
+            tree.productions[node] = label
+            if right == 'ε':
+                continue
+            kids = [tree.add_node(ch, None, 0, 0) for ch in right]
+            tree.children[node] = kids
+            pending.extend(kid for kid, ch in zip(reversed(kids), reversed(right))
+                           if ch in nonterminals)
+
+        # Spans: las hojas (terminales) en preorden son las posiciones de la
+        # cadena; en orden inverso cada nodo termina donde termina su último hijo
+        order = list(tree.preorder())
+        starts = [0] * len(tree)
+        pos = 0
+        for node in order:
+            starts[node] = pos
+            if tree.productions[node] is None:
+                pos += 1
+        for node in reversed(order):
+            kids = tree.children[node]
+            if kids:
+                end = tree.spans[kids[-1]][1]
+            else:
+                end = starts[node] + (tree.productions[node] is None)
+            tree.spans[node] = (starts[node], end)
+        return tree
+
+    @staticmethod
+    def _escape(symbol: str) -> str:
+        if symbol in '()\\' or symbol.isspace():
+            return '\\' + symbol
+        return symbol
+
+    def sexpr_chunks(self, tree: ParseTree) -> Iterator[str]:
+        """S-expresión del árbol, en fragmentos"""
+        if not len(tree):
+            return
+        symbols = tree.symbols
+        productions = tree.productions
+        children = tree.children
+        escape = self._escape
+        # node >= 0: abrir el nodo; ~node: cerrarlo
+        stack = [0]
+        first = True
+        while stack:
+            node = stack.pop()
+            if node < 0:
+                yield ")"
+                continue
+            prefix = "" if first else " "
+            first = False
+            if productions[node] is None:
+                yield prefix + escape(symbols[node])
+            elif not children[node]:
+                yield f"{prefix}({escape(symbols[node])})"
+            else:
+                yield f"{prefix}({escape(symbols[node])}"
+                stack.append(~node)
+                stack.extend(reversed(children[node]))
+
+    def tsv_lines(self, tree: ParseTree) -> Iterator[str]:
+        """Un nodo por línea: profundidad, símbolo, inicio, fin, producción"""
+        if not len(tree):
+            return
+        symbols = tree.symbols
+        productions = tree.productions
+        spans = tree.spans
+        children = tree.children
+        stack = [(0, 0)]
+        while stack:
+            node, depth = stack.pop()
+            start, end = spans[node]
+            yield f"{depth}\t{symbols[node]}\t{start}\t{end}\t{productions[node] or ''}"
+            stack.extend((child, depth + 1) for child in reversed(children[node]))
+
+    def export(self, info: Optional[dict], target: Union[str, IO[str]],
+               fmt: str = 'sexpr') -> int:
+        """
+        Escribe el resultado de un parse aceptado en target (ruta o archivo abierto).
+
+        Returns:
+            Cantidad de caracteres escritos
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Formato de exportación desconocido '{fmt}' "
+                             f"(opciones: {', '.join(self.FORMATS)})")
+        if not info:
+            raise ValueError("No hay derivación para exportar")
+        if fmt == 'steps':
+            parts = (line + "\n" for line in info.get('derivations', []))
+        else:
+            tree = self.parse_tree(info)
+            if tree is None:
+                raise ValueError("Este resultado no tiene árbol de derivación "
+                                 "(Type 0/1: exporte los pasos con 'steps')")
+            if fmt == 'sexpr':
+                parts = chain(self.sexpr_chunks(tree), ("\n",))
+            else:
+                parts = (line + "\n" for line in self.tsv_lines(tree))
+
+        if isinstance(target, str):
+            with open(target, 'w', encoding='utf-8') as f:
+                return self._write(f, parts)
+        return self._write(target, parts)
+
+    def _write(self, f: IO[str], parts: Iterable[str]) -> int:
+        """Escribe los fragmentos agrupados en bloques de ~CHUNK caracteres"""
+        written = 0
+        buffer = []
+        size = 0
+        for part in parts:
+            buffer.append(part)
+            size += len(part)
+            if size >= self.CHUNK:
+                f.write(''.join(buffer))
+                written += size
+                buffer = []
+                size = 0
+        if buffer:
+            f.write(''.join(buffer))
+            written += size
+        return written
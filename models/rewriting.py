@@ -0,0 +1,120 @@
+# models/rewriting.py
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Regla de reescritura de CompiledGrammar: (left, [(reemplazo sin ε, right original)])
+Rewrite = Tuple[str, List[Tuple[str, str]]]
+
+
+class RewriteMatcher:
+    """
+    Núcleo de reescritura de formas sentenciales (Type 0/1): encuentra en una
+    sola pasada todos los sitios (posición, regla) donde se puede aplicar
+    alguna producción.
+
+    Se construye una vez por gramática un autómata de Aho–Corasick sobre los
+    lados izquierdos, ya determinizado (cada estado tiene su transición para
+    cada símbolo que aparece en algún lado izquierdo; el resto vuelve a la
+    raíz), así que recorrer una forma cuesta una búsqueda por carácter más las
+    coincidencias, sin importar cuántas producciones haya.
+    """
+
+    def __init__(self, rewrites: List[Rewrite]):
+        """
+        Args:
+            rewrites: Reglas de reescritura (CompiledGrammar.rewrites)
+        """
+        self.rewrites = rewrites
+
+        # Trie de los lados izquierdos
+        goto: List[Dict[str, int]] = [{}]
+        ends: List[List[int]] = [[]]
+        for index, (left, _) in enumerate(rewrites):
+            state = 0
+            for ch in left:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    ends.append([])
+                state = nxt
+            ends[state].append(index)
+
+        # Enlaces de fallo por niveles (BFS): el enlace de un estado siempre
+        # está a menor profundidad, así que su fila ya está completa
+        alphabet = sorted({ch for left, _ in rewrites for ch in left})
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{}] * len(goto)
+        outputs: List[Tuple[Tuple[int, int], ...]] = [()] * len(goto)
+        delta[0] = {ch: goto[0].get(ch, 0) for ch in alphabet}
+        queue = list(goto[0].values())
+        for state in queue:
+            link = fail[state]
+            outputs[state] = tuple((len(rewrites[i][0]), i) for i in ends[state]) + outputs[link]
+            row = {}
+            for ch in alphabet:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    row[ch] = delta[link][ch]
+                else:
+                    row[ch] = nxt
+                    fail[nxt] = delta[link][ch]
+                    queue.append(nxt)
+            delta[state] = row
+
+        # Solo se guardan las transiciones que no vuelven a la raíz
+        self.delta = [{ch: t for ch, t in row.items() if t} for row in delta]
+        self.outputs = outputs
+        self.n_states = len(goto)
+        self._reverse: Optional['RewriteMatcher'] = None
+
+    def reverse(self) -> 'RewriteMatcher':
+        """
+        Matcher de las reducciones (right → left), construido una sola vez.
+        Sus reglas son (right, [(left, left)]), así que successors() produce
+        (forma reducida, right, left). Las producciones ε no se invierten:
+        habría que adivinar dónde insertar el lado izquierdo.
+        """
+        if self._reverse is None:
+            by_right: Dict[str, List[Tuple[str, str]]] = {}
+            for left, rights in self.rewrites:
+                for replacement, _ in rights:
+                    if replacement:
+                        by_right.setdefault(replacement, []).append((left, left))
+            self._reverse = RewriteMatcher(list(by_right.items()))
+        return self._reverse
+
+    def sites(self, form: str) -> List[Tuple[int, int]]:
+        """
+        Todos los sitios de la forma, en orden de fin de la coincidencia.
+
+        Returns:
+            Lista de (posición, índice en rewrites)
+        """
+        delta = self.delta
+        outputs = self.outputs
+        found: List[Tuple[int, int]] = []
+        state = 0
+        for i, ch in enumerate(form):
+            state = delta[state].get(ch, 0)
+            hits = outputs[state]
+            if hits:
+                end = i + 1
+                for size, index in hits:
+                    found.append((end - size, index))
+        return found
+
+    def successors(self, form: str) -> Iterator[Tuple[str, str, str]]:
+        """
+        Formas que se obtienen de form con un paso de derivación.
+
+        Yields:
+            (nueva forma, left, right original)
+        """
+        rewrites = self.rewrites
+        for pos, index in self.sites(form):
+            left, rights = rewrites[index]
+            prefix = form[:pos]
+            suffix = form[pos + len(left):]
+            for replacement, right in rights:
+                yield prefix + replacement + suffix, left, right
@@ -0,0 +1,352 @@
+# models/search.py
+import heapq
+import re
+import time
+from collections import deque
+from os.path import commonprefix
+from typing import Dict, List, Optional, Set, Tuple
+
+from models.progress import Progress
+from models.rewriting import RewriteMatcher
+
+
+class SententialSearch:
+    """
+    Búsqueda de una derivación S ⇒* cadena para gramáticas Type 0/1,
+    aplicando las reglas de reescritura sobre formas sentenciales.
+
+    Estrategias:
+      - 'best-first': expande primero la forma más prometedora según su
+        distancia en longitud a la cadena y los terminales que ya coinciden
+        con su prefijo y sufijo; a igual distancia, la menos profunda.
+      - 'bfs': anchura, como el parser original (derivación más corta).
+      - 'bidirectional': anchura desde S y, a la vez, reducciones desde la
+        cadena (right → left); termina cuando ambas fronteras se encuentran.
+        En Type 1 las reducciones nunca alargan la forma, así que la mitad
+        hacia atrás ya está acotada por la longitud de la cadena.
+
+    Podas seguras:
+      - Type 1: las reglas no contraen, así que una forma más larga que la
+        cadena nunca la alcanza (y el espacio de búsqueda es finito: agotarlo
+        demuestra el rechazo).
+      - Si ninguna regla puede reescribir los terminales iniciales de una
+        forma (todo lado izquierdo tiene un no terminal y la regla conserva
+        sus terminales iniciales), ese prefijo es definitivo y debe ser
+        prefijo de la cadena. Lo mismo con el sufijo.
+
+    Las formas se guardan en una arena (forma, padre, regla); la frontera y el
+    conjunto de visitados solo manejan índices y cadenas. Los sitios donde se
+    puede aplicar cada regla se encuentran con RewriteMatcher (una pasada).
+    """
+
+    STRATEGIES = ('best-first', 'bfs', 'bidirectional')
+
+    def __init__(self, start: str, matcher: RewriteMatcher,
+                 terminals: Set[str], non_contracting: bool,
+                 strategy: str = 'best-first', max_steps: int = 10000,
+                 progress: Optional[Progress] = None):
+        """
+        Args:
+            start: Símbolo inicial
+            matcher: Núcleo de reescritura de la gramática
+            terminals: Terminales de la gramática
+            non_contracting: True para Type 1 (habilita la poda por longitud)
+            strategy: 'best-first', 'bfs' o 'bidirectional'
+            max_steps: Máximo de formas expandidas
+            progress: Canal donde reportar el avance (y cancelar)
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Estrategia de búsqueda desconocida '{strategy}' "
+                             f"(opciones: {', '.join(self.STRATEGIES)})")
+        self.start = start
+        self.matcher = matcher
+        self.terminals = terminals
+        self.non_contracting = non_contracting
+        self.strategy = strategy
+        self.max_steps = max_steps
+        self.progress = progress
+
+        run = '[' + ''.join(re.escape(t) for t in sorted(terminals)) + ']*'
+        self._terminal_run = re.compile(run) if terminals else None
+        self.stable_prefix, self.stable_suffix = self._stable_ends()
+
+        # Arena: forms[k], parents[k] (índice o -1), rules[k] ((left, right) o None)
+        self.forms: List[str] = []
+        self.parents: List[int] = []
+        self.rules: List[Optional[Tuple[str, str]]] = []
+        self.expanded = 0
+        self.expanded_backward = 0
+        self.elapsed = 0.0
+        self.exhausted = False
+        # Se llegó a max_steps sin encontrar la cadena: a diferencia de
+        # exhausted (espacio agotado), no demuestra el rechazo
+        self.budget_exhausted = False
+        self.frontier_peak = 0
+        # Conjuntos de formas visitadas (uno por dirección)
+        self._seen: List[object] = []
+
+    def _stable_ends(self) -> Tuple[bool, bool]:
+        """
+        El prefijo terminal de una forma es definitivo si cada regla tiene un
+        no terminal en su lado izquierdo y su lado derecho empieza con los
+        mismos terminales que el izquierdo (aB → ab): una ocurrencia que toca
+        el prefijo empieza justo en su último no terminal o antes, pero solo
+        reescribe a partir de él. Simétrico para el sufijo.
+        """
+        prefix = suffix = True
+        for left, rights in self.matcher.rewrites:
+            lead = self._run_length(left)
+            if lead == len(left):
+                # Lado izquierdo solo de terminales: puede reescribir cualquier parte
+                return False, False
+            trail = self._run_length(left[::-1])
+            for replacement, _ in rights:
+                if not replacement.startswith(left[:lead]):
+                    prefix = False
+                if not replacement.endswith(left[len(left) - trail:]):
+                    suffix = False
+        return prefix, suffix
+
+    def _run_length(self, form: str) -> int:
+        """Longitud de la secuencia de terminales al inicio de form"""
+        if self._terminal_run is None:
+            return 0
+        return self._terminal_run.match(form).end()
+
+    def run(self, target: str) -> Optional[int]:
+        """
+        Busca target desde el símbolo inicial.
+
+        Returns:
+            Índice en la arena de la forma igual a target, o None si no se
+            encontró dentro de max_steps (ver exhausted)
+        """
+        began = time.perf_counter()
+        try:
+            if any(ch not in self.terminals for ch in target):
+                # Una cadena del lenguaje solo tiene terminales
+                self.exhausted = True
+                return None
+            if self.strategy == 'bidirectional':
+                return self._bidirectional(target)
+            return self._search(target)
+        finally:
+            self.elapsed = time.perf_counter() - began
+
+    def _search(self, target: str) -> Optional[int]:
+        forms = self.forms
+        parents = self.parents
+        rules = self.rules
+        forms.append(self.start)
+        parents.append(-1)
+        rules.append(None)
+
+        n = len(target)
+        best_first = self.strategy == 'best-first'
+        max_form_length = self._max_form_length(n)
+        stable_prefix = self.stable_prefix
+        stable_suffix = self.stable_suffix
+        reversed_target = target[::-1]
+        run_length = self._run_length
+        successors = self.matcher.successors
+        progress = self.progress
+
+        depth: List[int] = [0]
+        heap: List[Tuple[int, int, int, int]] = [(0, 0, 0, 0)]
+        queue = deque([0])
+        visited = {self.start}
+        self._seen = [visited]
+        counter = 0
+        peak = 0
+
+        while heap if best_first else queue:
+            if self.expanded >= self.max_steps:
+                self.budget_exhausted = True
+                return None
+            size = len(heap) if best_first else len(queue)
+            if size > peak:
+                peak = self.frontier_peak = size
+            node = heapq.heappop(heap)[3] if best_first else queue.popleft()
+            self.expanded += 1
+            if progress is not None and not self.expanded & 255:
+                progress.report(phase="search", expanded=self.expanded,
+                                frontier=len(heap) if best_first else len(queue),
+                                generated=len(forms))
+            form = forms[node]
+            if form == target:
+                return node
+
+            # Aplicar todas las producciones en todos sus sitios
+            for new_form, left, right in successors(form):
+                if len(new_form) > max_form_length or new_form in visited:
+                    continue
+                visited.add(new_form)
+
+                # Terminales que ya coinciden en los extremos
+                head = len(commonprefix((new_form, target)))
+                reversed_form = new_form[::-1]
+                tail = len(commonprefix((reversed_form, reversed_target)))
+                if stable_prefix and head < run_length(new_form):
+                    continue
+                if stable_suffix and tail < run_length(reversed_form):
+                    continue
+
+                child = len(forms)
+                forms.append(new_form)
+                parents.append(node)
+                rules.append((left, right))
+                if best_first:
+                    d = depth[node] + 1
+                    depth.append(d)
+                    matched = min(head + tail, n, len(new_form))
+                    distance = abs(n - len(new_form)) + (n - matched)
+                    counter += 1
+                    heapq.heappush(heap, (distance, d, counter, child))
+                else:
+                    queue.append(child)
+
+        self.exhausted = True
+        return None
+
+    def _max_form_length(self, n: int) -> int:
+        if self.non_contracting:
+            return n
+        # Type 0: sin cota segura, se limita el tamaño de las formas
+        return max(n * 3 + 50, 100)
+
+    def _stable_ends_match(self, form: str, target: str) -> bool:
+        """Poda de prefijo/sufijo definitivos (ver _stable_ends)"""
+        if self.stable_prefix and len(commonprefix((form, target))) < self._run_length(form):
+            return False
+        if self.stable_suffix:
+            reversed_form = form[::-1]
+            if len(commonprefix((reversed_form, target[::-1]))) < self._run_length(reversed_form):
+                return False
+        return True
+
+    def _bidirectional(self, target: str) -> Optional[int]:
+        """
+        Anchura alternando la frontera más chica: hacia adelante desde S con
+        las producciones y hacia atrás desde target con las reducciones. Cada
+        forma nueva se busca en los visitados del otro lado; al encontrarse,
+        la cadena de reducciones se agrega a la arena hacia adelante, así que
+        la derivación se reconstruye igual que en las otras estrategias.
+        """
+        forms = self.forms
+        parents = self.parents
+        rules = self.rules
+        forms.append(self.start)
+        parents.append(-1)
+        rules.append(None)
+
+        max_form_length = self._max_form_length(len(target))
+        # Arena hacia atrás: back_rules[k] lleva back_forms[k] a back_forms[back_parents[k]]
+        back_forms: List[str] = [target]
+        back_parents: List[int] = [-1]
+        back_rules: List[Optional[Tuple[str, str]]] = [None]
+        forward: Dict[str, int] = {self.start: 0}
+        backward: Dict[str, int] = {target: 0}
+        self._seen = [forward, backward]
+        forward_queue = deque([0])
+        backward_queue = deque([0])
+        successors = self.matcher.successors
+        reductions = self.matcher.reverse().successors
+        # En Type 1 (con target no vacío: S → ε no interviene) las reducciones
+        # encuentran todas las formas que derivan target; en Type 0 la cota de
+        # longitud y las producciones ε dejan formas afuera
+        backward_complete = self.non_contracting and bool(target)
+
+        meet = forward.get(target)
+        if meet is not None:
+            return meet
+
+        peak = 0
+        while forward_queue or backward_queue:
+            if not backward_queue and backward_complete:
+                break
+            if not forward_queue and self.non_contracting:
+                # Hacia adelante ya se vio todo (incluida target, si se alcanzara)
+                break
+            if self.expanded + self.expanded_backward >= self.max_steps:
+                self.budget_exhausted = True
+                return None
+            size = len(forward_queue) + len(backward_queue)
+            if size > peak:
+                peak = self.frontier_peak = size
+            if self.progress is not None and not (self.expanded + self.expanded_backward) & 255:
+                self.progress.report(phase="search", expanded=self.expanded + self.expanded_backward,
+                                     frontier=len(forward_queue) + len(backward_queue),
+                                     generated=len(forms) + len(back_forms))
+
+            if forward_queue and (not backward_queue or len(forward_queue) <= len(backward_queue)):
+                self.expanded += 1
+                node = forward_queue.popleft()
+                for new_form, left, right in successors(forms[node]):
+                    if len(new_form) > max_form_length or new_form in forward:
+                        continue
+                    if not self._stable_ends_match(new_form, target):
+                        forward[new_form] = -1
+                        continue
+                    child = len(forms)
+                    forms.append(new_form)
+                    parents.append(node)
+                    rules.append((left, right))
+                    forward[new_form] = child
+                    other = backward.get(new_form)
+                    if other is not None:
+                        return self._join(child, other, back_forms, back_parents, back_rules)
+                    forward_queue.append(child)
+            else:
+                self.expanded_backward += 1
+                node = backward_queue.popleft()
+                for new_form, right, left in reductions(back_forms[node]):
+                    if len(new_form) > max_form_length or new_form in backward:
+                        continue
+                    if not self._stable_ends_match(new_form, target):
+                        backward[new_form] = -1
+                        continue
+                    child = len(back_forms)
+                    back_forms.append(new_form)
+                    back_parents.append(node)
+                    back_rules.append((left, right))
+                    backward[new_form] = child
+                    other = forward.get(new_form, -1)
+                    if other >= 0:
+                        return self._join(other, child, back_forms, back_parents, back_rules)
+                    backward_queue.append(child)
+
+        self.exhausted = True
+        return None
+
+    def _join(self, node: int, back: int, back_forms: List[str], back_parents: List[int],
+              back_rules: List[Optional[Tuple[str, str]]]) -> int:
+        """Continúa la arena hacia adelante desde node con las reducciones de back"""
+        forms = self.forms
+        while back_parents[back] != -1:
+            forms.append(back_forms[back_parents[back]])
+            self.parents.append(node)
+            self.rules.append(back_rules[back])
+            node = len(forms) - 1
+            back = back_parents[back]
+        return node
+
+    @property
+    def visited(self) -> int:
+        """Formas distintas vistas (en ambas direcciones)"""
+        return sum(len(seen) for seen in self._seen)
+
+    def stats(self) -> Dict[str, object]:
+        """Resumen de la última búsqueda"""
+        elapsed = self.elapsed
+        return {
+            "strategy": self.strategy,
+            "expanded": self.expanded + self.expanded_backward,
+            "expanded_backward": self.expanded_backward,
+            "generated": len(self.forms),
+            "visited": self.visited,
+            "frontier_peak": self.frontier_peak,
+            "exhausted": self.exhausted,
+            "budget_exhausted": self.budget_exhausted,
+            "seconds": elapsed,
+            "nodes_per_second": (self.expanded + self.expanded_backward) / elapsed if elapsed > 0 else 0.0
+        }
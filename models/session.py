@@ -0,0 +1,124 @@
+# models/session.py
+from typing import List, Optional, Tuple
+
+from models.earley import EarleyParser
+from models.forest import ParseForest
+
+
+class ParseSession:
+    """
+    Sesión de parseo incremental para un texto que se edita (por ejemplo, un
+    editor que valida después de cada tecla).
+
+    Type 2: conserva las columnas del chart de Earley; una edición en la
+    posición k solo recalcula las columnas desde k (EarleyParser.reparse).
+    Type 3: guarda el estado del autómata (DFA mínimo o NFA bit-paralelo)
+    después de cada prefijo y retoma desde el estado de la posición k.
+
+    Agregar caracteres al final cuesta O(1) columnas por carácter, sin importar
+    el largo del texto.
+    """
+
+    def __init__(self, grammar, text: str = ''):
+        """
+        Args:
+            grammar: Gramática Type 2 o Type 3
+            text: Texto inicial
+        """
+        if grammar.type < 2:
+            raise ValueError("Las sesiones incrementales requieren una gramática Type 2 o Type 3")
+        self.grammar = grammar
+        self._text = ''
+        # Columnas (Type 2) o estados (Type 3) recalculados por la última edición
+        self.recomputed = 0
+
+        self._parser: Optional[EarleyParser] = None
+        if grammar.type == 3:
+            self._automaton = grammar._type3_automaton()
+            # states[i] = estado después de leer text[:i] (None = sin continuación)
+            self._states: List = [self._automaton.start]
+        else:
+            self._compiled = grammar._earley_grammar()
+            self._parser = EarleyParser(self._compiled, build_forest=True)
+            self._tokens: List[int] = []
+            self._accepted, self._chart = self._parser.parse([])
+        self._apply(0, text)
+
+    @property
+    def text(self) -> str:
+        """Texto actual de la sesión"""
+        return self._text
+
+    def edit(self, start: int, end: int, replacement: str = '') -> bool:
+        """
+        Reemplaza text[start:end] por replacement y vuelve a validar.
+
+        Returns:
+            True si el texto resultante pertenece al lenguaje
+        """
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(f"Rango de edición inválido: [{start}, {end}) en un texto de "
+                             f"{len(self._text)} caracteres")
+        return self._apply(start, self._text[:start] + replacement + self._text[end:])
+
+    def append(self, chunk: str) -> bool:
+        """Agrega texto al final (el caso de escribir carácter por carácter)"""
+        end = len(self._text)
+        return self.edit(end, end, chunk)
+
+    def set_text(self, text: str) -> bool:
+        """Reemplaza todo el texto; se reutiliza el prefijo común con el anterior"""
+        old = self._text
+        common = 0
+        limit = min(len(old), len(text))
+        while common < limit and old[common] == text[common]:
+            common += 1
+        return self._apply(common, text)
+
+    def accepts(self) -> bool:
+        """Verifica si el texto actual pertenece al lenguaje"""
+        if self._parser is None:
+            state = self._states[-1]
+            return state is not None and self._automaton.is_final(state)
+        return self._accepted
+
+    def parse(self) -> Tuple[bool, Optional[dict]]:
+        """
+        Resultado completo del texto actual, como Grammar.parse, sin volver a
+        parsear. El árbol se extrae del chart de la sesión (una edición
+        posterior lo invalida).
+        """
+        if self._parser is None:
+            if not self.accepts():
+                return False, None
+            return True, self.grammar._type3_tree(self._text)
+        parser = self._parser
+        forest = ParseForest(self._compiled, parser.chart, parser.links, self._tokens,
+                             parser.leo_items)
+        return self.grammar._earley_info(self._text, self._accepted, self._chart, forest)
+
+    def _apply(self, start: int, text: str) -> bool:
+        """Actualiza la sesión a text, sabiendo que text[:start] no cambió"""
+        self._text = text
+        if self._parser is None:
+            states = self._states
+            del states[start + 1:]
+            state = states[start]
+            step = self._automaton.step
+            for i in range(start, len(text)):
+                if state is None:
+                    # Sin continuación: el resto de los prefijos tampoco la tiene
+                    states.extend([None] * (len(text) - i))
+                    break
+                state = step(state, text[i])
+                states.append(state)
+            self.recomputed = len(text) - start
+            return self.accepts()
+
+        parser = self._parser
+        keep = min(start, parser.closed)
+        tokens = self._tokens[:start] + self._compiled.encode(text[start:])
+        self._accepted, self._chart = parser.reparse(tokens, start)
+        self._tokens = tokens
+        self.recomputed = parser.closed - keep
+        return self._accepted
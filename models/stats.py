@@ -0,0 +1,146 @@
+# models/stats.py
+from typing import Any, Callable, Dict, Optional
+
+
+def result_outcome(accepted: bool, info: Optional[dict]) -> str:
+    """
+    'accepted', 'rejected' o 'budget_exhausted' para un resultado de
+    parse(): el último si la búsqueda de Type 0/1 llegó a max_steps sin
+    encontrar la cadena (info["search"]), lo que no demuestra el rechazo.
+    """
+    if accepted:
+        return 'accepted'
+    if info and info.get('search', {}).get('budget_exhausted'):
+        return 'budget_exhausted'
+    return 'rejected'
+
+
+class ParseStats:
+    """
+    Contadores de uno o más parses. Cada motor llena los suyos:
+
+      - búsqueda (Type 0/1): expanded (formas expandidas), frontier_peak
+        (frontera más grande), visited (formas vistas);
+      - Earley: predicted, scanned, completed (items del chart según cómo
+        entraron), items (total) y frontier_peak (columna más grande);
+      - CYK: cells (celdas no vacías de la tabla);
+      - autómatas (Type 3): transitions (símbolos leídos).
+
+    phases acumula los segundos de cada fase ('automaton', 'earley', 'cyk',
+    'search', 'tree'); seconds es el total de la llamada. Cada llamada
+    termina como exactamente una de accepted, rejected o budget_exhausted:
+    esta última cuando la búsqueda llegó a su máximo de pasos sin encontrar
+    la cadena (no es un rechazo demostrado). Las respuestas de la caché
+    cuentan en cache_hits y no tienen contadores de motor, pero sí su
+    resultado (un corte por max_steps se guarda como tal).
+
+    Los contadores se suman con merge(), así que el mismo objeto sirve
+    para una llamada o para el total de muchas.
+    """
+
+    # Contadores que se suman (frontier_peak se combina con max)
+    COUNTERS = ('calls', 'accepted', 'rejected', 'budget_exhausted', 'cache_hits',
+                'expanded', 'visited', 'predicted', 'scanned', 'completed',
+                'items', 'cells', 'transitions')
+
+    def __init__(self):
+        self.calls = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.budget_exhausted = 0
+        self.cache_hits = 0
+        self.expanded = 0
+        self.visited = 0
+        self.predicted = 0
+        self.scanned = 0
+        self.completed = 0
+        self.items = 0
+        self.cells = 0
+        self.transitions = 0
+        self.frontier_peak = 0
+        # Llamadas por motor ('dfa', 'nfa', 'earley', 'cyk', 'best-first', ...)
+        self.engines: Dict[str, int] = {}
+        self.phases: Dict[str, float] = {}
+        self.seconds = 0.0
+
+    @property
+    def outcome(self) -> Optional[str]:
+        """'accepted', 'rejected' o 'budget_exhausted' si cubre una sola llamada"""
+        if self.calls != 1:
+            return None
+        if self.accepted:
+            return 'accepted'
+        return 'budget_exhausted' if self.budget_exhausted else 'rejected'
+
+    def use(self, engine: str):
+        """Registra el motor que atendió la llamada"""
+        self.engines[engine] = self.engines.get(engine, 0) + 1
+
+    def add_phase(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def merge(self, other: 'ParseStats') -> 'ParseStats':
+        """Suma los contadores de other a este objeto"""
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.frontier_peak = max(self.frontier_peak, other.frontier_peak)
+        for engine, count in other.engines.items():
+            self.engines[engine] = self.engines.get(engine, 0) + count
+        for phase, seconds in other.phases.items():
+            self.add_phase(phase, seconds)
+        self.seconds += other.seconds
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Contadores como diccionario (serializable a JSON)"""
+        data = {name: getattr(self, name) for name in self.COUNTERS}
+        data["frontier_peak"] = self.frontier_peak
+        data["engines"] = dict(self.engines)
+        data["phases"] = dict(self.phases)
+        data["seconds"] = self.seconds
+        return data
+
+    def __repr__(self) -> str:
+        counters = ', '.join(f"{name}={getattr(self, name)}"
+                             for name in self.COUNTERS + ('frontier_peak',)
+                             if getattr(self, name))
+        return f"ParseStats({counters}, seconds={self.seconds:.6f})"
+
+
+class StatsCollector:
+    """
+    Total de las llamadas de una gramática (ver Grammar.enable_stats) y
+    gancho opcional que recibe el ParseStats de cada llamada, por ejemplo
+    para enviarlo a un sistema de métricas.
+
+    Al enviarse a otro proceso (parse_many con workers) no viaja nada: el
+    gancho puede no ser serializable. Cada trabajador cuenta por su lado y
+    devuelve el total de cada bloque, que se suma aquí sin pasar por el gancho.
+    """
+
+    def __init__(self, hook: Optional[Callable[[ParseStats], None]] = None):
+        """
+        Args:
+            hook: Función llamada con las estadísticas de cada parse
+        """
+        self.hook = hook
+        self.total = ParseStats()
+        self.last: Optional[ParseStats] = None
+
+    def __getstate__(self) -> dict:
+        return {}
+
+    def __setstate__(self, state: dict):
+        self.__init__()
+
+    def record(self, stats: ParseStats):
+        """Suma una llamada al total y la pasa al gancho"""
+        self.total.merge(stats)
+        self.last = stats
+        if self.hook is not None:
+            self.hook(stats)
+
+    def reset(self):
+        """Pone el total en cero (el gancho se conserva)"""
+        self.total = ParseStats()
+        self.last = None
@@ -0,0 +1,12 @@
+# tests/conftest.py
+from pathlib import Path
+
+import pytest
+
+DATA = Path(__file__).resolve().parent.parent / 'data'
+
+
+@pytest.fixture
+def data_path():
+    """Ruta de una gramática de ejemplo de data/"""
+    return lambda name: str(DATA / name)
@@ -0,0 +1,62 @@
+# tests/grammars.py
+"""Gramáticas de prueba compartidas por los módulos de tests"""
+from itertools import product
+
+from models.grammar import Grammar
+
+
+def all_strings(alphabet, max_length):
+    """Todas las cadenas sobre alphabet de longitud <= max_length, en orden shortlex"""
+    for length in range(max_length + 1):
+        for chars in product(sorted(alphabet), repeat=length):
+            yield ''.join(chars)
+
+
+def assert_valid_tree(grammar, string, tree):
+    """El árbol deriva exactamente string y solo usa producciones de la gramática"""
+    leaves = []
+    for node in tree.preorder():
+        label = tree.productions[node]
+        if label is None:
+            assert not tree.children[node]
+            leaves.append(tree.symbols[node])
+            continue
+        lhs, rhs = label.split(' → ')
+        assert tree.symbols[node] == lhs
+        assert rhs in grammar.P.get(lhs, []), label
+        kids = ''.join(tree.symbols[k] for k in tree.children[node])
+        assert kids == ('' if rhs == 'ε' else rhs), label
+    assert ''.join(leaves) == string
+
+def left_linear():
+    # b a* b a*
+    return Grammar({'S', 'A'}, {'a', 'b'}, {'S': ['Sa', 'Ab'], 'A': ['Aa', 'b']}, 'S')
+
+
+def dyck():
+    # Ambigua, con ε y recursión a ambos lados
+    return Grammar({'S'}, {'a', 'b'}, {'S': ['SS', 'aSb', 'ε']}, 'S')
+
+
+def right_recursive_nullable():
+    # Recursión por la derecha (Leo) con anulables alrededor
+    return Grammar({'S', 'A', 'B'}, {'a', 'b'},
+                   {'S': ['aSB', 'A'], 'A': ['bA', 'ε'], 'B': ['b', 'ε']}, 'S')
+
+
+def unit_chains():
+    return Grammar({'S', 'A', 'B', 'C'}, {'a', 'b', 'c'},
+                   {'S': ['A', 'aSc'], 'A': ['B', 'bA'], 'B': ['C', 'ε'], 'C': ['c', 'S']}, 'S')
+
+
+TYPE3 = {
+    'right': lambda path: Grammar.load(path('2.json')),
+    'left': lambda path: left_linear(),
+}
+
+TYPE2 = {
+    '2-2': lambda path: Grammar.load(path('2-2.json')),
+    'dyck': lambda path: dyck(),
+    'units': lambda path: unit_chains(),
+    'right-nullable': lambda path: right_recursive_nullable(),
+}
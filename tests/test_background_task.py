@@ -0,0 +1,79 @@
+# tests/test_background_task.py
+import threading
+
+import pytest
+
+pytest.importorskip('tkinter')
+
+from models.grammar import Grammar
+from models.progress import ParseCancelled, Progress
+from view.background_task import run_locked
+
+THREADS = 3
+N = 3000
+
+
+def _run_concurrently(target, threads=THREADS):
+    """Lanza target(i) en varios hilos a la vez y devuelve las excepciones"""
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def run(i):
+        barrier.wait()
+        try:
+            target(i)
+        except Exception as e:
+            errors.append(e)
+
+    pool = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return errors
+
+
+@pytest.mark.parametrize('name', ['1.json', '2-2.json'])
+def test_concurrent_generation_matches_single_thread(name, data_path):
+    path = data_path(name)
+    expected = list(Grammar.load(path).iter_generated(N))
+
+    for _ in range(10):
+        grammar = Grammar.load(path)
+        results = [[] for _ in range(THREADS)]
+
+        def work(progress, emit):
+            for s in grammar.iter_generated(N, progress=progress):
+                emit(s)
+
+        errors = _run_concurrently(
+            lambda i: run_locked(grammar.lock, work, Progress(), results[i].append))
+
+        assert errors == []
+        assert results == [expected] * THREADS
+        # La gramática queda sana para el uso posterior en un solo hilo
+        assert list(grammar.iter_generated(N)) == expected
+
+
+def test_cancel_while_waiting_skips_work(data_path):
+    grammar = Grammar.load(data_path('1.json'))
+    progress = Progress()
+    ran = []
+    errors = []
+
+    def wait():
+        try:
+            run_locked(grammar.lock, lambda p, e: ran.append(True), progress, None)
+        except ParseCancelled as e:
+            errors.append(e)
+
+    with grammar.lock:
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        waiter.join(timeout=0.1)
+        assert progress.snapshot() == {'phase': 'waiting'}
+        progress.cancel()
+    waiter.join()
+
+    assert ran == []
+    assert len(errors) == 1
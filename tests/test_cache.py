@@ -0,0 +1,90 @@
+# tests/test_cache.py
+import pytest
+
+from models.cache import ParseCache
+from models.grammar import Grammar
+from models.stats import ParseStats, result_outcome
+from tests.grammars import all_strings
+
+
+def production(grammar, left):
+    return next(p for p in grammar.productions if p.left == left)
+
+
+@pytest.mark.parametrize('accept_only', [False, True])
+def test_add_right_invalidates_cached_results(data_path, accept_only):
+    grammar = Grammar.load(data_path('2.json')).enable_cache(accept_only=accept_only)
+    before = grammar.fingerprint()
+    assert not grammar.parse('a')[0]
+    assert not grammar.accepts('a')
+    assert grammar.cache_stats()['hits'] == 1
+
+    production(grammar, 'A').add_right('ε')
+
+    assert grammar.fingerprint() != before
+    assert grammar.accepts('a')
+    assert grammar.parse('a')[0]
+    # Las entradas de la huella anterior se descartaron
+    assert grammar.cache_stats()['hits'] == 1
+    assert grammar.cache_stats()['entries'] == 1
+
+
+def test_change_discards_only_its_own_entries(data_path):
+    shared = ParseCache()
+    edited = Grammar.load(data_path('2.json')).enable_cache(cache=shared)
+    other = Grammar.load(data_path('2-2.json')).enable_cache(cache=shared)
+    for s in ['aab', 'abb', 'ab']:
+        edited.accepts(s)
+        other.accepts(s)
+    assert len(shared) == 6
+
+    production(edited, 'A').add_right('ε')
+    assert len(shared) == 3
+    assert other.accepts('ab')
+    assert shared.stats()['hits'] == 1
+
+    # Un segundo cambio descarta lo guardado bajo la huella intermedia
+    edited.accepts('a')
+    production(edited, 'A').remove_right('ε')
+    assert len(shared) == 3
+
+
+def test_remove_right_invalidates_compiled_engines(data_path):
+    grammar = Grammar.load(data_path('2-2.json')).enable_cache()
+    for engine in Grammar.ENGINES[:2]:
+        assert grammar.accepts('abba', engine=engine)
+    assert list(grammar.iter_strings(2)) == ['', 'ab', 'ba']
+
+    production(grammar, 'S').remove_right('bSaS')
+
+    for engine in Grammar.ENGINES[:2]:
+        assert not grammar.accepts('abba', engine=engine)
+        assert grammar.accepts('aabb', engine=engine)
+    assert list(grammar.iter_strings(2)) == ['', 'ab']
+
+
+def test_changes_reclassify_the_grammar(data_path):
+    grammar = Grammar.load(data_path('2.json')).enable_cache()
+    assert grammar.type == 3
+    grammar.accepts('aab')
+
+    production(grammar, 'S').add_right('aSb')
+
+    assert grammar.type == 2
+    reference = Grammar(set(grammar.symbols.nonterminals), set(grammar.symbols.terminals),
+                        {p.left: list(p.rights) for p in grammar.productions}, grammar.S)
+    for s in all_strings('ab', 6):
+        assert grammar.accepts(s) == reference.accepts(s), s
+
+
+def test_cached_budget_exhaustion_keeps_its_outcome():
+    grammar = Grammar({'S', 'B', 'C'}, {'a', 'b', 'c'},
+                      {'S': ['aSBC', 'aBC'], 'CB': ['BC'], 'aB': ['ab'],
+                       'bB': ['bb'], 'bC': ['bc'], 'cC': ['cc']}, 'S')
+    grammar.configure_search(max_steps=3).enable_cache(accept_only=True)
+
+    for _ in range(2):
+        stats = ParseStats()
+        assert not grammar.accepts('aaabbbccc', stats=stats)
+        assert stats.budget_exhausted == 1
+        assert result_outcome(*grammar.parse('aaabbbccc')) == 'budget_exhausted'
@@ -0,0 +1,75 @@
+# tests/test_cli.py
+import io
+import json
+
+import pytest
+
+from cli import build_parser, check, read_lines
+
+# Type 1: aⁿbⁿcⁿ
+ANBNCN = {
+    "nonterminals": ["S", "B", "C"],
+    "terminals": ["a", "b", "c"],
+    "productions": {"S": ["aSBC", "aBC"], "CB": ["BC"], "aB": ["ab"],
+                    "bB": ["bb"], "bC": ["bc"], "cC": ["cc"]},
+    "start_symbol": "S"
+}
+
+
+def run_check(argv, text):
+    """Ejecuta el subcomando check y devuelve (código de salida, líneas escritas)"""
+    stdout = io.StringIO()
+    code = check(build_parser().parse_args(['check'] + argv), io.StringIO(text), stdout)
+    return code, stdout.getvalue().splitlines()
+
+
+@pytest.fixture
+def anbncn(tmp_path):
+    path = tmp_path / 'anbncn.json'
+    path.write_text(json.dumps(ANBNCN), encoding='utf-8')
+    return str(path)
+
+
+def test_read_lines_conventions(tmp_path):
+    first = tmp_path / 'crlf.txt'
+    first.write_bytes('ab\r\nε\r\n\r\n a b \r\n'.encode('utf-8'))
+    second = tmp_path / 'lf.txt'
+    second.write_text('c\nεε\n', encoding='utf-8')
+    stdin = io.StringIO('from stdin\nε\n')
+
+    lines = list(read_lines([str(first), '-', str(second)], stdin))
+
+    assert lines == ['ab', '', '', ' a b ', 'from stdin', '', 'c', 'εε']
+    assert list(read_lines([], io.StringIO('x\r\ny'))) == ['x', 'y']
+
+
+def test_check_labels_and_empty_string(data_path):
+    code, lines = run_check([data_path('2-2.json')], 'ab\nε\naa\n')
+    assert code == 0
+    assert lines == ['ACCEPT\tab', 'ACCEPT\tε', 'REJECT\taa']
+
+    code, lines = run_check([data_path('2.json'), '--strict'], '\naab\n')
+    assert code == 1
+    assert lines == ['REJECT\tε', 'ACCEPT\taab']
+
+
+@pytest.mark.parametrize('options', [[], ['--cache', '8'], ['--workers', '2', '--chunksize', '1']])
+def test_check_reports_budget_exhaustion(anbncn, options):
+    text = 'abc\naaabbbccc\naabc\naaabbbccc\n'
+    code, lines = run_check([anbncn, '--max-steps', '5'] + options, text)
+    assert code == 0
+    assert lines == ['ACCEPT\tabc', 'TIMEOUT\taaabbbccc', 'REJECT\taabc', 'TIMEOUT\taaabbbccc']
+
+    code, lines = run_check([anbncn, '--max-steps', '5', '--jsonl', '--strict'] + options, text)
+    assert code == 1
+    records = [json.loads(line) for line in lines]
+    assert [r['outcome'] for r in records] == ['accepted', 'budget_exhausted',
+                                               'rejected', 'budget_exhausted']
+    assert [r['accepted'] for r in records] == [True, False, False, False]
+    assert [r['index'] for r in records] == [0, 1, 2, 3]
+
+
+def test_check_with_enough_steps_decides(anbncn):
+    code, lines = run_check([anbncn, '--strict'], 'aaabbbccc\n')
+    assert code == 0
+    assert lines == ['ACCEPT\taaabbbccc']
@@ -0,0 +1,53 @@
+# tests/test_earley.py
+import pytest
+
+from models.earley import EarleyParser
+from models.forest import ParseForest
+from models.grammar import Grammar
+from tests.grammars import all_strings, assert_valid_tree
+
+# Un anulable saltado vuelve a crear un item que Leo ya había derivado
+# (S ⇒ B ⇒ SA con A ⇒ ε): el árbol no debe seguir ese ciclo
+LEO_CYCLE = [
+    {'S': ['B'], 'A': ['b', 'ε'], 'B': ['SA', 'SS', 'aA']},
+    {'S': ['A', 'B', 'ε'], 'A': ['b', 'ε'], 'B': ['SA']},
+    {'S': ['A', 'ε'], 'A': ['SB', 'ε'], 'B': ['aA', 'ε']},
+    {'S': ['A', 'bb'], 'A': ['SB', 'b'], 'B': ['a', 'ε']},
+]
+
+
+def build(productions):
+    return Grammar({'S', 'A', 'B'}, {'a', 'b'}, productions, 'S')
+
+
+@pytest.mark.parametrize('productions', LEO_CYCLE)
+def test_leo_trees_are_acyclic(productions):
+    grammar = build(productions)
+    for s in all_strings('ab', 5):
+        accepted, info = grammar.parse(s)
+        assert accepted == grammar.accepts(s, engine='cyk'), s
+        if accepted:
+            assert_valid_tree(grammar, s, info['tree'])
+
+
+@pytest.mark.parametrize('leo', [True, False])
+@pytest.mark.parametrize('lookahead', [True, False])
+def test_forest_tree_with_and_without_leo(leo, lookahead):
+    grammar = build(LEO_CYCLE[0])
+    compiled = grammar.get_compiled()
+    tokens = compiled.encode('abb')
+    parser = EarleyParser(compiled, build_forest=True, leo=leo, lookahead=lookahead)
+    accepted, chart = parser.parse(tokens)
+    assert accepted
+    forest = ParseForest(compiled, chart, parser.links, tokens, parser.leo_items)
+    assert_valid_tree(grammar, 'abb', forest.tree())
+
+
+def test_session_trees_with_leo():
+    grammar = build(LEO_CYCLE[0])
+    session = grammar.session('a')
+    for chunk in 'bbab':
+        assert session.append(chunk)
+        accepted, info = session.parse()
+        assert accepted
+        assert_valid_tree(grammar, session.text, info['tree'])
@@ -0,0 +1,109 @@
+# tests/test_engines.py
+import random
+
+import pytest
+
+from models.grammar import Grammar
+from tests.grammars import TYPE2, TYPE3, all_strings, assert_valid_tree
+
+
+@pytest.mark.parametrize('name', sorted(TYPE3))
+def test_type3_engines_agree(name, data_path):
+    grammar = TYPE3[name](data_path)
+    assert grammar.type == 3
+    dfa = grammar.get_dfa()
+    bit_nfa = grammar.get_bit_nfa()
+    accepted = 0
+    for s in all_strings(grammar.symbols.terminals, 8):
+        expected = grammar.accepts(s, engine='earley')
+        assert dfa.accepts(s) == expected, s
+        assert bit_nfa.accepts(s) == expected, s
+        assert grammar.accepts(s) == expected, s
+        assert grammar.parse(s)[0] == expected, s
+        accepted += expected
+    assert accepted
+
+
+def test_type3_falls_back_to_bit_nfa(data_path):
+    grammar = Grammar.load(data_path('2.json'))
+    reference = Grammar.load(data_path('2.json'))
+    grammar.DFA_STATE_LIMIT = 1
+    for s in all_strings('ab', 7):
+        assert grammar.accepts(s) == reference.accepts(s), s
+    assert grammar._dfa is None and grammar._dfa_too_large
+
+
+@pytest.mark.parametrize('name', sorted(TYPE2))
+def test_cyk_agrees_with_earley(name, data_path):
+    grammar = TYPE2[name](data_path)
+    assert grammar.type == 2
+    accepted = 0
+    for s in all_strings(grammar.symbols.terminals, 7):
+        expected = grammar.accepts(s, engine='earley')
+        assert grammar.accepts(s, engine='cyk') == expected, s
+        for engine in (None, 'cyk'):
+            result, info = grammar.parse(s, engine=engine)
+            assert result == expected, (s, engine)
+            if result:
+                assert_valid_tree(grammar, s, info['tree'])
+        accepted += expected
+    assert accepted
+
+
+def test_cyk_memo_stays_bounded(data_path):
+    grammar = Grammar.load(data_path('1.json'))
+    reference = Grammar.load(data_path('1.json'))
+    cnf = grammar.get_cnf()
+    cnf.COMBINE_MEMO_LIMIT = 8
+    for s in ['a1b2c3d4', 'Zz9yY8xX', 'q', 'abc', '1abc', 'h4ck3r5']:
+        assert grammar.accepts(s, engine='cyk') == reference.accepts(s), s
+        assert len(cnf._combined) <= 8
+
+
+def test_cyk_agrees_with_earley_on_large_alphabet(data_path):
+    grammar = Grammar.load(data_path('1.json'))
+    for s in ['', 'a', 'a1', '1a', 'ab12', 'Zz9', 'x_', 'S', '9']:
+        assert grammar.accepts(s, engine='cyk') == grammar.accepts(s, engine='earley'), s
+
+
+def test_normalized_earley_agrees(data_path):
+    for build in TYPE2.values():
+        grammar = build(data_path)
+        normalized = build(data_path).normalize()
+        for s in all_strings(grammar.symbols.terminals, 6):
+            accepted, info = normalized.parse(s)
+            assert accepted == grammar.accepts(s), s
+            if accepted:
+                # Los árboles se expresan con las producciones originales
+                assert_valid_tree(grammar, s, info['tree'])
+
+
+def random_grammar(rng):
+    """
+    Gramática al azar sobre {a, b}: de una a tres alternativas por no
+    terminal, de hasta dos símbolos. Salen reglas ε, cadenas unitarias y
+    recursión por la derecha (aS, BA...), que es donde actúa Leo.
+    """
+    nonterminals = ['S', 'A', 'B']
+    symbols = nonterminals + ['a', 'b']
+    productions = {}
+    for nt in nonterminals:
+        rights = set()
+        for _ in range(rng.randint(1, 3)):
+            rights.add(''.join(rng.choice(symbols) for _ in range(rng.randint(0, 2))) or 'ε')
+        productions[nt] = sorted(rights)
+    return Grammar(set(nonterminals), {'a', 'b'}, productions, 'S')
+
+
+@pytest.mark.parametrize('seed', range(0, 300, 10))
+def test_random_grammars_build_valid_trees(seed):
+    for rng in map(random.Random, range(seed, seed + 10)):
+        for _ in range(10):
+            grammar = random_grammar(rng)
+            if grammar.type != 2:
+                continue
+            for s in all_strings('ab', 4):
+                accepted, info = grammar.parse(s)
+                assert accepted == grammar.accepts(s, engine='cyk'), (grammar.P, s)
+                if accepted:
+                    assert_valid_tree(grammar, s, info['tree'])
@@ -0,0 +1,74 @@
+# tests/test_enumerator.py
+import pytest
+
+import models.enumerator as enumerator
+from models.grammar import Grammar
+from tests.grammars import TYPE2, TYPE3, all_strings
+
+MAX_LENGTH = 7
+GRAMMARS = {**TYPE2, **TYPE3}
+
+
+def brute_force(grammar, max_length):
+    """El lenguaje hasta max_length filtrando todas las cadenas con Earley"""
+    return [s for s in all_strings(grammar.symbols.terminals, max_length)
+            if grammar.accepts(s, engine='earley')]
+
+
+@pytest.mark.parametrize('name', sorted(GRAMMARS))
+def test_iter_strings_matches_brute_force(name, data_path):
+    grammar = GRAMMARS[name](data_path)
+    assert list(grammar.iter_strings(MAX_LENGTH)) == brute_force(grammar, MAX_LENGTH)
+
+
+@pytest.mark.parametrize('name', sorted(GRAMMARS))
+def test_generate_strings_is_shortlex_prefix(name, data_path):
+    grammar = GRAMMARS[name](data_path)
+    expected = ['ε' if not s else s for s in brute_force(grammar, MAX_LENGTH)][:10]
+    assert grammar.generate_strings(10, max_length=MAX_LENGTH) == expected
+
+
+@pytest.mark.parametrize('name', sorted(TYPE3))
+def test_type3_counts_are_exact(name, data_path):
+    grammar = TYPE3[name](data_path)
+    language = brute_force(grammar, MAX_LENGTH)
+    for length in range(MAX_LENGTH + 1):
+        assert grammar.count_strings(length) == sum(len(s) == length for s in language)
+
+
+def test_finite_language_terminates():
+    grammar = Grammar({'S', 'A'}, {'a', 'b'}, {'S': ['aA', 'b'], 'A': ['a', 'b', 'ε']}, 'S')
+    assert list(grammar.iter_strings()) == ['a', 'b', 'aa', 'ab']
+
+
+def test_samples_have_the_requested_length(data_path):
+    grammar = Grammar.load(data_path('2-2.json'))
+    language = set(brute_force(grammar, 6))
+    samples = grammar.sample(6, k=50, seed=1)
+    assert len(samples) == 50
+    assert all(s in language and len(s) == 6 for s in samples)
+    assert samples == grammar.sample(6, k=50, seed=1)
+    with pytest.raises(ValueError):
+        grammar.sample(5)
+
+
+@pytest.mark.parametrize('name', sorted(TYPE2))
+def test_failed_pass_does_not_truncate_cache(name, data_path, monkeypatch):
+    grammar = GRAMMARS[name](data_path)
+    expected = list(GRAMMARS[name](data_path).iter_strings(MAX_LENGTH))
+
+    product = enumerator._product
+    calls = []
+
+    def failing(parts, i=0):
+        calls.append(i)
+        if len(calls) == 20:
+            raise RuntimeError("fallo simulado")
+        return product(parts, i)
+
+    monkeypatch.setattr(enumerator, '_product', failing)
+    with pytest.raises(RuntimeError):
+        list(grammar.iter_strings(MAX_LENGTH))
+    monkeypatch.setattr(enumerator, '_product', product)
+
+    assert list(grammar.iter_strings(MAX_LENGTH)) == expected
@@ -0,0 +1,162 @@
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from models.progress import Progress
+
+
+def run_locked(lock, work, progress, emit):
+    """
+    Ejecuta work(progress, emit) con el lock tomado (si hay uno). Mientras
+    espera lo informa en progress; si se canceló durante la espera, no
+    llega a ejecutar work.
+
+    Raises:
+        ParseCancelled: Si se canceló a través de progress
+    """
+    if lock is None:
+        return work(progress, emit)
+    if not lock.acquire(blocking=False):
+        progress.report(phase='waiting')
+        lock.acquire()
+    try:
+        progress.report(phase='running')
+        return work(progress, emit)
+    finally:
+        lock.release()
+
+
+class BackgroundTask(ttk.Frame):
+    """
+    Ejecuta una operación larga (parse, generación) en un hilo aparte para
+    que la ventana siga respondiendo. Muestra el avance que la operación
+    publica en su Progress y un botón para cancelarla.
+
+    work(progress, emit) corre en el hilo; emit(x) entrega resultados
+    parciales. Tk solo se toca desde el hilo principal: lo emitido y el
+    resultado pasan por una cola que se revisa con after().
+
+    Si se pasa un lock (típicamente grammar.lock), work corre con ese lock
+    tomado: las ventanas no son modales y dos operaciones sobre la misma
+    gramática compartirían sus tablas perezosas. La segunda espera su turno.
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, parent, work, on_items=None, on_done=None, lock=None):
+        """
+        Args:
+            parent: Widget contenedor
+            work: Función work(progress, emit) -> resultado
+            on_items: Recibe la lista de resultados parciales nuevos
+            on_done: Recibe (resultado, error); error es la excepción o None
+            lock: Lock que se toma mientras corre work (opcional)
+        """
+        super().__init__(parent)
+        self.on_items = on_items
+        self.on_done = on_done
+        self.lock = lock
+        self.progress = Progress()
+        self.finished = False
+        self._queue = queue.Queue()
+        self._started = time.perf_counter()
+
+        self.columnconfigure(0, weight=1)
+        self.bar = ttk.Progressbar(self, mode='indeterminate')
+        self.bar.grid(row=0, column=0, sticky="ew")
+        self.cancel_button = ttk.Button(self, text="Cancelar", command=self.cancel)
+        self.cancel_button.grid(row=0, column=1, padx=(10, 0))
+        self.status = ttk.Label(self, text="Iniciando...", font=('Arial', 9))
+        self.status.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        self.bar.start(15)
+
+        thread = threading.Thread(target=self._run, args=(work,), daemon=True)
+        thread.start()
+        self._after_id = self.after(self.POLL_MS, self._poll)
+
+    def _run(self, work):
+        try:
+            result = run_locked(self.lock, work, self.progress,
+                                lambda item: self._queue.put(('item', item)))
+        except Exception as e:
+            self._queue.put(('error', e))
+        else:
+            self._queue.put(('done', result))
+
+    def cancel(self):
+        """Pide detener la operación (se detiene en su próximo reporte)"""
+        if not self.finished:
+            self.progress.cancel()
+            self.cancel_button.config(state='disabled')
+            self.status.config(text="Cancelando...")
+
+    def _poll(self):
+        items = []
+        outcome = None
+        try:
+            while outcome is None:
+                kind, value = self._queue.get_nowait()
+                if kind == 'item':
+                    items.append(value)
+                else:
+                    outcome = (kind, value)
+        except queue.Empty:
+            pass
+
+        if items and self.on_items:
+            self.on_items(items)
+        if outcome is None:
+            self._show(self.progress.snapshot())
+            self._after_id = self.after(self.POLL_MS, self._poll)
+            return
+
+        self.finished = True
+        self._after_id = None
+        self.bar.stop()
+        self.cancel_button.config(state='disabled')
+        kind, value = outcome
+        elapsed = time.perf_counter() - self._started
+        self.status.config(text=f"Terminado en {elapsed:.2f} s" if kind == 'done'
+                           else f"Detenido después de {elapsed:.2f} s")
+        if self.on_done:
+            if kind == 'done':
+                self.on_done(value, None)
+            else:
+                self.on_done(None, value)
+
+    def _show(self, counters):
+        """Actualiza la barra y la etiqueta con el último reporte"""
+        if self.progress.cancelled or not counters:
+            return
+        phase = counters.get('phase')
+        if phase == 'waiting':
+            text = "En espera de otra operación sobre la gramática..."
+        elif phase == 'running':
+            text = "En curso..."
+        elif phase == 'earley':
+            if str(self.bar.cget('mode')) != 'determinate':
+                self.bar.stop()
+                self.bar.config(mode='determinate', maximum=counters['columns'])
+            self.bar.config(value=counters['column'])
+            text = (f"Earley: columna {counters['column']} de {counters['columns'] - 1} "
+                    f"({counters['items']} estados)")
+        elif phase == 'search':
+            text = (f"Búsqueda: {counters['expanded']} formas expandidas, "
+                    f"frontera {counters['frontier']}, {counters['generated']} generadas")
+        elif phase == 'generate':
+            text = f"Generación: {counters['generated']} cadenas"
+            if 'expanded' in counters:
+                text += f", {counters['expanded']} formas expandidas, frontera {counters['frontier']}"
+        else:
+            text = ", ".join(f"{k}: {v}" for k, v in counters.items())
+        self.status.config(text=text)
+
+    def destroy(self):
+        # Cerrar la ventana también detiene la operación
+        self.progress.cancel()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
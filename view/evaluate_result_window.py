@@ -1,5 +1,11 @@
+import os
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from itertools import chain
+from tkinter import ttk, filedialog, messagebox
+
+from models.progress import ParseCancelled
+from view.background_task import BackgroundTask
+from view.paged_text import PagedText
 
 
 class EvaluateResultWindow:
@@ -28,7 +34,8 @@ class EvaluateResultWindow:
                                  font=('Arial', 10))
         cadena_label.grid(row=1, column=0, pady=(0, 10))
 
-        text_area = scrolledtext.ScrolledText(
+        # Solo la página visible de la derivación está en el widget
+        text_area = PagedText(
             main_frame,
             wrap=tk.WORD,
             font=('Courier', 10),
@@ -36,30 +43,75 @@ class EvaluateResultWindow:
             fg='#000000'
         )
         text_area.grid(row=2, column=0, sticky="nsew")
+        text_area.text.config(state='disabled')
+        self.text_area = text_area
+        self.grammar = grammar
+        self.info = None
 
-        text_area.insert(tk.END, "═" * 60 + "\n")
-        text_area.insert(tk.END, "Analizando...\n\n")
+        text_area.set_lines(["═" * 60, "Analizando..."])
 
-        try:
-            accepted, tree = grammar.parse(string)
+        # El parse corre en otro hilo: la ventana sigue respondiendo y se puede cancelar
+        self.task = BackgroundTask(
+            main_frame,
+            lambda progress, emit: grammar.parse(string, progress=progress),
+            on_done=self.show_result,
+            lock=grammar.lock)
+        self.task.grid(row=3, column=0, sticky="ew", pady=(10, 0))
 
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, pady=(10, 0))
+        self.export_button = ttk.Button(button_frame, text="Exportar árbol...",
+                                        command=self.export_tree, state='disabled')
+        self.export_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cerrar", command=self.window.destroy).pack(
+            side=tk.LEFT, padx=5)
+
+    def show_result(self, result, error):
+        """Muestra el resultado del parse (se llama en el hilo de Tk)"""
+        header = ["═" * 60, "Analizando...", ""]
+        if isinstance(error, ParseCancelled):
+            body = ["✗ Análisis cancelado"]
+        elif error is not None:
+            body = [f"✗ Error durante el análisis: {error}"]
+        else:
+            accepted, tree = result
             if accepted:
-                text_area.insert(tk.END, "✓ CADENA ACEPTADA\n\n")
-                text_area.insert(tk.END, "Árbol de derivación:\n")
-                text_area.insert(tk.END, "-" * 60 + "\n")
-                text_area.insert(tk.END, grammar.visualize_tree(tree))
+                self.info = tree
+                self.export_button.config(state='normal')
+                # Las líneas de la derivación se generan a medida que se pagina
+                body = chain(["✓ CADENA ACEPTADA", "", "Árbol de derivación:", "-" * 60],
+                             self.grammar.render_tree(tree))
+            elif tree and tree.get('search', {}).get('budget_exhausted'):
+                # La búsqueda se cortó: no es un rechazo demostrado
+                search = tree['search']
+                body = ["✗ SIN RESPUESTA", "",
+                        f"La búsqueda llegó al máximo de {search['expanded']} formas "
+                        f"expandidas sin encontrar la cadena.",
+                        "Puede pertenecer al lenguaje: aumente el máximo de pasos."]
             else:
-                text_area.insert(tk.END, "✗ CADENA RECHAZADA\n\n")
-                text_area.insert(tk.END,
-                                 "La cadena no pertenece al lenguaje generado por la gramática.\n")
-        except Exception as e:
-            text_area.insert(tk.END, f"✗ Error durante el análisis: {e}\n")
+                body = ["✗ CADENA RECHAZADA", "",
+                        "La cadena no pertenece al lenguaje generado por la gramática."]
 
-        text_area.insert(tk.END, "═" * 60)
-        text_area.config(state='disabled')
+        self.text_area.set_lines(chain(header, body, ["═" * 60]))
 
-        ttk.Button(main_frame, text="Cerrar", command=self.window.destroy).grid(
-            row=3, column=0, pady=(10, 0))
+    def export_tree(self):
+        """Guarda el árbol (o los pasos, en Type 0/1) de la cadena aceptada"""
+        filetypes = [("Derivación paso a paso", "*.txt")]
+        if self.grammar.type >= 2:
+            filetypes[:0] = [("Árbol (S-expresión)", "*.tree"), ("Nodos (TSV)", "*.tsv")]
+        filename = filedialog.asksaveasfilename(
+            parent=self.window, title="Exportar árbol de derivación",
+            defaultextension=filetypes[0][1][1:], filetypes=filetypes)
+        if not filename:
+            return
+        extension = os.path.splitext(filename)[1].lower()
+        fmt = {'.tsv': 'tsv', '.txt': 'steps'}.get(extension, 'sexpr')
+        if self.grammar.type < 2:
+            fmt = 'steps'
+        try:
+            self.grammar.export_tree(self.info, filename, fmt)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo exportar: {e}", parent=self.window)
 
     def center_window(self, window, width, height):
         window.update_idletasks()
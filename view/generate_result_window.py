@@ -1,9 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 
+from models.progress import ParseCancelled
+from view.background_task import BackgroundTask
+
 
 class GenerateResultWindow:
     def __init__(self, parent, grammar, n):
+        self.grammar = grammar
         self.window = tk.Toplevel(parent)
         self.window.title("Cadenas Generadas")
         self.window.geometry("550x500")
@@ -31,30 +35,71 @@ class GenerateResultWindow:
             fg='#000000'
         )
         text_area.grid(row=1, column=0, sticky="nsew")
+        self.text_area = text_area
+        self.strings = []
 
         text_area.insert(tk.END, "╔" + "═" * 58 + "╗\n")
         text_area.insert(tk.END, f"Generando las {n} cadenas más cortas del lenguaje...\n\n")
+        # Las cadenas se agregan a partir de esta marca a medida que llegan
+        text_area.mark_set('strings', tk.END)
+        text_area.mark_gravity('strings', tk.LEFT)
+        text_area.config(state='disabled')
 
-        try:
-            strings = grammar.generate_strings(n)
-            text_area.insert(tk.END, f"Cadenas generadas ({len(strings)}):\n\n")
-            for i, s in enumerate(strings, 1):
-                # FIX: Mostrar mejor la cadena vacía
-                if s == 'ε' or s == '':
-                    display = 'ε (cadena vacía)'
-                    length = 0
-                else:
-                    display = f"'{s}'"
-                    length = len(s)
-                text_area.insert(tk.END, f"  {i:2d}. {display:<30} longitud: {length}\n")
-        except Exception as e:
-            text_area.insert(tk.END, f"✗ Error al generar cadenas: {e}\n")
+        def work(progress, emit):
+            for s in grammar.iter_generated(n, progress=progress):
+                emit(s)
 
-        text_area.insert(tk.END, "\n" + "╚" + "═" * 58 + "╝")
-        text_area.config(state='disabled')
+        self.task = BackgroundTask(main_frame, work, on_items=self.add_strings,
+                                   on_done=self.show_summary,
+                                   lock=grammar.lock)
+        self.task.grid(row=2, column=0, sticky="ew", pady=(10, 0))
 
         ttk.Button(main_frame, text="Cerrar", command=self.window.destroy).grid(
-            row=2, column=0, pady=(10, 0))
+            row=3, column=0, pady=(10, 0))
+
+    @staticmethod
+    def format_string(i, s):
+        # FIX: Mostrar mejor la cadena vacía
+        if s == 'ε' or s == '':
+            display = 'ε (cadena vacía)'
+            length = 0
+        else:
+            display = f"'{s}'"
+            length = len(s)
+        return f"  {i:2d}. {display:<30} longitud: {length}\n"
+
+    def add_strings(self, strings):
+        """Agrega las cadenas recién generadas (se llama en el hilo de Tk)"""
+        first = len(self.strings) + 1
+        self.strings.extend(strings)
+        lines = ''.join(self.format_string(i, s) for i, s in enumerate(strings, first))
+        self.text_area.config(state='normal')
+        self.text_area.insert(tk.END, lines)
+        self.text_area.config(state='disabled')
+        self.text_area.see(tk.END)
+
+    def show_summary(self, result, error):
+        """Cierra la lista al terminar la generación"""
+        text_area = self.text_area
+        text_area.config(state='normal')
+        strings = self.strings
+        if self.grammar.type == 0 and error is None:
+            # Type 0: una regla que contrae puede dar después una cadena más corta
+            # ('ε' es la cadena vacía: va primero)
+            ordered = sorted(strings, key=lambda x: (0, '') if x == 'ε' else (len(x), x))
+            if ordered != strings:
+                text_area.delete('strings', tk.END)
+                text_area.insert(tk.END, ''.join(self.format_string(i, s)
+                                                 for i, s in enumerate(ordered, 1)))
+        text_area.insert('strings', f"Cadenas generadas ({len(strings)}):\n\n")
+
+        if isinstance(error, ParseCancelled):
+            text_area.insert(tk.END, "\n✗ Generación cancelada\n")
+        elif error is not None:
+            text_area.insert(tk.END, f"✗ Error al generar cadenas: {error}\n")
+
+        text_area.insert(tk.END, "\n" + "╚" + "═" * 58 + "╝")
+        text_area.config(state='disabled')
 
     def center_window(self, window, width, height):
         window.update_idletasks()
@@ -0,0 +1,92 @@
+import tkinter as tk
+from itertools import islice
+from tkinter import ttk, scrolledtext
+
+
+class PagedText(ttk.Frame):
+    """
+    Área de texto que muestra una secuencia de líneas por páginas.
+
+    Las líneas se toman de un iterable recién cuando una página las necesita
+    y el widget solo contiene la página visible, así que una derivación de
+    cientos de miles de pasos no se inserta de una vez en Tk.
+    """
+
+    def __init__(self, parent, page_size=500, **text_options):
+        """
+        Args:
+            parent: Widget contenedor
+            page_size: Líneas por página
+            text_options: Opciones del ScrolledText
+        """
+        super().__init__(parent)
+        self.page_size = page_size
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.text = scrolledtext.ScrolledText(self, **text_options)
+        self.text.grid(row=0, column=0, sticky="nsew")
+
+        self.nav = ttk.Frame(self)
+        self.first_button = ttk.Button(self.nav, text="⏮", width=3, command=lambda: self.show(0))
+        self.prev_button = ttk.Button(self.nav, text="◀", width=3,
+                                      command=lambda: self.show(self.page - 1))
+        self.page_label = ttk.Label(self.nav, font=('Arial', 9))
+        self.next_button = ttk.Button(self.nav, text="▶", width=3,
+                                      command=lambda: self.show(self.page + 1))
+        self.last_button = ttk.Button(self.nav, text="⏭", width=3, command=self.show_last)
+        for column, widget in enumerate((self.first_button, self.prev_button, self.page_label,
+                                         self.next_button, self.last_button)):
+            widget.grid(row=0, column=column, padx=3)
+
+        self.set_lines([])
+
+    def set_lines(self, lines):
+        """Reemplaza el contenido y muestra la primera página"""
+        self._source = iter(lines)
+        self._lines = []
+        self._exhausted = False
+        self.show(0)
+
+    def _fill(self, count):
+        """Toma del iterable hasta tener count líneas (o agotarlo)"""
+        missing = count - len(self._lines)
+        if missing > 0 and not self._exhausted:
+            self._lines.extend(islice(self._source, missing))
+            if len(self._lines) < count:
+                self._exhausted = True
+
+    def show(self, page):
+        """Muestra la página indicada (desde 0)"""
+        size = self.page_size
+        page = max(page, 0)
+        # Una línea más para saber si hay página siguiente
+        self._fill((page + 1) * size + 1)
+        last = max((len(self._lines) - 1) // size, 0)
+        self.page = page = min(page, last)
+        start = page * size
+        visible = self._lines[start:start + size]
+
+        state = self.text.cget('state')
+        self.text.config(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert(tk.END, '\n'.join(visible))
+        self.text.config(state=state)
+        self.text.yview_moveto(0)
+
+        has_next = len(self._lines) > start + size
+        if page == 0 and not has_next:
+            self.nav.grid_remove()
+            return
+        self.nav.grid(row=1, column=0, pady=(5, 0))
+        total = f"{len(self._lines)}" if self._exhausted else f"{len(self._lines)}+"
+        self.page_label.config(text=f"Líneas {start + 1}–{start + len(visible)} de {total}")
+        for button, enabled in ((self.first_button, page > 0), (self.prev_button, page > 0),
+                                (self.next_button, has_next), (self.last_button, has_next)):
+            button.config(state='normal' if enabled else 'disabled')
+
+    def show_last(self):
+        """Lee todas las líneas y muestra la última página"""
+        self._lines.extend(self._source)
+        self._exhausted = True
+        self.show((len(self._lines) - 1) // self.page_size)
@@ -1,8 +1,11 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk
 
 
 class SyntaxTreeWindow:
+    # Hijo provisorio para que el nodo muestre la flecha de expansión
+    PLACEHOLDER = '…'
+
     def __init__(self, parent, grammar):
         self.window = tk.Toplevel(parent)
         self.window.title("Árbol de Síntesis")
@@ -17,7 +20,7 @@ class SyntaxTreeWindow:
         self.window.columnconfigure(0, weight=1)
         self.window.rowconfigure(0, weight=1)
         main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(1, weight=1)
+        main_frame.rowconfigure(2, weight=1)
 
         # Título con más información
         title = ttk.Label(main_frame, text="ÁRBOL DE SÍNTESIS DE LA GRAMÁTICA",
@@ -42,56 +45,72 @@ class SyntaxTreeWindow:
         ttk.Label(info_frame, text=f"Producciones: {total_prods}", 
                   font=('Arial', 9)).pack(side=tk.LEFT, padx=5)
 
-        # Área de texto con mejor fuente y colores
-        text_area = scrolledtext.ScrolledText(
-            main_frame,
-            wrap=tk.NONE,
-            font=('Consolas', 10),
-            bg='#f8f9fa',
-            fg='#212529',
-            padx=10,
-            pady=10,
-            relief=tk.FLAT,
-            borderwidth=2
-        )
-        text_area.grid(row=2, column=0, sticky="nsew")
+        # Índice no terminal → alternativas (una sola vez, no por nodo)
+        nonterminals = grammar.symbols.nonterminals
+        self.nonterminals = nonterminals
+        self.alternatives = {left: rights for left, rights in grammar.P.items()
+                             if left in nonterminals}
+
+        # Árbol perezoso: los hijos de un nodo se crean recién al abrirlo,
+        # así que solo existen las ramas que se expandieron
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.grid(row=2, column=0, sticky="nsew")
+        tree_frame.columnconfigure(0, weight=1)
+        tree_frame.rowconfigure(0, weight=1)
+
+        tree = ttk.Treeview(tree_frame, columns=('info',), selectmode='browse')
+        tree.heading('#0', text='Producciones', anchor=tk.W)
+        tree.heading('info', text='Detalle', anchor=tk.W)
+        tree.column('#0', width=520, stretch=True)
+        tree.column('info', width=200, stretch=False)
+        yscroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        xscroll = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=tree.xview)
+        tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        tree.grid(row=0, column=0, sticky="nsew")
+        yscroll.grid(row=0, column=1, sticky="ns")
+        xscroll.grid(row=1, column=0, sticky="ew")
+        self.tree = tree
 
         # Configurar tags para colores
-        text_area.tag_configure('header', foreground='#0d6efd', font=('Consolas', 10, 'bold'))
-        text_area.tag_configure('nonterminal', foreground='#0d6efd', font=('Consolas', 10, 'bold'))
-        text_area.tag_configure('terminal', foreground='#198754', font=('Consolas', 10))
-        text_area.tag_configure('epsilon', foreground='#6c757d', font=('Consolas', 10, 'italic'))
-        text_area.tag_configure('production', foreground='#495057')
-        text_area.tag_configure('visited', foreground='#dc3545', font=('Consolas', 10, 'italic'))
-        text_area.tag_configure('connector', foreground='#6c757d')
-
-        # Encabezado
-        text_area.insert(tk.END, "╔" + "═" * 76 + "╗\n", 'header')
-        text_area.insert(tk.END, "║ ", 'header')
-        text_area.insert(tk.END, f"{'ESTRUCTURA DE PRODUCCIONES':^74}", 'header')
-        text_area.insert(tk.END, " ║\n", 'header')
-        text_area.insert(tk.END, "╚" + "═" * 76 + "╝\n\n", 'header')
-
-        # Generar el árbol mejorado
-        self._print_syntax_tree(grammar, text_area, grammar.S, "", set(), True)
-
-        text_area.insert(tk.END, "\n\n" + "─" * 78 + "\n", 'connector')
-        text_area.insert(tk.END, "Leyenda: ", 'header')
-        text_area.insert(tk.END, "No terminal", 'nonterminal')
-        text_area.insert(tk.END, " | ", 'connector')
-        text_area.insert(tk.END, "terminal", 'terminal')
-        text_area.insert(tk.END, " | ", 'connector')
-        text_area.insert(tk.END, "ε (vacío)", 'epsilon')
-        text_area.insert(tk.END, " | ", 'connector')
-        text_area.insert(tk.END, "(ciclo)", 'visited')
-        
-        text_area.config(state='disabled')
+        tree.tag_configure('root', foreground='#0d6efd', font=('Consolas', 10, 'bold'))
+        tree.tag_configure('nonterminal', foreground='#0d6efd', font=('Consolas', 10, 'bold'))
+        tree.tag_configure('production', foreground='#495057', font=('Consolas', 10))
+        tree.tag_configure('epsilon', foreground='#6c757d', font=('Consolas', 10, 'italic'))
+        tree.tag_configure('visited', foreground='#dc3545', font=('Consolas', 10, 'italic'))
+
+        # Nodo → símbolo no terminal (para detectar ciclos subiendo por los padres)
+        # y nodo → lado derecho de la alternativa
+        self._symbol_of = {}
+        self._right_of = {}
+        # Nodos cuyos hijos todavía no se crearon
+        self._pending = set()
+        tree.bind('<<TreeviewOpen>>', self._on_open)
+
+        root = self._add_symbol('', grammar.S, root=True)
+        self._expand(root)
+        tree.item(root, open=True)
+
+        # Leyenda
+        legend = ttk.Frame(main_frame)
+        legend.grid(row=3, column=0, sticky=tk.W, pady=(8, 0))
+        ttk.Label(legend, text="Leyenda:", font=('Arial', 9, 'bold')).pack(side=tk.LEFT)
+        ttk.Label(legend, text="No terminal", font=('Arial', 9, 'bold'),
+                  foreground='#0d6efd').pack(side=tk.LEFT, padx=5)
+        ttk.Label(legend, text="producción", font=('Arial', 9),
+                  foreground='#495057').pack(side=tk.LEFT, padx=5)
+        ttk.Label(legend, text="ε (vacío)", font=('Arial', 9, 'italic'),
+                  foreground='#6c757d').pack(side=tk.LEFT, padx=5)
+        ttk.Label(legend, text="(ciclo)", font=('Arial', 9, 'italic'),
+                  foreground='#dc3545').pack(side=tk.LEFT, padx=5)
 
         # Frame de botones
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, pady=(10, 0))
+        button_frame.grid(row=4, column=0, pady=(10, 0))
         
-        ttk.Button(button_frame, text="Cerrar", command=self.window.destroy).pack()
+        ttk.Button(button_frame, text="Contraer todo", command=self._collapse_all).pack(
+            side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cerrar", command=self.window.destroy).pack(
+            side=tk.LEFT, padx=5)
 
     def center_window(self, window, width, height):
         window.update_idletasks()
@@ -101,94 +120,73 @@ class SyntaxTreeWindow:
         y = (sh - height) // 2
         window.geometry(f'{width}x{height}+{x}+{y}')
 
-    def _print_syntax_tree(self, grammar, text_area, symbol, prefix, visited, is_root=False):
-        """Versión mejorada del árbol con mejor visualización y colores"""
-        
-        # Detectar ciclos
-        if symbol in visited:
-            text_area.insert(tk.END, f"{prefix}└─ ", 'connector')
-            text_area.insert(tk.END, f"{symbol}", 'nonterminal')
-            text_area.insert(tk.END, f" (ya visitado)\n", 'visited')
-            return
+    def _add_symbol(self, parent, symbol, root=False):
+        """Agrega el nodo de un no terminal; sus alternativas se crean al abrirlo"""
+        tree = self.tree
+        rights = self.alternatives.get(symbol)
+
+        # Detectar ciclos: el símbolo ya aparece en el camino hasta la raíz
+        ancestor = parent
+        while ancestor:
+            if self._symbol_of.get(ancestor) == symbol:
+                return tree.insert(parent, tk.END, text=symbol,
+                                   values=("(ya visitado)",), tags=('visited',))
+            ancestor = tree.parent(ancestor)
+
+        if not rights:
+            return tree.insert(parent, tk.END, text=symbol,
+                               values=("(sin producciones)",), tags=('visited',))
+
+        item = tree.insert(parent, tk.END, text=f"◉ {symbol}" if root else symbol,
+                           values=("[inicio]" if root else f"({len(rights)} prod.)",),
+                           tags=('root' if root else 'nonterminal',))
+        self._symbol_of[item] = symbol
+        self._pending.add(item)
+        tree.insert(item, tk.END, text=self.PLACEHOLDER)
+        return item
+
+    def _add_alternative(self, parent, symbol, right):
+        """Agrega una alternativa; sus no terminales se crean al abrirla"""
+        tree = self.tree
+        if right == 'ε':
+            return tree.insert(parent, tk.END, text=f"{symbol} → ε",
+                               values=("(cadena vacía)",), tags=('epsilon',))
+        item = tree.insert(parent, tk.END, text=f"{symbol} → {right}", tags=('production',))
+        if any(ch in self.nonterminals for ch in right):
+            self._right_of[item] = right
+            self._pending.add(item)
+            tree.insert(item, tk.END, text=self.PLACEHOLDER)
+        else:
+            tree.item(item, values=("(solo terminales)",))
+        return item
 
-        # Símbolo terminal
-        if symbol not in grammar.symbols.nonterminals:
-            text_area.insert(tk.END, f"{prefix}└─ ", 'connector')
-            text_area.insert(tk.END, f"'{symbol}'", 'terminal')
-            text_area.insert(tk.END, f" (terminal)\n", 'connector')
-            return
+    def _on_open(self, event):
+        self._expand(self.tree.focus())
 
-        # FIX: Marcar como visitado ANTES de continuar
-        new_visited = visited.copy()
-        new_visited.add(symbol)
-
-        # Buscar producciones de este símbolo
-        productions = []
-        for prod in grammar.productions:
-            if prod.left == symbol:
-                productions.extend(prod.rights)
-                break
-
-        # Sin producciones
-        if not productions:
-            text_area.insert(tk.END, f"{prefix}└─ ", 'connector')
-            text_area.insert(tk.END, f"{symbol}", 'nonterminal')
-            text_area.insert(tk.END, f" (sin producciones)\n", 'visited')
+    def _expand(self, item):
+        """Crea los hijos de un nodo la primera vez que se abre"""
+        if item not in self._pending:
             return
-        
-        # Símbolo raíz o no terminal
-        if is_root:
-            text_area.insert(tk.END, "◉ ", 'header')
-            text_area.insert(tk.END, f"{symbol}", 'nonterminal')
-            text_area.insert(tk.END, f" [inicio]\n", 'connector')
-        else:
-            text_area.insert(tk.END, f"{prefix}├─ ", 'connector')
-            text_area.insert(tk.END, f"{symbol}", 'nonterminal')
-            text_area.insert(tk.END, f" ({len(productions)} prod.)\n", 'connector')
-
-        # Procesar cada producción
-        for i, prod in enumerate(productions):
-            is_last_prod = (i == len(productions) - 1)
-            prod_connector = "└─" if is_last_prod else "├─"
-            new_prefix = prefix + ("   " if is_last_prod else "│  ")
-
-            # Mostrar la producción
-            text_area.insert(tk.END, f"{prefix}│  {prod_connector} ", 'connector')
-            text_area.insert(tk.END, f"{symbol} → ", 'production')
-
-            # Producción vacía
-            if prod == 'ε':
-                text_area.insert(tk.END, f"ε", 'epsilon')
-                text_area.insert(tk.END, f" (cadena vacía)\n", 'connector')
-                continue
-
-            # Mostrar la producción completa
-            for char in prod:
-                if char in grammar.symbols.nonterminals:
-                    text_area.insert(tk.END, f"{char}", 'nonterminal')
-                elif char in grammar.symbols.terminals:
-                    text_area.insert(tk.END, f"{char}", 'terminal')
-                else:
-                    text_area.insert(tk.END, f"{char}", 'production')
-            
-            text_area.insert(tk.END, "\n")
-
-            # Expandir símbolos no terminales únicos en la producción
-            symbols_seen = set()
-            nonterminals_in_prod = []
-            
-            for char in prod:
-                if char in grammar.symbols.nonterminals and char not in symbols_seen:
-                    symbols_seen.add(char)
-                    nonterminals_in_prod.append(char)
-
-            # Expandir cada no terminal
-            for j, sym in enumerate(nonterminals_in_prod):
-                is_last_sym = (j == len(nonterminals_in_prod) - 1) and is_last_prod
-                
-                if not is_last_sym:
-                    text_area.insert(tk.END, f"{new_prefix}│\n", 'connector')
-                
-                symbol_prefix = new_prefix + ("   " if is_last_prod else "│  ")
-                # FIX: Usar new_visited en lugar de visited.copy()
-                self._print_syntax_tree(grammar, text_area, sym, symbol_prefix, new_visited)
\ No newline at end of file
+        self._pending.discard(item)
+        tree = self.tree
+        tree.delete(*tree.get_children(item))
+
+        symbol = self._symbol_of.get(item)
+        if symbol is not None:
+            for right in self.alternatives[symbol]:
+                self._add_alternative(item, symbol, right)
+            return
+
+        # Alternativa: cada no terminal distinto, en orden de aparición
+        right = self._right_of[item]
+        for sym in dict.fromkeys(ch for ch in right if ch in self.nonterminals):
+            self._add_symbol(item, sym)
+
+    def _collapse_all(self):
+        """Cierra todos los nodos abiertos (los ya creados se conservan)"""
+        tree = self.tree
+        stack = list(tree.get_children(''))
+        while stack:
+            item = stack.pop()
+            tree.item(item, open=False)
+            stack.extend(tree.get_children(item))